@@ -0,0 +1,82 @@
+"""
+Benchmark de billboards: shader contra setBillboardPointEye
+Ejecuta: python benchmark_billboard.py
+
+Mide el tiempo de cull con 50, 500 y 5000 sprites en ventana offscreen.
+"""
+
+import random
+import time
+
+from panda3d.core import loadPrcFileData, PythonCallbackObject
+
+loadPrcFileData('', 'window-type offscreen\naudio-library-name null\nsync-video false')
+
+from direct.showbase.ShowBase import ShowBase
+
+from src.systems.billboard import BillboardFactory
+
+
+SPRITE_COUNTS = (50, 500, 5000)
+WARMUP_FRAMES = 5
+MEASURED_FRAMES = 30
+
+
+def measure_cull(base, factory, count):
+    """Promedio de milisegundos de cull por cuadro con count sprites en escena"""
+    root = base.render.attachNewNode(f"bench_{factory.mode}_{count}")
+    random.seed(count)
+    for i in range(count):
+        sprite = factory.make_sprite('white', (-0.5, 0.5, -0.5, 0.5), root, f"sprite_{i}")
+        sprite.setPos(random.uniform(-8, 8), random.uniform(5, 200), random.uniform(0, 10))
+
+    samples = []
+
+    def cull_callback(cbdata):
+        start = time.perf_counter()
+        cbdata.upcall()
+        samples.append(time.perf_counter() - start)
+
+    region = base.camNode.getDisplayRegion(0)
+    region.setCullCallback(PythonCallbackObject(cull_callback))
+
+    for _ in range(WARMUP_FRAMES):
+        base.graphicsEngine.renderFrame()
+    samples.clear()
+    for _ in range(MEASURED_FRAMES):
+        base.graphicsEngine.renderFrame()
+
+    region.clearCullCallback()
+    root.removeNode()
+    return sum(samples) / len(samples) * 1000.0
+
+
+def run_benchmark():
+    print("=== Benchmark de Billboards ===\n")
+
+    base = ShowBase()
+    base.disableMouse()
+    base.camera.setPos(0, -10, 3)
+
+    factories = [BillboardFactory(base, mode=BillboardFactory.MODE_NODE)]
+    if factories[0].shaders_supported():
+        factories.append(BillboardFactory(base, mode=BillboardFactory.MODE_SHADER))
+    else:
+        print("GLSL no disponible: solo se mide el modo nodo\n")
+
+    results = {}
+    for factory in factories:
+        for count in SPRITE_COUNTS:
+            results[(factory.mode, count)] = measure_cull(base, factory, count)
+
+    print(f"{'Sprites':>8} | " + " | ".join(f"{f.mode:>10}" for f in factories))
+    for count in SPRITE_COUNTS:
+        row = " | ".join(f"{results[(f.mode, count)]:>7.3f} ms" for f in factories)
+        print(f"{count:>8} | {row}")
+
+    base.destroy()
+    print("\n=== Benchmark terminado ===")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -1,33 +1,87 @@
 from direct.task import Task
-from panda3d.core import Vec3, Point3, AmbientLight, DirectionalLight, CardMaker, CollisionTraverser, CollisionHandlerEvent
+from panda3d.core import Vec3, Point3, AmbientLight, DirectionalLight, CardMaker
 from direct.showbase.DirectObject import DirectObject
 from src.entities.player import Player
 from src.entities.projectile import ProjectilePool
+from src.entities.tracer import HitscanShot, TracerPool
 from src.entities.crystal import Crystal
 from src.entities.barrier import BreakableBarrier
 from src.entities.powerup import PowerUpObstacle
+from src.systems.corridor import Corridor
+from src.systems.sky import Sky
+from src.systems.lighting import LightBaker
+from src.systems.asset_cache import get_asset_cache
+from src.systems.sprite_atlas import get_sprite_atlas
+from src.systems.chunk_manager import ChunkManager
+from src.systems.billboard import get_billboard_factory
+from src.systems.ghost_renderer import GhostRenderer
+from src.systems.fx import get_fx_engine
+from src.systems.floating_origin import FloatingOrigin
+from src.systems.broadphase import CorridorBroadphase
+from src.systems.collider_registry import ColliderRegistry
+from src.systems.collision_dispatch import CollisionDispatcher
+from src.systems.dynamic_resolution import DynamicResolution
+from src.systems.motion import GhostMotion
+from src.systems.quality import get_quality_settings
+from src.systems.transparency import get_transparency_policy
+from src.systems.warmup import SceneWarmup
 
 class Game:
     def __init__(self, base):
         self.base = base
         self.speed = 10.0
-        self.cTrav = CollisionTraverser()
 
-        self.handler = CollisionHandlerEvent()
-        self.handler.addInPattern('%fn-into-%in')
-        self.handler.addInPattern('projectile-into-crystal')
-        self.handler.addInPattern('projectile-into-barrier')
-        self.handler.addInPattern('projectile-into-powerup')
-        self.handler.addInPattern('player-into-barrier')
+        # Carga texturas y modelos antes del primer frame jugable
+        self.assets = get_asset_cache(self.base)
+        self.assets.preload()
+        self.atlas = get_sprite_atlas(self.base)
+        self.billboards = get_billboard_factory(self.base)
+        # Presets de calidad: la primera vez corre un benchmark corto
+        self.quality = get_quality_settings(self.base)
+        self.quality.add_listener(self.apply_quality)
+        self.transparency = get_transparency_policy(self.base)
 
         self.setup_scene()
-        self.player = Player(self.base, self.cTrav, self.handler)
+        # Todo lo que se spawnea cuelga de chunks por tramo del eje Y
+        self.chunks = ChunkManager(self.base)
+        # Todos los fantasmas se dibujan en un solo draw call instanciado
+        self.ghosts = GhostRenderer(self.base)
+        # Datos del vaivén de los fantasmas: con instancing lo anima el shader de GhostRenderer
+        self.motion = GhostMotion(self.base, move_nodes=not self.ghosts.enabled)
+        # Fragmentos y chispas de todas las roturas en un solo pool de partículas
+        self.fx = get_fx_engine(self.base)
+        # Colisiones: cada móvil se prueba solo contra los blancos cercanos en Y
+        self.broadphase = CorridorBroadphase(self.base)
+        # Altas y bajas de colisionadores: solo el jugador y los proyectiles son móviles
+        self.colliders = ColliderRegistry(self.broadphase)
+        self.player = Player(self.base)
         self.player.set_barrier_callback(self.on_player_hit_barrier)
-        self.projectile_pool = ProjectilePool(self.base, self.cTrav, self.handler)
+        self.projectile_pool = ProjectilePool(self.base)
         self.player.set_shoot_callback(self.shoot)
+        self.colliders.add_mover(self.player.collider, self.player)
+        for proj in self.projectile_pool.pool:
+            # Cada proyectil se barre desde donde estaba al empezar su update
+            self.colliders.add_mover(proj.collider, proj, lambda proj=proj: proj.prev_pos)
+        # Los choques del frame se atienden juntos, por tipo de móvil y de blanco
+        self.dispatcher = CollisionDispatcher()
+        self.dispatcher.bind('projectile', 'crystal', self.on_projectile_hit)
+        self.dispatcher.bind('projectile', 'barrier', self.on_projectile_hit_barrier)
+        self.dispatcher.bind('projectile', 'powerup', self.on_projectile_hit_powerup)
+        self.dispatcher.bind('player', 'barrier', lambda player, barrier: player.on_hit_barrier(barrier))
+        # Modo hitscan (H en la pausa): el disparo se resuelve al instante con un rayo
+        self.hitscan = False
+        self.hitscan_range = self.projectile_pool.pool[0].speed * self.projectile_pool.pool[0].lifetime
+        self.tracers = TracerPool(self.base)
         self.crystals = []
         self.spawn_demo_crystals()
 
+        # Recentra la cámara y todo lo vivo antes de que float32 pierda precisión
+        self.origin = FloatingOrigin(self.base)
+        for rebase in (self.chunks.rebase, self.motion.rebase, self.ghosts.rebase, self.fx.rebase,
+                       self.projectile_pool.rebase, self.tracers.rebase, self.broadphase.rebase,
+                       self.rebase_spawn_cursors):
+            self.origin.add_listener(rebase)
+
         self.last_crystal_spawn_time = 0
         self.crystal_spawn_interval = 3.0
         self.crystal_spawn_y_distance = 20
@@ -45,81 +99,47 @@ class Game:
         self.game_paused = False
         self.game_over = False
 
-        self.base.accept('projectile-into-crystal', self.on_projectile_hit)
-
-        self.base.accept('projectile-into-barrier', self.on_projectile_hit_barrier)
-
-        self.base.accept('projectile-into-powerup', self.on_projectile_hit_powerup)
-
-        self.base.accept('player-into-barrier', self.player.on_hit_barrier)
-
         self.base.accept('escape', self.toggle_pause)
 
         self.load_sounds()
 
         self.base.taskMgr.add(self.update, "game-update-task")
 
+        # Escena 3D a resolución variable en los presets bajos (el HUD queda nativo)
+        self.resolution = DynamicResolution(self.base)
+        self.resolution.set_enabled(self.quality.value('dynamic_resolution'))
+
+        # Sube texturas, shaders y glifos antes del primer frame jugable
+        self.warmup_ms = SceneWarmup(self.base).run(self)
+
     def setup_scene(self):
         from panda3d.core import Vec4
         self.create_game_background()
+        self.setup_fog()
 
-        from panda3d.core import TransparencyAttrib
-        
-        self.create_sun()
-        self.clouds = []
-        self.create_clouds()
-
-        cm = CardMaker('floor')
-        cm.setFrame(-50, 50, -100, 100) 
-        self.floor = self.base.render.attachNewNode(cm.generate())
-        self.floor.setPos(0, 0, 0)
-        self.floor.setHpr(0, -90, 0)
-        self.floor.setColor(0.3, 0.3, 0.50, 1)
-        
-        self.road_lines = []
-        for i in range(-10, 120, 8):
-            line = CardMaker(f'road_line_{i}')
-            line.setFrame(-0.15, 0.15, -2, 2)
-            line_node = self.base.render.attachNewNode(line.generate())
-            line_node.setPos(0, i, 0.02)
-            line_node.setHpr(0, -90, 0)
-            line_node.setColor(1, 0.9, 0.2, 1)
-            self.road_lines.append(line_node)
-        
-        left_edge = CardMaker('left_edge')
-        left_edge.setFrame(-0.2, 0.2, -100, 100)
-        self.left_edge = self.base.render.attachNewNode(left_edge.generate())
-        self.left_edge.setPos(-6, 0, 0.02)
-        self.left_edge.setHpr(0, -90, 0)
-        self.left_edge.setColor(0.9, 0.9, 0.9, 1)
-        
-        right_edge = CardMaker('right_edge')
-        right_edge.setFrame(-0.2, 0.2, -100, 100)
-        self.right_edge = self.base.render.attachNewNode(right_edge.generate())
-        self.right_edge.setPos(6, 0, 0.02)
-        self.right_edge.setHpr(0, -90, 0)
-        self.right_edge.setColor(0.9, 0.9, 0.9, 1)
-
-        self.create_brick_wall('left')
-        self.create_brick_wall('right')
-        self.ceiling = None
+        # Sol y nubes en una capa de fondo pegada a la cámara
+        self.sky = Sky(self.base, self.quality.value('clouds'))
+
+        self.corridor = Corridor(self.base)
         
         ambient = AmbientLight("ambient")
         ambient.setColor((0.75, 0.78, 0.82, 1))
         self.ambient_np = self.base.render.attachNewNode(ambient)
-        self.base.render.setLight(self.ambient_np)
 
         dlight = DirectionalLight("dlight")
         dlight.setColor((0.9, 0.92, 0.95, 1))
         self.dlnp = self.base.render.attachNewNode(dlight)
         self.dlnp.setHpr(0, -60, 0)
-        self.base.render.setLight(self.dlnp)
 
         dlight2 = DirectionalLight("dlight2")
         dlight2.setColor((0.4, 0.42, 0.45, 1))
         self.dlnp2 = self.base.render.attachNewNode(dlight2)
         self.dlnp2.setHpr(180, -30, 0)
-        self.base.render.setLight(self.dlnp2)
+
+        # Cuántas de estas luces se encienden depende del preset de calidad
+        self.apply_lights()
+        self.light_baker = LightBaker(self.base)
+        self.apply_corridor_lighting()
 
         self.base.camera.setPos(0, -5, 2)
         self.base.camera.lookAt(0, 20, 2)
@@ -155,74 +175,77 @@ class Game:
             if os.path.exists(powerup_sound):
                 self.base.sound_manager.preload_sound('powerup', powerup_sound)
 
-    def create_brick_wall(self, side):
-        """Crea pared con textura de ladrillo simplificada"""
-        x_pos = -8 if side == 'left' else 8
-        hpr = 90 if side == 'left' else -90
-        
-        wall = CardMaker(f'{side}_wall')
-        wall.setFrame(-100, 100, 0, 10)
-        wall_node = self.base.render.attachNewNode(wall.generate())
-        wall_node.setPos(x_pos, 0, 0)
-        wall_node.setHpr(hpr, 0, 0)
-        wall_node.setColor(0.65, 0.35, 0.25, 1)
-        
-        if side == 'left':
-            self.left_wall = wall_node
-            self.left_wall_bricks = []
-        else:
-            self.right_wall = wall_node
-            self.right_wall_bricks = []
-        
-        brick_list = self.left_wall_bricks if side == 'left' else self.right_wall_bricks
-        
-        for z in range(0, 17):
-            line = CardMaker(f'{side}_joint_{z}')
-            line.setFrame(-100, 100, -0.04, 0.04)
-            line_node = self.base.render.attachNewNode(line.generate())
-            line_node.setPos(x_pos, 0, z * 0.6)
-            line_node.setHpr(hpr, 0, 0)
-            line_node.setColor(0.4, 0.3, 0.25, 1)
-            brick_list.append(line_node)
-    
-    def create_sun(self):
-        """Crea sol brillante en el cielo"""
-        from panda3d.core import TransparencyAttrib
-        sun_cm = CardMaker('sun')
-        sun_cm.setFrame(-3, 3, -3, 3)
-        self.sun = self.base.render.attachNewNode(sun_cm.generate())
-        self.sun.setPos(15, 50, 25)
-        self.sun.setColor(1, 0.95, 0.3, 1)
-        self.sun.setBillboardPointEye()
-        self.sun.setTransparency(TransparencyAttrib.MAlpha)
-    
-    def create_clouds(self):
-        """Crea nubes animadas en el cielo"""
-        import random
-        from panda3d.core import TransparencyAttrib
-        
-        for i in range(8):
-            cloud = CardMaker(f'cloud_{i}')
-            width = random.uniform(4, 7)
-            height = random.uniform(1.5, 2.5)
-            cloud.setFrame(-width/2, width/2, -height/2, height/2)
-            
-            cloud_node = self.base.render.attachNewNode(cloud.generate())
-            x_pos = random.uniform(-20, 20)
-            y_pos = random.uniform(-50, 150)
-            z_pos = random.uniform(15, 30)
-            cloud_node.setPos(x_pos, y_pos, z_pos)
-            cloud_node.setColor(1, 1, 1, 0.8)
-            cloud_node.setBillboardPointEye()
-            cloud_node.setTransparency(TransparencyAttrib.MAlpha)
-            
-            cloud_speed = random.uniform(2, 5)
-            self.clouds.append({'node': cloud_node, 'speed': cloud_speed, 'start_y': y_pos})
-    
+    def apply_lights(self):
+        """Enciende solo las luces que permite el preset (ambiente primero)"""
+        lights = [self.ambient_np, self.dlnp, self.dlnp2]
+        count = self.quality.value('lights')
+        for i, light_np in enumerate(lights):
+            if i < count:
+                self.base.render.setLight(light_np)
+            else:
+                self.base.render.clearLight(light_np)
+
+    def apply_corridor_lighting(self, rebuild=False):
+        """
+        Con 'baked_lighting' el pasillo lleva las luces actuales en los colores
+        de vértice y se dibuja sin luces. rebuild parte de la geometría sin hornear.
+        """
+        if rebuild:
+            self.corridor.cleanup()
+            self.corridor = Corridor(self.base)
+            self.corridor.update(self.base.camera.getY())
+        if self.quality.value('baked_lighting'):
+            self.light_baker.bake(self.corridor.root)
+
+    def apply_quality(self, quality):
+        """Aplica un cambio de preset sin reiniciar la partida"""
+        self.apply_lights()
+        self.apply_corridor_lighting(rebuild=True)
+
+        self.sky.set_cloud_count(quality.value('clouds'))
+        self.resolution.set_enabled(quality.value('dynamic_resolution'))
+
+        if self.ghosts.node:
+            self.ghosts.apply_transparency()
+        self.fx.apply_transparency()
+        for proj in self.projectile_pool.pool:
+            if proj.node.hasTransparency():
+                self.transparency.apply(proj.node, 'projectile')
+
+        if hasattr(self, 'pause_quality_text') and self.pause_quality_text:
+            self.pause_quality_text.setText(self.quality_caption())
+        print(f"Calidad gráfica: {quality.label()}")
+
+    def quality_caption(self):
+        return f"G = Calidad: {self.quality.label()}"
+
+    def fire_mode_caption(self):
+        return f"H = Disparo: {'Instantáneo' if self.hitscan else 'Proyectil'}"
+
+    def toggle_hitscan(self):
+        self.hitscan = not self.hitscan
+        if hasattr(self, 'pause_fire_text') and self.pause_fire_text:
+            self.pause_fire_text.setText(self.fire_mode_caption())
+        print(f"Modo de disparo: {'hitscan' if self.hitscan else 'proyectil'}")
+
     def create_game_background(self):
         """Crea fondo del juego"""
         from panda3d.core import Vec4
         self.base.setBackgroundColor(Vec4(0.53, 0.81, 0.98, 1))
+
+    def setup_fog(self):
+        """
+        Niebla del color del cielo y plano lejano más corto: ocultan el cambio
+        de LOD de las barreras y el final del pasillo
+        """
+        from panda3d.core import Fog
+        self.fog = Fog("corridor_fog")
+        self.fog.setColor(0.53, 0.81, 0.98)
+        self.fog.setLinearRange(15, 90)
+        self.base.render.setFog(self.fog)
+
+        self.default_far = self.base.camLens.getFar()
+        self.base.camLens.setFar(90)
     
     def setup_ui(self):
         """Configura interfaz de usuario"""
@@ -243,6 +266,30 @@ class Game:
         self.powerup_message = None
         self.powerup_message_task = None
 
+        # Lectura de bins (F3): Geoms opacos contra transparentes ordenados
+        self.bin_readout = None
+        self.bin_readout_time = 0
+        self.base.accept('f3', self.toggle_bin_readout)
+
+    def toggle_bin_readout(self):
+        """Muestra u oculta cuántos Geoms caen en cada bin de render"""
+        from direct.gui.OnscreenText import OnscreenText
+
+        if self.bin_readout:
+            self.bin_readout.destroy()
+            self.bin_readout = None
+            return
+        self.bin_readout = OnscreenText(text="", pos=(-1.3, -0.9), scale=0.05,
+                                        fg=(1, 1, 1, 1), align=0, mayChange=True)
+        self.update_bin_readout()
+
+    def update_bin_readout(self):
+        report = self.transparency.bin_report()
+        self.bin_readout.setText(
+            f"Opacos: {report['opaque']}  Transparentes: {report['transparent']}  "
+            f"Ordenados por frame: {report['sorted']}  Instancias: {report['instances']}  "
+            f"Colisionadores: {self.colliders.counts()['targets']}")
+
     def shoot(self, origin, direction):
         """Dispara si hay munición"""
         if self.game_paused or self.game_over:
@@ -255,20 +302,48 @@ class Game:
             if self.ammo == 0:
                 self.trigger_game_over()
             else:
-                self.projectile_pool.spawn(origin, direction)
+                if self.hitscan:
+                    self.fire_hitscan(origin, direction)
+                else:
+                    self.projectile_pool.spawn(origin, direction)
                 if hasattr(self.base, 'sound_manager') and self.base.sound_manager:
                     self.base.sound_manager.play_sound('shoot', volume=0.3)
 
+    def fire_hitscan(self, origin, direction):
+        """
+        Resuelve el disparo en el mismo frame: un rayo con el radio del proyectil
+        contra el índice del broadphase. El impacto entra en el lote del frame
+        como el de un proyectil, con un HitscanShot propio por disparo: dos disparos
+        al mismo blanco en un frame son dos choques distintos.
+        """
+        direction = direction.normalized()
+        collider = self.projectile_pool.pool[0].collider
+        radius = collider.getBounds().getRadius()
+        hit = self.broadphase.raycast(origin, direction, self.hitscan_range,
+                                      collider.node().getFromCollideMask(), radius)
+        end = hit[1] if hit else origin + direction * self.hitscan_range
+        # La traza sale un poco adelante y abajo de la cámara, como el arma
+        self.tracers.spawn(origin + direction * 1.5 + Vec3(0, 0, -0.3), end)
+        if hit:
+            target = hit[0]
+            self.dispatcher.push('projectile', HitscanShot(), target.kind, target.entity)
+
     def spawn_demo_crystals(self):
         positions = [
             ( -2, 20, 2 ),
             (  2, 30, 2.5 ),
         ]
         for i, pos in enumerate(positions):
-            c = Crystal(self.base, pos, self.cTrav, self.handler)
-            c.node.setPythonTag('crystal_ref', c)
-            c.collider.setPythonTag('crystal_ref', c)
-            self.crystals.append(c)
+            self.create_crystal(pos)
+
+    def create_crystal(self, pos):
+        """Crea un fantasma dentro del chunk que le corresponde"""
+        chunk = self.chunks.chunk_for(pos[1])
+        c = Crystal(self.base, pos, parent=chunk.node, renderer=self.ghosts, motion=self.motion)
+        chunk.add(c)
+        # Con instancing el nodo no se mueve: el colisionador sigue al vaivén calculado
+        self.colliders.add_target(c.collider, c, c.current_pos)
+        self.crystals.append(c)
 
     def spawn_powerups(self):
         """Genera power-ups que otorgan munición extra"""
@@ -282,15 +357,15 @@ class Game:
             x_pos = random.uniform(-6, 6)
             z_pos = random.uniform(1, 4)
             ammo_bonus = random.choice([3, 5, 7])
+            chunk = self.chunks.chunk_for(spawn_y)
             powerup = PowerUpObstacle(
                 self.base,
                 (x_pos, spawn_y, z_pos),
-                self.cTrav,
-                self.handler,
-                ammo_bonus=ammo_bonus
+                ammo_bonus=ammo_bonus,
+                parent=chunk.node
             )
-            
-            self.cTrav.addCollider(powerup.collider, self.handler)
+            chunk.add(powerup)
+            self.colliders.add_target(powerup.collider, powerup)
             
             self.powerups.append(powerup)
 
@@ -301,6 +376,7 @@ class Game:
 
         for powerup in self.powerups:
             if powerup.pos.y < camera_y - 50:
+                self.colliders.remove(powerup.collider)
                 powerup.cleanup()
                 powerups_to_remove.append(powerup)
 
@@ -314,16 +390,12 @@ class Game:
         for i in range(3):
             barrier = BreakableBarrier(
                 self.base,
-                (0, start_y + i * 10, 2),
-                self.cTrav,
-                self.handler
+                (0, start_y + i * 10, 2)
             )
             self.barriers.append(barrier)
 
         for x in [-3, 3]:
-            c = Crystal(self.base, (x, start_y + i * 10 - 3, 2), self.cTrav, self.handler)
-            c.node.setPythonTag('crystal_ref', c)
-            c.collider.setPythonTag('crystal_ref', c)
+            c = Crystal(self.base, (x, start_y + i * 10 - 3, 2))
             self.crystals.append(c)
             
     def spawn_barriers(self):
@@ -342,41 +414,52 @@ class Game:
             z = random.uniform(2, 3.5)
             pos = (x, spawn_y, z)
 
-            barrier = BreakableBarrier(self.base, pos, self.cTrav, self.handler)
-            barrier.node.setPythonTag('barrier_ref', barrier)
-            barrier.collider.setPythonTag('barrier_ref', barrier)
+            chunk = self.chunks.chunk_for(spawn_y)
+            barrier = BreakableBarrier(self.base, pos, parent=chunk.node)
+            chunk.add(barrier)
+            self.colliders.add_target(barrier.collider, barrier)
             self.barriers.append(barrier)
 
-    def cleanup_old_barriers(self):
-        """Eliminar barriers que pasaron sin romperse (descuenta puntos)"""
+    def cleanup_old_chunks(self):
+        """
+        Procesa los chunks que quedaron atrás de la cámara: descuenta puntos por
+        barriers que pasaron sin romperse y elimina cada chunk viejo de una vez
+        """
         camera_y = self.base.camera.getY()
-        barriers_to_remove = []
+        passed, retired = self.chunks.update(camera_y, camera_y + self.crystal_spawn_y_distance)
 
-        for barrier in self.barriers:
-            if barrier.pos.getY() < camera_y - 10:
-                if not barrier.broken:
+        for chunk in passed:
+            for entity in chunk.entities:
+                if isinstance(entity, BreakableBarrier) and not entity.broken:
                     self.score = max(0, self.score - 10)
                     self.score_text.setText(f"Puntos: {self.score}")
                     print(f"❌ Colisión detectada. Puntos: {self.score}")
 
-                barrier.cleanup()
-                barriers_to_remove.append(barrier)
-
-        for barrier in barriers_to_remove:
-            self.barriers.remove(barrier)
-
-    def cleanup_old_powerups(self):
-        """Eliminar power-ups que están muy atrás"""
-        camera_y = self.base.camera.getY()
-        powerups_to_remove = []
-
-        for powerup in self.powerups:
-            if powerup.pos.y < camera_y - 50:
-                powerup.cleanup()
-                powerups_to_remove.append(powerup)
+        if not retired:
+            return
 
-        for powerup in powerups_to_remove:
-            self.powerups.remove(powerup)
+        removed = set()
+        for chunk in retired:
+            for entity in chunk.entities:
+                # El nodo ya se fue con el chunk; se liberan sus slots, intervalos y colisionador
+                if hasattr(entity, 'collider'):
+                    self.colliders.remove(entity.collider)
+                if hasattr(entity, 'cleanup'):
+                    entity.cleanup()
+                removed.add(id(entity))
+
+        self.crystals = [c for c in self.crystals if id(c) not in removed]
+        self.barriers = [b for b in self.barriers if id(b) not in removed]
+        self.powerups = [p for p in self.powerups if id(p) not in removed]
+
+    def rebase_spawn_cursors(self, shift):
+        """Los cursores de spawn por distancia siguen a la cámara recentrada"""
+        self.last_powerup_spawn -= shift
+
+    def update_barrier_lod(self, camera_y):
+        """Solo giran las barreras cercanas; las lejanas son un impostor quieto"""
+        for barrier in self.barriers:
+            barrier.set_near(barrier.pos.y - camera_y < BreakableBarrier.NEAR_DISTANCE)
 
     def spawn_new_crystals(self):
         """Genera nuevos cristales adelante de la cámara - máximo 2 cada 3 segundos"""
@@ -395,11 +478,7 @@ class Game:
                 x = random.uniform(-4, 4)
                 z = random.uniform(1.5, 3.5)
                 pos = (x, spawn_y + random.uniform(0, 5), z)
-
-                c = Crystal(self.base, pos, self.cTrav, self.handler)
-                c.node.setPythonTag('crystal_ref', c)
-                c.collider.setPythonTag('crystal_ref', c)
-                self.crystals.append(c)
+                self.create_crystal(pos)
 
     def toggle_pause(self):
         """Alterna pausa del juego"""
@@ -444,13 +523,31 @@ class Game:
             
             self.pause_text = OnscreenText(
                 text="ESC = Continuar\nQ = Salir al Menú",
-                pos=(0, -0.15), scale=0.09,
+                pos=(0, -0.1), scale=0.09,
                 fg=(0.9, 0.9, 0.9, 1), align=2,
                 mayChange=False,
                 parent=self.pause_panel
             )
+
+            self.pause_quality_text = OnscreenText(
+                text=self.quality_caption(),
+                pos=(0, -0.42), scale=0.08,
+                fg=(0, 0.8, 1, 1), align=2,
+                mayChange=True,
+                parent=self.pause_panel
+            )
+            
+            self.pause_fire_text = OnscreenText(
+                text=self.fire_mode_caption(),
+                pos=(0, -0.52), scale=0.08,
+                fg=(0, 0.8, 1, 1), align=2,
+                mayChange=True,
+                parent=self.pause_panel
+            )
             
             self.base.accept('q', self.quit_game)
+            self.base.accept('g', self.quality.cycle)
+            self.base.accept('h', self.toggle_hitscan)
         else:
             if hasattr(self.base, 'sound_manager') and self.base.sound_manager:
                 if hasattr(self.base.sound_manager, 'music') and self.base.sound_manager.music:
@@ -466,7 +563,15 @@ class Game:
                 self.pause_title.destroy()
             if hasattr(self, 'pause_text'):
                 self.pause_text.destroy()
+            if hasattr(self, 'pause_quality_text') and self.pause_quality_text:
+                self.pause_quality_text.destroy()
+                self.pause_quality_text = None
+            if hasattr(self, 'pause_fire_text') and self.pause_fire_text:
+                self.pause_fire_text.destroy()
+                self.pause_fire_text = None
             self.base.ignore('q')
+            self.base.ignore('g')
+            self.base.ignore('h')
 
     def quit_game(self):
         """Vuelve al menú principal"""
@@ -475,7 +580,10 @@ class Game:
 
     def cleanup(self):
         """Limpia recursos del juego"""
+        self.quality.remove_listener(self.apply_quality)
+
         for crystal in self.crystals:
+            crystal.cleanup()
             if hasattr(crystal, 'node') and crystal.node:
                 crystal.node.removeNode()
         self.crystals.clear()
@@ -485,11 +593,50 @@ class Game:
                 powerup.cleanup()
         self.powerups.clear()
 
+        for barrier in self.barriers:
+            if barrier:
+                barrier.cleanup()
+        self.barriers.clear()
+
+        if hasattr(self, 'ghosts') and self.ghosts:
+            self.ghosts.cleanup()
+            self.ghosts = None
+
+        if hasattr(self, 'motion') and self.motion:
+            self.motion.clear()
+            self.motion = None
+
+        if hasattr(self, 'fx') and self.fx:
+            self.fx.clear()
+            self.fx = None
+
+        if hasattr(self, 'dispatcher') and self.dispatcher:
+            self.dispatcher.cleanup()
+            self.dispatcher = None
+        if hasattr(self, 'colliders') and self.colliders:
+            self.colliders.cleanup()
+            self.colliders = None
+        if hasattr(self, 'broadphase') and self.broadphase:
+            self.broadphase.cleanup()
+            self.broadphase = None
+
+        if hasattr(self, 'origin') and self.origin:
+            self.origin.cleanup()
+            self.origin = None
+
+        if hasattr(self, 'chunks') and self.chunks:
+            self.chunks.cleanup()
+            self.chunks = None
+
         if hasattr(self, 'projectile_pool'):
             for proj in self.projectile_pool.pool:
                 if hasattr(proj, 'node') and proj.node:
                     proj.node.removeNode()
 
+        if hasattr(self, 'tracers') and self.tracers:
+            self.tracers.cleanup()
+            self.tracers = None
+
         # Limpiar luces - IMPORTANTE: clearLight antes de removeNode
         if hasattr(self, 'ambient_np') and self.ambient_np:
             self.base.render.clearLight(self.ambient_np)
@@ -504,50 +651,30 @@ class Game:
             self.dlnp2.removeNode()
             self.dlnp2 = None
 
+        # Quitar la niebla y restaurar el plano lejano
+        if hasattr(self, 'fog') and self.fog:
+            self.base.render.clearFog()
+            self.base.camLens.setFar(self.default_far)
+            self.fog = None
+
         # Limpiar geometría de la escena
-        if hasattr(self, 'floor') and self.floor:
-            self.floor.removeNode()
-            self.floor = None
-        if hasattr(self, 'road_lines'):
-            for line in self.road_lines:
-                if line:
-                    line.removeNode()
-            self.road_lines.clear()
-        if hasattr(self, 'left_edge') and self.left_edge:
-            self.left_edge.removeNode()
-            self.left_edge = None
-        if hasattr(self, 'right_edge') and self.right_edge:
-            self.right_edge.removeNode()
-            self.right_edge = None
-        if hasattr(self, 'left_wall') and self.left_wall:
-            self.left_wall.removeNode()
-            self.left_wall = None
-        if hasattr(self, 'left_wall_bricks'):
-            for brick in self.left_wall_bricks:
-                if brick:
-                    brick.removeNode()
-            self.left_wall_bricks.clear()
-        if hasattr(self, 'right_wall') and self.right_wall:
-            self.right_wall.removeNode()
-            self.right_wall = None
-        if hasattr(self, 'right_wall_bricks'):
-            for brick in self.right_wall_bricks:
-                if brick:
-                    brick.removeNode()
-            self.right_wall_bricks.clear()
-        if hasattr(self, 'ceiling') and self.ceiling:
-            self.ceiling.removeNode()
-            self.ceiling = None
+        if hasattr(self, 'corridor') and self.corridor:
+            self.corridor.cleanup()
+            self.corridor = None
         
+        if hasattr(self, 'resolution') and self.resolution:
+            self.resolution.cleanup()
+            self.resolution = None
+
         # Limpiar sol y nubes
-        if hasattr(self, 'sun') and self.sun:
-            self.sun.removeNode()
-            self.sun = None
-        if hasattr(self, 'clouds'):
-            for cloud_data in self.clouds:
-                if cloud_data['node']:
-                    cloud_data['node'].removeNode()
-            self.clouds.clear()
+        if hasattr(self, 'sky') and self.sky:
+            self.sky.cleanup()
+            self.sky = None
+
+        if hasattr(self, 'bin_readout') and self.bin_readout:
+            self.bin_readout.destroy()
+            self.bin_readout = None
+        self.base.ignore('f3')
 
         if hasattr(self, 'crystal_counter'):
             self.crystal_counter.destroy()
@@ -571,6 +698,14 @@ class Game:
             self.pause_title.destroy()
         if hasattr(self, 'pause_text'):
             self.pause_text.destroy()
+        if hasattr(self, 'pause_quality_text') and self.pause_quality_text:
+            self.pause_quality_text.destroy()
+            self.pause_quality_text = None
+        if hasattr(self, 'pause_fire_text') and self.pause_fire_text:
+            self.pause_fire_text.destroy()
+            self.pause_fire_text = None
+        self.base.ignore('g')
+        self.base.ignore('h')
 
     def trigger_game_over(self):
         """Activa game over"""
@@ -583,31 +718,9 @@ class Game:
         
         self.base.show_game_over(self.score)
 
-    def cleanup_old_crystals(self):
-        """Elimina cristales que están muy atrás de la cámara"""
-        camera_y = self.base.camera.getY()
-        crystals_to_remove = []
-
-        for crystal in self.crystals:
-            if crystal.pos.getY() < camera_y - 50:
-                crystal.node.removeNode()
-                crystals_to_remove.append(crystal)
-
-        for crystal in crystals_to_remove:
-            self.crystals.remove(crystal)
-
-    def on_projectile_hit(self, entry):
+    def on_projectile_hit(self, proj, crystal):
+        """Maneja colisión entre proyectil (o disparo hitscan) y cristal"""
         print("¡Colisión detectada!")
-        try:
-            from_np = entry.getFromNodePath().getParent()
-            into_np = entry.getIntoNodePath().getParent()
-            print(f"From: {from_np}, Into: {into_np}")
-        except Exception as e:
-            print(f"Error obteniendo nodos: {e}")
-            return
-
-        proj = from_np.getPythonTag('projectile_ref')
-        crystal = into_np.getPythonTag('crystal_ref')
         print(f"Projectile: {proj}, Crystal: {crystal}")
 
         if proj:
@@ -627,41 +740,22 @@ class Game:
         elif crystal and crystal.broken:
             print("Cristal ya estaba roto, no suma disparos")
 
-    def on_projectile_hit_barrier(self, entry):
+    def on_projectile_hit_barrier(self, proj, barrier):
         """Maneja colisión entre proyectil y barrier"""
-        try:
-            from_np = entry.getFromNodePath().getParent()
-            into_np = entry.getIntoNodePath().getParent()
-        except Exception as e:
-            print(f"Error obteniendo nodos: {e}")
-            return
-
-        proj = from_np.getPythonTag('projectile_ref')
-        barrier = into_np.getPythonTag('barrier_ref')
-
         if proj:
             proj.deactivate()
 
         if barrier and not barrier.broken:
             print("¡Objetivo roto! +3 disparos")
+            # break_apart borra el colisionador: se da de baja antes
+            self.colliders.remove(barrier.collider)
             barrier.break_apart()
             self.ammo += 3
             self.ammo_text.setText(f"Disparos: {self.ammo}")
 
-    def on_projectile_hit_powerup(self, entry):
+    def on_projectile_hit_powerup(self, proj, powerup):
         """Maneja colisión entre proyectil y power-up"""
         print("🎯 COLISIÓN DETECTADA CON POWER-UP!")
-        try:
-            from_np = entry.getFromNodePath().getParent()
-            into_np = entry.getIntoNodePath().getParent()
-            print(f"   From: {from_np}, Into: {into_np}")
-        except Exception as e:
-            print(f"❌ Error obteniendo nodos: {e}")
-            return
-
-        proj = from_np.getPythonTag('projectile_ref')
-        powerup = into_np.getPythonTag('powerup_ref')
-        
         print(f"   Projectile ref: {proj}")
         print(f"   PowerUp ref: {powerup}")
 
@@ -734,38 +828,14 @@ class Game:
             return Task.cont
 
         self.base.camera.setY(self.base.camera, self.speed * dt)
+        self.origin.update()
 
-        # Mantiene paredes laterales alineadas con la cámara
+        # Mantiene el pasillo (piso, paredes y líneas) alineado con la cámara
         camera_y = self.base.camera.getY()
-        self.left_wall.setY(camera_y)
-        self.right_wall.setY(camera_y)
+        self.corridor.update(camera_y)
         
-        # Mantiene ladrillos alineados con las paredes
-        for brick in self.left_wall_bricks:
-            brick.setY(camera_y)
-        for brick in self.right_wall_bricks:
-            brick.setY(camera_y)
-        
-        # Mantiene el piso/camino alineado con la cámara
-        self.floor.setY(camera_y)
-        self.left_edge.setY(camera_y)
-        self.right_edge.setY(camera_y)
-        
-        # Anima las líneas del camino para efecto de movimiento
-        for line in self.road_lines:
-            line.setY(camera_y + (line.getY() - camera_y) % 16 - 8)
-        
-        # Anima nubes
-        for cloud_data in self.clouds:
-            cloud = cloud_data['node']
-            speed = cloud_data['speed']
-            # Mover nube hacia adelante
-            cloud.setY(cloud.getY() + speed * dt)
-            # Si la nube se aleja mucho, reposicionarla atrás
-            if cloud.getY() > camera_y + 100:
-                cloud.setY(camera_y - 50)
-
         self.projectile_pool.update_all(dt)
+        self.tracers.update_all(dt)
 
         self.spawn_new_crystals()
 
@@ -773,15 +843,25 @@ class Game:
 
         self.spawn_powerups()
 
-        self.cleanup_old_crystals()
+        self.cleanup_old_chunks()
+
+        self.update_barrier_lod(camera_y)
 
-        self.cleanup_old_barriers()
+        self.motion.update()
+        self.ghosts.update()
+        self.fx.update(dt)
+        self.resolution.update()
 
-        self.cleanup_old_powerups()
+        if self.bin_readout:
+            import time
+            if time.time() >= self.bin_readout_time + 0.5:
+                self.bin_readout_time = time.time()
+                self.update_bin_readout()
 
         active_crystals = sum(1 for c in self.crystals if not c.broken)
         self.crystal_counter.setText(f"Cristales: {active_crystals}")
 
-        self.cTrav.traverse(self.base.render)
+        self.dispatcher.push_hits(self.broadphase.update())
+        self.dispatcher.dispatch()
 
         return Task.cont
\ No newline at end of file
@@ -6,6 +6,7 @@ LoginScreen - Pantalla de login/registro con interfaz gráfica
 from direct.gui.OnscreenText import OnscreenText
 from direct.gui.DirectGui import DirectButton, DirectEntry
 from panda3d.core import TextNode, Vec4, CardMaker, TransparencyAttrib
+from src.systems.asset_cache import get_asset_cache
 
 
 class LoginScreen:
@@ -114,7 +115,9 @@ class LoginScreen:
         self.background.setPos(0, 0, 0)
         
         try:
-            texture = self.base.loader.loadTexture("images/fondo_main.png")
+            texture = get_asset_cache(self.base).texture("images/fondo_main.png")
+            if texture is None:
+                raise IOError("images/fondo_main.png")
             self.background.setTexture(texture)
             self.background.setTransparency(TransparencyAttrib.MAlpha)
         except:
@@ -1,6 +1,7 @@
 from direct.gui.OnscreenText import OnscreenText
 from direct.gui.DirectGui import DirectButton
 from panda3d.core import TextNode, Vec4, CardMaker, TransparencyAttrib
+from src.systems.asset_cache import get_asset_cache
 
 class MainMenu:
     def __init__(self, base, user_manager, start_game_callback):
@@ -86,7 +87,9 @@ class MainMenu:
         self.background.setPos(0, 0, 0)
         
         try:
-            tex = self.base.loader.loadTexture("images/fondo_main.png")
+            tex = get_asset_cache(self.base).texture("images/fondo_main.png")
+            if tex is None:
+                raise IOError("images/fondo_main.png")
             self.background.setTexture(tex)
             self.background.setTransparency(TransparencyAttrib.MAlpha)
         except:
@@ -5,6 +5,7 @@ ScoresScreen - Pantalla para ver historial de puntuaciones y ranking
 from direct.gui.OnscreenText import OnscreenText
 from direct.gui.DirectGui import DirectButton, DirectFrame
 from panda3d.core import TextNode, Vec4, CardMaker, TransparencyAttrib
+from src.systems.asset_cache import get_asset_cache
 
 
 class ScoresScreen:
@@ -203,7 +204,9 @@ class ScoresScreen:
         self.background.setPos(0, 0, 0)
         
         try:
-            tex = self.base.loader.loadTexture("images/fondo_main.png")
+            tex = get_asset_cache(self.base).texture("images/fondo_main.png")
+            if tex is None:
+                raise IOError("images/fondo_main.png")
             self.background.setTexture(tex)
             self.background.setTransparency(TransparencyAttrib.MAlpha)
         except:
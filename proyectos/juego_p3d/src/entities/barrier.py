@@ -1,9 +1,13 @@
 """
 Obstáculos rectangulares rompibles para el juego
 """
-from panda3d.core import CardMaker, CollisionNode, CollisionSphere, Point3, Vec3, BitMask32, TransparencyAttrib
+from panda3d.core import CardMaker, CollisionNode, CollisionSphere, Point3, BitMask32, LODNode
 from direct.interval.LerpInterval import LerpHprInterval
 import random
+from src.systems.fx import get_fx_engine
+from src.systems.spin_shader import get_spin_shader
+from src.systems.impostor import get_impostor_baker
+from src.systems.quality import get_quality_settings
 
 
 """
@@ -14,17 +18,24 @@ También maneja la creación de fragmentos visuales al romperse.
 class BreakableBarrier:
     """Obstáculo rectangular 3D rotatorio que se rompe al impactar"""
 
-    def __init__(self, base, position, cTrav, handler):
+    # Más cerca que esto se ve la malla completa y la barrera gira;
+    # más lejos es una tarjeta quieta pre-renderizada
+    NEAR_DISTANCE = 20.0
+    FAR_DISTANCE = 1000.0
+    FRONT_FRAME = (-8, 8, -1, 1)
+    # Una vuelta cada 4 segundos
+    SPIN_RATE = 90.0
+
+    def __init__(self, base, position, parent=None):
         self.base = base
-        self.cTrav = cTrav
-        self.handler = handler
         self.pos = Point3(*position)
         self.broken = False
 
-        self.node = base.render.attachNewNode("barrier_container")
+        parent = parent if parent is not None else base.render
+        self.node = parent.attachNewNode("barrier_container")
         self.node.setPos(self.pos)
-        self.create_3d_barrier()
         self.node.setColor(0.0, 0.2, 0.6, 1.0)
+        self.create_lod()
 
         cnode = CollisionNode('barrier')
         cnode.addSolid(CollisionSphere(0, 0, 0, 8.5))
@@ -32,56 +43,87 @@ class BreakableBarrier:
         cnode.setIntoCollideMask(BitMask32.bit(0) | BitMask32.bit(1))
         self.collider = self.node.attachNewNode(cnode)
 
-        self.node.setPythonTag('barrier_ref', self)
-        self.collider.setPythonTag('barrier_ref', self)
-
-        self.cTrav.addCollider(self.collider, handler)
+        # El giro lo calcula la GPU y solo se ve en la malla cercana; sin
+        # shaders se usa el intervalo, que arranca cuando está cerca (set_near)
+        self.near = False
+        self.rotation_interval = None
+        if not get_spin_shader(base).apply(self.mesh, spin_rate=self.SPIN_RATE,
+                                           phase=random.uniform(0, 360)):
+            self.rotation_interval = LerpHprInterval(
+                self.node,
+                duration=360.0 / self.SPIN_RATE,
+                hpr=(360, 0, 0),
+                startHpr=(0, 0, 0)
+            )
 
-        self.rotation_interval = LerpHprInterval(
-            self.node,
-            duration=4.0,
-            hpr=(360, 0, 0),
-            startHpr=(0, 0, 0)
-        )
-        self.rotation_interval.loop()
+    def create_lod(self):
+        """Malla completa de cerca e impostor de lejos, bajo un LODNode"""
+        lod = LODNode('barrier_lod')
+        self.lod_np = self.node.attachNewNode(lod)
+
+        self.mesh = self.create_3d_barrier(self.lod_np)
+        lod.addSwitch(self.NEAR_DISTANCE, 0)
+
+        # La cara frontal está en y=-0.5; el impostor va en el mismo lugar
+        impostor = get_impostor_baker(self.base).make_card(
+            'barrier', self.mesh, self.FRONT_FRAME, self.lod_np)
+        if impostor is not None:
+            impostor.setY(-0.5)
+        else:
+            self.mesh.copyTo(self.lod_np)
+        lod.addSwitch(self.FAR_DISTANCE, self.NEAR_DISTANCE)
+
+    def set_near(self, near):
+        """Activa la rotación solo mientras la barrera está cerca de la cámara"""
+        if self.rotation_interval is None or near == self.near or self.broken:
+            return
+        self.near = near
+        if near:
+            self.rotation_interval.loop()
+        else:
+            self.rotation_interval.pause()
 
-    def create_3d_barrier(self):
-        """Crea barra 3D con 6 caras"""
+    def create_3d_barrier(self, parent):
+        """Crea barra 3D con 6 caras aplanadas en un solo nodo"""
+        mesh = parent.attachNewNode("barrier_mesh")
         cm_front = CardMaker("barrier_front")
         cm_front.setFrame(-8, 8, -1, 1)
-        front = self.node.attachNewNode(cm_front.generate())
+        front = mesh.attachNewNode(cm_front.generate())
         front.setPos(0, 0.5, 0)
         
         cm_back = CardMaker("barrier_back")
         cm_back.setFrame(-8, 8, -1, 1)
-        back = self.node.attachNewNode(cm_back.generate())
+        back = mesh.attachNewNode(cm_back.generate())
         back.setPos(0, -0.5, 0)
         back.setH(180)
         
         cm_top = CardMaker("barrier_top")
         cm_top.setFrame(-8, 8, -1, 1)
-        top = self.node.attachNewNode(cm_top.generate())
+        top = mesh.attachNewNode(cm_top.generate())
         top.setPos(0, 0, 1)
         top.setP(-90)
         
         cm_bottom = CardMaker("barrier_bottom")
         cm_bottom.setFrame(-8, 8, -1, 1)
-        bottom = self.node.attachNewNode(cm_bottom.generate())
+        bottom = mesh.attachNewNode(cm_bottom.generate())
         bottom.setPos(0, 0, -1)
         bottom.setP(90)
         
         cm_left = CardMaker("barrier_left")
         cm_left.setFrame(-1, 1, -1, 1)
-        left = self.node.attachNewNode(cm_left.generate())
+        left = mesh.attachNewNode(cm_left.generate())
         left.setPos(-8, 0, 0)
         left.setH(90)
         
         cm_right = CardMaker("barrier_right")
         cm_right.setFrame(-1, 1, -1, 1)
-        right = self.node.attachNewNode(cm_right.generate())
+        right = mesh.attachNewNode(cm_right.generate())
         right.setPos(8, 0, 0)
         right.setH(-90)
 
+        mesh.flattenStrong()
+        return mesh
+
     def break_apart(self):
         """Se rompe en fragmentos cuando es golpeado"""
         if self.broken:
@@ -90,52 +132,26 @@ class BreakableBarrier:
         self.broken = True
 
         # Detiene animación de rotación
-        if hasattr(self, 'rotation_interval'):
+        if self.rotation_interval is not None:
             self.rotation_interval.pause()
 
-        fragments = []
-
-        positions = [
-            (-6, 0, 0),
-            (-2, 0, 0),
-            (2, 0, 0),
-            (6, 0, 0),
-        ]
-
-        from direct.interval.IntervalGlobal import Sequence, LerpPosInterval, LerpHprInterval, Parallel, Func
-
-        for i, (dx, dy, dz) in enumerate(positions):
-            # Crea fragmentos 3D más pequeños
-            cm = CardMaker(f"barrier_shard_{i}")
-            cm.setFrame(-1.8, 1.8, -0.8, 0.8)
-            frag = self.base.render.attachNewNode(cm.generate())
-            frag.setPos(self.pos + Vec3(dx, dy, dz))
-            frag.setColor(0.0, 0.3, 0.7, 1.0)  # Azul Boca más claro
-            frag.setHpr(random.uniform(0, 360), random.uniform(0, 360), random.uniform(0, 360))
-
-            vel = Vec3(dx * 0.5, random.uniform(0, 4), random.uniform(-2, 2))
-
-            # Animación con movimiento y rotación
-            move = LerpPosInterval(frag, 0.8, frag.getPos() + vel * 0.5)
-            spin = LerpHprInterval(frag, 0.8, (
-                frag.getH() + random.uniform(180, 360),
-                frag.getP() + random.uniform(180, 360),
-                frag.getR() + random.uniform(180, 360)
-            ))
-            
-            seq = Sequence(
-                Parallel(move, spin),
-                Func(frag.removeNode)
-            )
-            seq.start()
-            fragments.append(frag)
+        # Trozos repartidos a lo largo de la barra, dibujados por el motor de partículas
+        get_fx_engine(self.base).emit_burst(
+            'barrier_shard', self.node.getPos(self.base.render),
+            get_quality_settings(self.base).value('barrier_shards'))
 
         self.node.hide()
         self.collider.removeNode()
 
+    def rebase(self, shift):
+        """Corre la barrera shift unidades hacia -Y (origen flotante)"""
+        self.pos.y -= shift
+        if self.node and not self.node.isEmpty():
+            self.node.setY(self.node.getY() - shift)
+
     def cleanup(self):
         """Limpia recursos de la barrera"""
-        if hasattr(self, 'rotation_interval'):
+        if self.rotation_interval is not None:
             self.rotation_interval.pause()
         if self.node:
             self.node.removeNode()
@@ -1,9 +1,8 @@
-from panda3d.core import CollisionNode, CollisionSphere, BitMask32, Point3, CardMaker, TransparencyAttrib
-from direct.showbase.DirectObject import DirectObject
-from direct.interval.LerpInterval import LerpPosInterval
-from direct.interval.FunctionInterval import Func
-from direct.interval.MetaInterval import Sequence
-import os
+from panda3d.core import CollisionNode, CollisionSphere, BitMask32, Point3
+from src.systems.billboard import get_billboard_factory
+from src.systems.fx import get_fx_engine
+from src.systems.quality import get_quality_settings
+from src.systems.transparency import get_transparency_policy
 
 """
 Esta clase representa un cristal que puede romperse en pedazos al ser impactado.
@@ -11,139 +10,86 @@ También maneja la creación de fragmentos visuales al romperse.
 
 """
 class Crystal:
-    def __init__(self, base, position_tuple, cTrav=None, coll_handler=None):
+    def __init__(self, base, position_tuple, parent=None, renderer=None, motion=None):
         self.base = base
         self.pos = Point3(*position_tuple)
         self.broken = False
+        self.renderer = renderer
+        # Sin GhostMotion el fantasma queda quieto en su posición
+        self.motion = motion
+        self.motion_slot = None
 
-        cm = CardMaker('crystal_card')
-        cm.setFrame(-0.8, 0.8, -0.8, 0.8)
-        
-        self.node = base.render.attachNewNode(f"crystal_{id(self)}")
+        parent = parent if parent is not None else base.render
+        self.node = parent.attachNewNode(f"crystal_{id(self)}")
         self.node.setPos(self.pos)
+        self.start_movement()
         
-        crystal_np = self.node.attachNewNode(cm.generate())
-        
-        try:
-            project_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            image_path = os.path.join(project_dir, "images", "fantasma.png")
-            
-            if os.path.exists(image_path):
-                from panda3d.core import Filename
-                tex = base.loader.loadTexture(Filename.fromOsSpecific(image_path))
-                crystal_np.setTexture(tex)
-                crystal_np.setTransparency(TransparencyAttrib.MAlpha)
+        # Con instancing el dibujo lo hace GhostRenderer; el nodo solo lleva el colisionador
+        if renderer is None or not renderer.add(self):
+            self.renderer = None
+            billboards = get_billboard_factory(base)
+            if billboards.atlas.has('fantasma'):
+                crystal_np = billboards.make_sprite('fantasma', (-0.8, 0.8, -0.8, 0.8), self.node, 'crystal_card')
+                get_transparency_policy(base).apply(crystal_np, 'fantasma')
             else:
-                crystal_np.setColor(0.3, 0.7, 0.95, 0.75)
-        except Exception as e:
-            print(f"Error cargando textura: {e}")
-            crystal_np.setColor(0.3, 0.7, 0.95, 0.75)
-        
-        crystal_np.setBillboardPointEye()
+                crystal_np = billboards.make_sprite('white', (-0.8, 0.8, -0.8, 0.8), self.node, 'crystal_card',
+                                                    color=(0.3, 0.7, 0.95, 0.75))
         
         cnode = CollisionNode('crystal')
         cnode.addSolid(CollisionSphere(0, 0, 0, 1.0))
         cnode.setFromCollideMask(BitMask32.allOff())
         cnode.setIntoCollideMask(BitMask32.bit(0))
         self.collider = self.node.attachNewNode(cnode)
-        if cTrav is not None and coll_handler is not None:
-            cTrav.addCollider(self.collider, coll_handler)
-        
-        self.start_movement()
 
     def start_movement(self):
-        """Inicia movimiento del fantasma"""
-        import random
-        from direct.interval.LerpInterval import LerpPosInterval, LerpHprInterval
-        from direct.interval.MetaInterval import Sequence, Parallel
-        
-        current_x = self.pos.getX()
-        direction = random.choice([-1, 1])
-        distance = random.uniform(1.5, 3.0)
-        target_x = current_x + (direction * distance)
-        target_x = max(-6, min(6, target_x))
-        
-        current_z = self.pos.getZ()
-        z_offset = random.uniform(-0.5, 0.5)
-        target_z = current_z + z_offset
-        target_z = max(1.0, min(5.0, target_z))
-        
-        duration = random.uniform(2.0, 3.5)
-        move_to = LerpPosInterval(
-            self.node,
-            duration,
-            Point3(target_x, self.pos.getY(), target_z),
-            startPos=Point3(current_x, self.pos.getY(), current_z)
-        )
-        
-        # Crea movimiento de vuelta
-        move_back = LerpPosInterval(
-            self.node,
-            duration,
-            Point3(current_x, self.pos.getY(), current_z),
-            startPos=Point3(target_x, self.pos.getY(), target_z)
-        )
-        
-        # Secuencia que se repite (ida y vuelta)
-        self.movement_sequence = Sequence(move_to, move_back)
-        self.movement_sequence.loop()
+        """Registra el vaivén del fantasma en el sistema de movimiento compartido"""
+        if self.motion is not None:
+            self.motion_slot = self.motion.add(self.node, self.pos)
+
+    def motion_params(self):
+        """Origen (en render) y vaivén (dx, dz, período, comienzo) para GhostRenderer"""
+        origin = self.node.getPos(self.base.render)
+        if self.motion_slot is None:
+            return origin, 0.0, 0.0, 1.0, 0.0
+        return (origin,) + tuple(self.motion.params(self.motion_slot))
+
+    def current_pos(self):
+        """Dónde se ve el fantasma ahora (con instancing el vaivén no mueve el nodo)"""
+        if self.motion_slot is None or self.node.isEmpty():
+            return self.node.getPos(self.base.render)
+        return self.base.render.getRelativePoint(self.node.getParent(),
+                                                 self.motion.position(self.motion_slot))
+
+    def stop_movement(self):
+        if self.motion is not None:
+            self.motion.remove(self.motion_slot, self.node)
+            self.motion_slot = None
     
     def break_apart(self):
         if self.broken:
             return
         self.broken = True
+        # Los fragmentos salen de donde se veía el fantasma al ser golpeado
+        pos = self.current_pos()
         
-        # Detener movimiento si existe
-        if hasattr(self, 'movement_sequence'):
-            self.movement_sequence.finish()
+        self.stop_movement()
         
         self.node.hide()
-        from panda3d.core import CardMaker, TransparencyAttrib, Filename
-        import random
-
-        shards = []
-        for i in range(8):
-            cm = CardMaker(f"shard_{i}")
-            size = random.uniform(0.15, 0.35)
-            cm.setFrame(-size, size, -size, size)
-            shard = self.base.render.attachNewNode(cm.generate())
-
-            shard.reparentTo(self.base.render)
-            shard.setPos(self.pos)
-            
-            # Desactivar colisiones en los fragmentos
-            shard.setCollideMask(BitMask32.allOff())
-
-            # Intentar cargar textura del fantasma para los fragmentos
-            try:
-                project_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-                image_path = os.path.join(project_dir, "images", "fantasma.png")
-                if os.path.exists(image_path):
-                    tex = self.base.loader.loadTexture(Filename.fromOsSpecific(image_path))
-                    shard.setTexture(tex)
-                    shard.setTransparency(TransparencyAttrib.MAlpha)
-                    shard.setColor(1, 1, 1, 0.7)  # Semi-transparente
-                else:
-                    shard.setColor(0.3, 0.7, 0.95, 0.85)
-            except:
-                shard.setTransparency(TransparencyAttrib.MAlpha)
-                shard.setColor(0.3, 0.7, 0.95, 0.85)
-            
-            shard.setBillboardPointEye()
-            shards.append(shard)
-
-        seqs = []
-        for i, shard in enumerate(shards):
-            x_dir = random.uniform(-2, 2)
-            y_dir = random.uniform(0.5, 2)
-            z_dir = random.uniform(-1, 2)
+        if self.renderer is not None:
+            self.renderer.remove(self)
 
-            dir_vec = Point3(x_dir, y_dir, z_dir)
-            target = shard.getPos() + dir_vec
+        # Los fragmentos los dibuja el motor de partículas compartido
+        get_fx_engine(self.base).emit_burst(
+            'ghost_shard', pos, get_quality_settings(self.base).value('ghost_shards'))
 
-            move = LerpPosInterval(shard, 1.2, target)
-            hide = Func(shard.removeNode)
-            seqs.append(Sequence(move, hide))
+    def rebase(self, shift):
+        """Corre el fantasma shift unidades hacia -Y (el vaivén lo corre GhostMotion)"""
+        self.pos.y -= shift
+        if not self.node.isEmpty():
+            self.node.setY(self.node.getY() - shift)
 
-        for s in seqs:
-            s.start()
\ No newline at end of file
+    def cleanup(self):
+        """Libera su slot de movimiento y deja de dibujarse; el nodo se va con su chunk"""
+        self.stop_movement()
+        if self.renderer is not None:
+            self.renderer.remove(self)
@@ -13,10 +13,8 @@ Los callbacks se pueden establecer mediante los métodos `set_shoot_callback` y
 """
 class Player:
     """Maneja apuntado con mouse y sistema de disparo"""
-    def __init__(self, base, cTrav, handler):
+    def __init__(self, base):
         self.base = base
-        self.cTrav = cTrav
-        self.handler = handler
         self.base.accept("mouse1", self.on_shoot)
         self.shoot_callback = None
 
@@ -26,8 +24,6 @@ class Player:
         cnode.setIntoCollideMask(BitMask32.allOff())
 
         self.collider = base.camera.attachNewNode(cnode)
-        cTrav.addCollider(self.collider, handler)
-        base.accept('player-into-barrier', self.on_hit_barrier)
 
         self.barrier_callback = None
         self.last_barrier_hit_time = 0
@@ -36,23 +32,17 @@ class Player:
     def set_barrier_callback(self, fn):
         self.barrier_callback = fn
 
-    def on_hit_barrier(self, entry):
-        try:
-            into_np = entry.getIntoNodePath().getParent()
-            barrier = into_np.getPythonTag('barrier_ref')
-            
-            if not barrier or barrier.broken:
-                return
-                
-            current_time = time.time()
-            if current_time - self.last_barrier_hit_time < self.barrier_hit_cooldown:
-                return
+    def on_hit_barrier(self, barrier):
+        if not barrier or barrier.broken:
+            return
 
-            self.last_barrier_hit_time = current_time
-            if self.barrier_callback:
-                self.barrier_callback()
-        except Exception as e:
-            pass
+        current_time = time.time()
+        if current_time - self.last_barrier_hit_time < self.barrier_hit_cooldown:
+            return
+
+        self.last_barrier_hit_time = current_time
+        if self.barrier_callback:
+            self.barrier_callback()
 
     def set_shoot_callback(self, fn):
         self.shoot_callback = fn
@@ -1,6 +1,8 @@
 from panda3d.core import NodePath, CollisionNode, CollisionSphere, Point3, Vec3
 from direct.interval.IntervalGlobal import Sequence, LerpPosInterval, Func
 import time
+from src.systems.billboard import get_billboard_factory
+from src.systems.transparency import get_transparency_policy
 
 """""
  Esta clase representa a un proyectil disparado por el jugador
@@ -19,40 +21,17 @@ class Projectile:
         self.speed = 80.0
         self.lifetime = 3.0
         self.spawn_time = 0.0
+        # Dónde estaba al empezar el último update (para el barrido de colisiones)
+        self.prev_pos = Point3(0, 0, 0)
 
-        from panda3d.core import CardMaker, TransparencyAttrib, Texture
-
-        cm = CardMaker("projectile_visual")
-        cm.setFrame(-0.5, 0.5, -0.5, 0.5)
-        self.node = base.render.attachNewNode(cm.generate())
-
-        try:
-            import os
-            from panda3d.core import Filename, Texture as PandaTexture
-
-            project_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            image_path = os.path.join(project_dir, "images", "projectile.png")
-
-            if os.path.exists(image_path):
-                panda_filename = Filename.fromOsSpecific(image_path)
-
-                try:
-                    tex = base.loader.loadTexture(panda_filename)
-                except Exception:
-                    tex = PandaTexture()
-                    if not tex.read(panda_filename):
-                        raise Exception("No se pudo cargar textura")
-
-                self.node.setTexture(tex)
-                self.node.setTransparency(TransparencyAttrib.MAlpha)
-                self.node.setColor(1, 1, 1, 1)
-            else:
-                self.node.setColor(1.0, 0.4, 0.2, 1.0)
-        except Exception as e:
-            print(f"Error cargando imagen: {e}")
-            self.node.setColor(1.0, 0.4, 0.2, 1.0)
+        billboards = get_billboard_factory(base)
+        if billboards.atlas.has('projectile'):
+            self.node = billboards.make_sprite('projectile', (-0.5, 0.5, -0.5, 0.5), base.render, "projectile_visual")
+            get_transparency_policy(base).apply(self.node, 'projectile')
+        else:
+            self.node = billboards.make_sprite('white', (-0.5, 0.5, -0.5, 0.5), base.render, "projectile_visual",
+                                               color=(1.0, 0.4, 0.2, 1.0))
 
-        self.node.setBillboardPointEye()
         self.node.hide()
 
         cnode = CollisionNode('projectile')
@@ -61,10 +40,10 @@ class Projectile:
         cnode.setFromCollideMask(BitMask32.bit(0))
         cnode.setIntoCollideMask(BitMask32.allOff())
         self.collider = self.node.attachNewNode(cnode)
-        self.node.setPythonTag('projectile_ref', self)
 
     def launch(self, position: Point3, direction: Vec3):
         self.node.setPos(position)
+        self.prev_pos = Point3(position)
         self.node.show()
         self.direction = direction.normalized()
         self.spawn_time = time.time()
@@ -74,7 +53,8 @@ class Projectile:
         if not self.active:
             return
         displacement = self.direction * (self.speed * dt)
-        self.node.setPos(self.node.getPos() + displacement)
+        self.prev_pos = self.node.getPos()
+        self.node.setPos(self.prev_pos + displacement)
         if (time.time() - self.spawn_time) > self.lifetime:
             self.deactivate()
 
@@ -83,14 +63,9 @@ class Projectile:
         self.node.hide()
 
 class ProjectilePool:
-    def __init__(self, base, cTrav, handler, size=12):
+    def __init__(self, base, size=12):
         self.base = base
-        self.cTrav = cTrav
-        self.handler = handler
         self.pool = [Projectile(base) for _ in range(size)]
-        for p in self.pool:
-            cnp = p.collider
-            self.cTrav.addCollider(cnp, handler)
 
     def get(self):
         for p in self.pool:
@@ -108,4 +83,11 @@ class ProjectilePool:
 
     def update_all(self, dt):
         for p in self.pool:
-            p.update(dt)
\ No newline at end of file
+            p.update(dt)
+
+    def rebase(self, shift):
+        """Corre los proyectiles en vuelo shift unidades hacia -Y (origen flotante)"""
+        for p in self.pool:
+            if p.active:
+                p.node.setY(p.node.getY() - shift)
+                p.prev_pos.y -= shift
\ No newline at end of file
@@ -0,0 +1,90 @@
+from panda3d.core import LineSegs, Point3
+from src.systems.transparency import get_transparency_policy
+
+"""
+ Trazas del disparo hitscan: una línea desde el arma hasta el impacto
+ que se desvanece en una fracción de segundo.
+ Igual que los proyectiles, se usa un pool de trazas reutilizables
+ (una traza es un nodo con una línea de largo 1 que se estira hasta el impacto)
+"""
+
+
+class Tracer:
+    def __init__(self, base, root):
+        self.base = base
+        self.active = False
+        self.lifetime = 0.1
+        self.age = 0.0
+
+        segs = LineSegs("tracer")
+        segs.setThickness(3.0)
+        segs.setColor(1.0, 0.8, 0.3, 1.0)
+        segs.moveTo(0, 0, 0)
+        segs.drawTo(0, 1, 0)
+        self.node = root.attachNewNode(segs.create())
+        self.node.setLightOff()
+        get_transparency_policy(base).apply(self.node, 'white', fading=True)
+        self.node.hide()
+
+    def launch(self, start: Point3, end: Point3):
+        length = (end - start).length()
+        if length <= 0.0:
+            return
+        self.node.setPos(start)
+        self.node.lookAt(end)
+        self.node.setSy(length)
+        self.node.setAlphaScale(1.0)
+        self.node.show()
+        self.age = 0.0
+        self.active = True
+
+    def update(self, dt):
+        if not self.active:
+            return
+        self.age += dt
+        if self.age >= self.lifetime:
+            self.deactivate()
+        else:
+            self.node.setAlphaScale(1.0 - self.age / self.lifetime)
+
+    def deactivate(self):
+        self.active = False
+        self.node.hide()
+
+
+class HitscanShot:
+    """
+    Lo que ocupa el lugar del proyectil en un choque hitscan: cada disparo es
+    uno distinto y no hay nada que apagar porque el rayo ya terminó
+    """
+
+    def deactivate(self):
+        pass
+
+
+class TracerPool:
+    def __init__(self, base, size=6):
+        self.base = base
+        self.root = base.render.attachNewNode("tracers")
+        self.pool = [Tracer(base, self.root) for _ in range(size)]
+
+    def spawn(self, start, end):
+        # Si están todas en uso se recicla la más vieja: una traza es solo decorado
+        tracer = next((t for t in self.pool if not t.active), None)
+        if tracer is None:
+            tracer = max(self.pool, key=lambda t: t.age)
+        tracer.launch(start, end)
+
+    def update_all(self, dt):
+        for t in self.pool:
+            t.update(dt)
+
+    def rebase(self, shift):
+        """Corre las trazas visibles shift unidades hacia -Y (origen flotante)"""
+        for t in self.pool:
+            if t.active:
+                t.node.setY(t.node.getY() - shift)
+
+    def cleanup(self):
+        self.pool = []
+        self.root.removeNode()
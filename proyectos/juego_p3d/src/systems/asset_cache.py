@@ -0,0 +1,119 @@
+"""
+AssetCache - Caché de texturas y modelos compartida por todo el proceso
+Responsabilidades:
+- Resolver la ruta de cada recurso una sola vez (sin os.path en el bucle de juego)
+- Cargar las texturas como .txo con mipmaps y compresión (TexturePipeline)
+- Mantener los handles cargados para reutilizarlos en cada spawn o explosión
+- Precargar una lista de recursos antes de empezar a jugar
+- Contar aciertos, fallos y tiempo total de carga
+"""
+
+import os
+import time
+
+from src.systems.texture_pipeline import get_texture_pipeline
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Recursos que se cargan al iniciar la partida. Los sprites del juego
+# (fantasma, proyectil, sol, nubes) vienen del atlas de sprite_atlas.py.
+PRELOAD_TEXTURES = []
+PRELOAD_MODELS = [
+    "models/box",
+]
+
+
+class AssetCache:
+    def __init__(self, base):
+        self.base = base
+        self.textures = {}
+        self.models = {}
+        self.paths = {}
+
+        # Contadores
+        self.hits = 0
+        self.misses = 0
+        self.load_time = 0.0
+
+    def resolve(self, relative_path):
+        """Ruta absoluta de un archivo del proyecto, o None si no existe"""
+        if relative_path not in self.paths:
+            path = os.path.join(PROJECT_DIR, relative_path)
+            self.paths[relative_path] = path if os.path.exists(path) else None
+        return self.paths[relative_path]
+
+    def texture(self, relative_path):
+        """Devuelve la textura (ruta relativa al proyecto) o None si no se pudo cargar"""
+        if relative_path in self.textures:
+            self.hits += 1
+            return self.textures[relative_path]
+
+        self.misses += 1
+        tex = None
+        path = self.resolve(relative_path)
+        if path:
+            start = time.perf_counter()
+            try:
+                tex = get_texture_pipeline(self.base).load(path)
+            except Exception as e:
+                print(f"Error cargando textura {relative_path}: {e}")
+            self.load_time += time.perf_counter() - start
+
+        # También se guardan los fallos para no volver a intentarlo
+        self.textures[relative_path] = tex
+        return tex
+
+    def model(self, model_path, parent=None):
+        """Devuelve una copia del modelo colgada de parent, o None si no se pudo cargar"""
+        if model_path in self.models:
+            self.hits += 1
+        else:
+            self._load_model(model_path)
+
+        prototype = self.models[model_path]
+        if prototype is None:
+            return None
+        return prototype.copyTo(parent if parent is not None else self.base.render)
+
+    def _load_model(self, model_path):
+        """Carga el modelo original que se copia en cada pedido"""
+        self.misses += 1
+        start = time.perf_counter()
+        try:
+            self.models[model_path] = self.base.loader.loadModel(model_path)
+        except Exception as e:
+            print(f"Error cargando modelo {model_path}: {e}")
+            self.models[model_path] = None
+        self.load_time += time.perf_counter() - start
+
+    def preload(self, textures=PRELOAD_TEXTURES, models=PRELOAD_MODELS):
+        """Carga por adelantado una lista de texturas y modelos"""
+        for relative_path in textures:
+            if relative_path not in self.textures:
+                self.texture(relative_path)
+        for model_path in models:
+            if model_path not in self.models:
+                self._load_model(model_path)
+
+    def stats(self):
+        """Contadores de uso de la caché"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'load_time': self.load_time,
+            'textures': sum(1 for tex in self.textures.values() if tex is not None),
+            'models': sum(1 for model in self.models.values() if model is not None),
+            'texture_bytes': get_texture_pipeline(self.base).total_bytes(),
+        }
+
+
+_asset_cache = None
+
+
+def get_asset_cache(base):
+    """Caché única del proceso; se crea la primera vez que se pide"""
+    global _asset_cache
+    if _asset_cache is None:
+        _asset_cache = AssetCache(base)
+    return _asset_cache
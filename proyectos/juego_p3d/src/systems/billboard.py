@@ -0,0 +1,183 @@
+"""
+Billboard - Sprites orientados a la cámara
+Responsabilidades:
+- Construir geometría de sprites con un offset de esquina por vértice
+- Orientar los sprites hacia la cámara en el vertex shader (sin efecto por nodo)
+- Mantener el camino clásico con setBillboardPointEye como respaldo
+"""
+
+from panda3d.core import (
+    BoundingSphere, Geom, GeomNode, GeomTriangles, GeomVertexArrayFormat,
+    GeomVertexData, GeomVertexFormat, GeomVertexWriter, InternalName,
+    Point3, Shader,
+)
+
+from src.systems.sprite_atlas import get_sprite_atlas
+
+
+# Niebla lineal compartida por los shaders de sprites. Sin niebla activa
+# Panda entrega start == end, así que el factor queda en 1 (sin niebla).
+FOG_GLSL = """
+uniform struct p3d_FogParameters {
+    vec4 color;
+    float density;
+    float start;
+    float end;
+    float scale;
+} p3d_Fog;
+
+vec4 apply_fog(vec4 color, vec3 view_pos) {
+    if (p3d_Fog.end <= p3d_Fog.start) {
+        return color;
+    }
+    float visibility = clamp((p3d_Fog.end - length(view_pos)) * p3d_Fog.scale, 0.0, 1.0);
+    return vec4(mix(p3d_Fog.color.rgb, color.rgb, visibility), color.a);
+}
+"""
+
+BILLBOARD_VERTEX = """
+#version 150
+
+uniform mat4 p3d_ModelViewMatrix;
+uniform mat4 p3d_ProjectionMatrix;
+
+in vec4 p3d_Vertex;
+in vec4 p3d_Color;
+in vec2 p3d_MultiTexCoord0;
+in vec2 corner;
+
+out vec2 texcoord;
+out vec4 color;
+out vec3 view_pos;
+
+void main() {
+    // El vértice es el centro del sprite; la esquina se suma en espacio de vista
+    vec4 center = p3d_ModelViewMatrix * p3d_Vertex;
+    center.xy += corner;
+    gl_Position = p3d_ProjectionMatrix * center;
+    texcoord = p3d_MultiTexCoord0;
+    color = p3d_Color;
+    view_pos = center.xyz;
+}
+"""
+
+BILLBOARD_FRAGMENT = """
+#version 150
+
+uniform sampler2D p3d_Texture0;
+uniform vec4 p3d_ColorScale;
+
+in vec2 texcoord;
+in vec4 color;
+in vec3 view_pos;
+
+out vec4 p3d_FragColor;
+""" + FOG_GLSL + """
+void main() {
+    p3d_FragColor = apply_fog(texture(p3d_Texture0, texcoord) * color * p3d_ColorScale, view_pos);
+}
+"""
+
+
+def sprite_format():
+    """Formato de vértice: centro, color, UV y offset de esquina"""
+    array = GeomVertexArrayFormat()
+    array.addColumn(InternalName.getVertex(), 3, Geom.NT_float32, Geom.C_point)
+    array.addColumn(InternalName.getColor(), 4, Geom.NT_uint8, Geom.C_color)
+    array.addColumn(InternalName.getTexcoord(), 2, Geom.NT_float32, Geom.C_texcoord)
+    array.addColumn(InternalName.make('corner'), 2, Geom.NT_float32, Geom.C_other)
+    return GeomVertexFormat.registerFormat(GeomVertexFormat(array))
+
+
+class BillboardFactory:
+    MODE_SHADER = 'shader'
+    MODE_NODE = 'node'
+
+    def __init__(self, base, mode=None):
+        self.base = base
+        self.atlas = get_sprite_atlas(base)
+        self.format = sprite_format()
+        self.shader = Shader.make(Shader.SL_GLSL, BILLBOARD_VERTEX, BILLBOARD_FRAGMENT)
+
+        if mode is None:
+            mode = self.MODE_SHADER if self.shaders_supported() else self.MODE_NODE
+        self.mode = mode
+
+    def shaders_supported(self):
+        """True si la placa de video acepta GLSL"""
+        gsg = self.base.win.getGsg() if self.base.win else None
+        return bool(gsg and gsg.getSupportsGlsl())
+
+    # ========== GEOMETRÍA ==========
+
+    def build_geom_node(self, name, sprites):
+        """
+        Crea un GeomNode con varios sprites en un solo vertex buffer.
+        Cada sprite es (centro, (x0, x1, z0, z1), región del atlas, color).
+        """
+        vdata = GeomVertexData(name, self.format, Geom.UH_static)
+        vdata.uncleanSetNumRows(len(sprites) * 4)
+        vertex = GeomVertexWriter(vdata, 'vertex')
+        color = GeomVertexWriter(vdata, 'color')
+        texcoord = GeomVertexWriter(vdata, 'texcoord')
+        corner = GeomVertexWriter(vdata, 'corner')
+        tris = GeomTriangles(Geom.UH_static)
+
+        radius = 0.0
+        for i, (center, frame, region, rgba) in enumerate(sprites):
+            x0, x1, z0, z1 = frame
+            u0, v0, u1, v1 = self.atlas.uv(region)
+            for cx, cz, u, v in ((x0, z0, u0, v0), (x1, z0, u1, v0),
+                                 (x1, z1, u1, v1), (x0, z1, u0, v1)):
+                vertex.addData3(*center)
+                color.addData4(*rgba)
+                texcoord.addData2(u, v)
+                corner.addData2(cx, cz)
+                radius = max(radius, Point3(*center).length() + (cx * cx + cz * cz) ** 0.5)
+            first = i * 4
+            tris.addVertices(first, first + 1, first + 2)
+            tris.addVertices(first, first + 2, first + 3)
+
+        geom = Geom(vdata)
+        geom.addPrimitive(tris)
+        node = GeomNode(name)
+        node.addGeom(geom)
+        # Los vértices están en el centro: el volumen se agranda para no
+        # descartar sprites que asoman por el borde de la pantalla
+        node.setBounds(BoundingSphere(Point3(0, 0, 0), radius))
+        return node
+
+    # ========== SPRITES ==========
+
+    def make_sprite(self, region, frame, parent=None, name=None, color=(1, 1, 1, 1)):
+        """
+        Crea un sprite que siempre mira a la cámara. En modo shader es un
+        GeomNode común (se puede aplanar junto a otros); en modo nodo es una
+        tarjeta con setBillboardPointEye.
+        """
+        parent = parent if parent is not None else self.base.render
+        name = name or f"{region}_sprite"
+
+        if self.mode == self.MODE_SHADER:
+            sprite = parent.attachNewNode(
+                self.build_geom_node(name, [((0, 0, 0), frame, region, color)]))
+            sprite.setTexture(self.atlas.texture)
+            sprite.setShader(self.shader)
+            # El shader no usa luces: así no cambia de estado con ellas
+            sprite.setLightOff()
+        else:
+            sprite = self.atlas.make_card(region, frame, parent, name)
+            sprite.setColor(*color)
+            sprite.setBillboardPointEye()
+        return sprite
+
+
+_billboard_factory = None
+
+
+def get_billboard_factory(base):
+    """Fábrica única del proceso"""
+    global _billboard_factory
+    if _billboard_factory is None:
+        _billboard_factory = BillboardFactory(base)
+    return _billboard_factory
@@ -0,0 +1,245 @@
+"""
+CorridorBroadphase - Colisiones del pasillo sin recorrer toda la escena
+Responsabilidades:
+- Mantener los blancos (fantasmas, barreras, power-ups) ordenados por su Y
+- Probar cada objeto que se mueve (proyectiles, jugador) solo contra los blancos
+  dentro del intervalo en Y que barrió en el frame
+- Probar el segmento recorrido (no solo la posición final) y quedarse con el primer
+  impacto, así un proyectil rápido no atraviesa un blanco entre dos frames
+- Resolver rayos al instante contra el mismo índice (disparo hitscan)
+- Respetar las máscaras y esferas de los CollisionNode de cada colisionador
+- Devolver los contactos nuevos del frame como pares (móvil, blanco) con su
+  entidad ya resuelta, para que los reparta CollisionDispatcher
+"""
+
+import math
+from bisect import bisect_left, bisect_right
+
+from panda3d.core import CollisionSphere, Point3
+
+
+class Collider:
+    """Esfera de un colisionador con sus máscaras, leída una sola vez del CollisionNode"""
+
+    def __init__(self, np, render, previous=None, entity=None, locate=None):
+        node = np.node()
+        sphere = None
+        for i in range(node.getNumSolids()):
+            solid = node.getSolid(i)
+            if isinstance(solid, CollisionSphere):
+                sphere = solid
+                break
+        self.np = np
+        # Los CollisionNode siempre están ocultos: lo que cuenta es su dueño
+        self.owner = np.getParent()
+        self.name = node.getName()
+        # Tipo para la tabla de handlers (el nombre del CollisionNode) y entidad dueña
+        self.kind = self.name
+        self.entity = entity
+        self.from_mask = node.getFromCollideMask()
+        self.into_mask = node.getIntoCollideMask()
+        self.center = Point3(sphere.getCenter()) if sphere else Point3(0, 0, 0)
+        self.radius = sphere.getRadius() * np.getSx(render) if sphere else 0.0
+        # Función opcional que da la posición del frame anterior (en render)
+        self.previous = previous
+        # Función opcional que da el centro actual (en render) cuando el nodo no se mueve
+        # con lo que se ve (fantasmas cuyo vaivén calcula la GPU)
+        self.locate = locate
+        # Clave de orden de un blanco (su Y al registrarlo, corrida con el origen)
+        self.key = None
+
+    def hidden(self):
+        return self.owner.isHidden()
+
+    def position(self, render):
+        if self.locate is not None:
+            return self.locate()
+        return render.getRelativePoint(self.np, self.center)
+
+
+class CorridorBroadphase:
+    def __init__(self, base):
+        self.base = base
+        self.render = base.render
+        # Blancos ordenados por Y: claves y colisionadores en listas paralelas
+        self.target_ys = []
+        self.targets = []
+        self.max_radius = 0.0
+        self.movers = []
+        # Posición de cada móvil en el frame anterior (id -> Point3)
+        self.previous = {}
+        # Pares (móvil, blanco) en contacto el frame anterior
+        self.contacts = set()
+        # Pruebas esfera contra esfera del último frame (para comparar densidad)
+        self.tests = 0
+
+    # ========== REGISTRO ==========
+
+    def add_target(self, np, entity=None, locate=None):
+        """Registra un colisionador quieto en Y (puede moverse en X/Z)"""
+        collider = Collider(np, self.render, entity=entity, locate=locate)
+        collider.key = collider.position(self.render).y
+        index = bisect_right(self.target_ys, collider.key)
+        self.target_ys.insert(index, collider.key)
+        self.targets.insert(index, collider)
+        self.max_radius = max(self.max_radius, collider.radius)
+        return collider
+
+    def remove_target(self, collider):
+        """Saca un blanco por su clave; sirve aunque su nodo ya no exista"""
+        index = bisect_left(self.target_ys, collider.key)
+        while index < len(self.targets) and self.target_ys[index] == collider.key:
+            if self.targets[index] is collider:
+                del self.target_ys[index]
+                del self.targets[index]
+                return True
+            index += 1
+        return False
+
+    def add_mover(self, np, previous=None, entity=None):
+        """
+        Registra un colisionador que se mueve; con su dueño oculto no choca.
+        previous() devuelve dónde estaba en el frame anterior; sin ella se usa la
+        posición que se vio en la última prueba.
+        """
+        collider = Collider(np, self.render, previous, entity)
+        self.movers.append(collider)
+        return collider
+
+    def remove_mover(self, collider):
+        if collider not in self.movers:
+            return False
+        self.movers.remove(collider)
+        self.previous.pop(id(collider), None)
+        self.contacts = {pair for pair in self.contacts if pair[0] != id(collider)}
+        return True
+
+    def target_count(self):
+        return len(self.targets)
+
+    def mover_count(self):
+        return len(self.movers)
+
+    # ========== ORIGEN FLOTANTE ==========
+
+    def rebase(self, shift):
+        """Corre las claves y las posiciones guardadas shift unidades hacia -Y"""
+        self.target_ys = [y - shift for y in self.target_ys]
+        for collider in self.targets:
+            collider.key -= shift
+        for pos in self.previous.values():
+            pos.y -= shift
+
+    # ========== CONSULTA ==========
+
+    def _prune(self):
+        """
+        Saca del frente los blancos cuyo nodo ya no existe: los chunks se retiran
+        de atrás hacia adelante, así que solo se mira el principio de la lista.
+        Los del medio (barreras rotas) se saltean al consultar y salen al llegar al frente.
+        """
+        count = 0
+        for collider in self.targets:
+            if not collider.np.isEmpty():
+                break
+            count += 1
+        if count:
+            del self.target_ys[:count]
+            del self.targets[:count]
+
+    def candidates(self, y0, y1, margin):
+        """Blancos cuya clave cae en [y0 - margin, y1 + margin]"""
+        lo = bisect_left(self.target_ys, y0 - margin)
+        hi = bisect_right(self.target_ys, y1 + margin)
+        return self.targets[lo:hi]
+
+    def update(self):
+        """
+        Prueba todos los móviles. Devuelve los contactos que empezaron en este
+        frame, como mucho uno por móvil: [(móvil, blanco), ...]
+        """
+        render = self.render
+        self._prune()
+        self.tests = 0
+        hits = []
+        contacts = set()
+
+        for mover in self.movers:
+            if mover.np.isEmpty() or mover.hidden():
+                self.previous.pop(id(mover), None)
+                continue
+            pos = mover.position(render)
+            if mover.previous is not None:
+                prev = mover.previous()
+            else:
+                prev = self.previous.get(id(mover), pos)
+            self.previous[id(mover)] = Point3(pos)
+
+            margin = mover.radius + self.max_radius
+            first = None
+            first_t = None
+            for target in self.candidates(min(prev.y, pos.y), max(prev.y, pos.y), margin):
+                if (mover.from_mask & target.into_mask).isZero() or target.np.isEmpty() or target.hidden():
+                    continue
+                self.tests += 1
+                t = sweep_sphere(prev, pos, target.position(render), mover.radius + target.radius)
+                if t is None:
+                    continue
+                pair = (id(mover), id(target))
+                contacts.add(pair)
+                if pair not in self.contacts and (first_t is None or t < first_t):
+                    first, first_t = target, t
+            # Solo el primer impacto del recorrido: lo que está detrás no se toca
+            if first is not None:
+                hits.append((mover, first))
+
+        self.contacts = contacts
+        return hits
+
+    def raycast(self, origin, direction, length, from_mask, radius=0.0):
+        """
+        Primer blanco que toca el rayo origin + direction * [0, length] engordado
+        en radius. Devuelve (colisionador, punto) o None; no registra contactos.
+        """
+        end = origin + direction * length
+        best = None
+        best_t = None
+        margin = radius + self.max_radius
+        for target in self.candidates(min(origin.y, end.y), max(origin.y, end.y), margin):
+            if (from_mask & target.into_mask).isZero() or target.np.isEmpty() or target.hidden():
+                continue
+            self.tests += 1
+            t = sweep_sphere(origin, end, target.position(self.render), radius + target.radius)
+            if t is not None and (best_t is None or t < best_t):
+                best, best_t = target, t
+        if best is None:
+            return None
+        return best, origin + (end - origin) * best_t
+
+    def cleanup(self):
+        self.target_ys.clear()
+        self.targets.clear()
+        self.movers.clear()
+        self.previous.clear()
+        self.contacts.clear()
+
+
+def sweep_sphere(start, end, center, radius):
+    """
+    Fracción t en [0, 1] del segmento start -> end en la que una esfera puntual
+    toca la esfera (center, radius), o None si no la toca. t = 0 si ya empieza adentro.
+    """
+    d = end - start
+    f = start - center
+    c = f.dot(f) - radius * radius
+    if c <= 0.0:
+        return 0.0
+    a = d.dot(d)
+    if a == 0.0:
+        return None
+    b = f.dot(d)
+    disc = b * b - a * c
+    if disc < 0.0:
+        return None
+    t = (-b - math.sqrt(disc)) / a
+    return t if 0.0 <= t <= 1.0 else None
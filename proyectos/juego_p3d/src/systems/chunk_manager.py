@@ -0,0 +1,154 @@
+"""
+ChunkManager - Agrupa el contenido spawneado en tramos del eje Y
+Responsabilidades:
+- Crear un nodo por tramo fijo del pasillo (chunk) para colgar entidades y decoración
+- Aplanar la decoración estática de un chunk cuando ya no recibe más spawns
+- Avisar una sola vez cuando la cámara deja atrás un chunk
+- Eliminar un chunk completo con un solo removeNode
+- Correr todos los chunks (y lo que cuelga de ellos) cuando se recentra el origen
+"""
+
+import math
+from collections import deque
+
+
+class Chunk:
+    def __init__(self, index, length, node):
+        self.index = index
+        self.start_y = index * length
+        self.end_y = self.start_y + length
+        self.node = node
+        # Decoración sin lógica: se aplana al sellar el chunk
+        self.static = node.attachNewNode('static')
+        # Entidades con lógica (fantasmas, barreras, power-ups)
+        self.entities = []
+        self.sealed = False
+        self.passed = False
+
+    def add(self, entity):
+        self.entities.append(entity)
+        return entity
+
+    def seal(self):
+        """Aplana la decoración estática; se llama cuando ya no se spawnea más aquí"""
+        if not self.sealed:
+            self.sealed = True
+            self.static.flattenStrong()
+
+    def rebase(self, steps, shift):
+        """Corre el chunk steps tramos (shift unidades) hacia -Y"""
+        self.index -= steps
+        self.start_y -= shift
+        self.end_y -= shift
+        self.node.setName(f'chunk_{self.index}')
+        for child in self.static.getChildren():
+            child.setY(child.getY() - shift)
+        if self.sealed:
+            # La decoración ya aplanada vuelve a quedar con el corrimiento en los vértices
+            self.static.flattenLight()
+        for entity in self.entities:
+            if hasattr(entity, 'rebase'):
+                entity.rebase(shift)
+
+
+class ChunkManager:
+    CHUNK_LENGTH = 10.0
+
+    def __init__(self, base, parent=None, chunk_length=CHUNK_LENGTH,
+                 pass_distance=10.0, despawn_distance=50.0):
+        self.base = base
+        self.chunk_length = chunk_length
+        self.pass_distance = pass_distance
+        self.despawn_distance = despawn_distance
+
+        self.root = (parent if parent is not None else base.render).attachNewNode('chunks')
+        self.chunks = {}
+        # Índices ordenados de los chunks vivos (el más viejo a la izquierda)
+        self.order = deque()
+
+    def index_for(self, y):
+        return int(math.floor(y / self.chunk_length))
+
+    def chunk_for(self, y):
+        """Devuelve el chunk que cubre la coordenada y, creándolo si hace falta"""
+        index = self.index_for(y)
+        chunk = self.chunks.get(index)
+        if chunk is None:
+            chunk = Chunk(index, self.chunk_length,
+                          self.root.attachNewNode(f'chunk_{index}'))
+            self.chunks[index] = chunk
+            self._insert_ordered(index)
+        return chunk
+
+    def _insert_ordered(self, index):
+        # Casi siempre se agrega al final; solo se recorre si llega desordenado
+        if not self.order or index > self.order[-1]:
+            self.order.append(index)
+            return
+        items = sorted(list(self.order) + [index])
+        self.order.clear()
+        self.order.extend(items)
+
+    def update(self, camera_y, spawn_y=None):
+        """
+        Procesa los chunks más viejos. Devuelve (pasados, retirados):
+        - pasados: chunks que la cámara dejó atrás por pass_distance (una sola vez)
+        - retirados: chunks que quedaron a despawn_distance y ya fueron eliminados
+        Solo recorre los pocos chunks que rodean a la cámara, así que el costo
+        no depende de cuántas entidades haya.
+        """
+        passed = []
+        retired = []
+
+        for index in self.order:
+            chunk = self.chunks[index]
+            if chunk.passed:
+                continue
+            if chunk.end_y >= camera_y - self.pass_distance:
+                break
+            chunk.passed = True
+            passed.append(chunk)
+
+        while self.order:
+            chunk = self.chunks[self.order[0]]
+            if chunk.end_y >= camera_y - self.despawn_distance:
+                break
+            self.order.popleft()
+            del self.chunks[chunk.index]
+            if not chunk.passed:
+                chunk.passed = True
+                passed.append(chunk)
+            chunk.node.removeNode()
+            retired.append(chunk)
+
+        # Sella los chunks que ya quedaron detrás del punto de spawn
+        if spawn_y is not None:
+            for index in self.order:
+                chunk = self.chunks[index]
+                if chunk.end_y > spawn_y:
+                    break
+                chunk.seal()
+
+        return passed, retired
+
+    def rebase(self, shift):
+        """
+        Corre todos los chunks shift unidades hacia -Y (origen flotante).
+        shift debe ser múltiplo de chunk_length para que los índices sigan enteros.
+        """
+        steps = int(round(shift / self.chunk_length))
+        chunks = {}
+        for index in self.order:
+            chunk = self.chunks[index]
+            chunk.rebase(steps, shift)
+            chunks[chunk.index] = chunk
+        self.chunks = chunks
+        self.order = deque(chunk.index for chunk in chunks.values())
+
+    def cleanup(self):
+        """Elimina todos los chunks"""
+        self.chunks.clear()
+        self.order.clear()
+        if self.root:
+            self.root.removeNode()
+            self.root = None
@@ -0,0 +1,75 @@
+"""
+ColliderRegistry - Alta y baja de todos los colisionadores del juego
+Responsabilidades:
+- Separar móviles ("from": proyectiles, jugador) de blancos ("into": fantasmas,
+  barreras, power-ups) según las máscaras de su CollisionNode
+- Registrar cada uno en el broadphase una sola vez y darlo de baja cuando
+  su entidad desaparece (aunque su nodo ya se haya ido con el chunk)
+- Asociar cada colisionador con su entidad (id del NodePath -> entidad),
+  que es lo que reciben los handlers de CollisionDispatcher
+- Llevar la cuenta de los colisionadores vivos y de las altas y bajas de la sesión
+"""
+
+
+class ColliderRegistry:
+    def __init__(self, broadphase):
+        self.broadphase = broadphase
+        # id del NodePath -> (NodePath, Collider del broadphase con su entidad, es móvil)
+        # Guardar el NodePath lo mantiene vivo: su id no se recicla mientras esté acá
+        self.entries = {}
+        self.registered = 0
+        self.unregistered = 0
+
+    def add_mover(self, np, entity=None, previous=None):
+        """Registra un colisionador que se mueve y choca ("from" sin "into")"""
+        node = np.node()
+        if node.getFromCollideMask().isZero() or not node.getIntoCollideMask().isZero():
+            raise ValueError(f"'{node.getName()}' no es un móvil: necesita máscara from y no into")
+        return self._add(np, self.broadphase.add_mover(np, previous, entity), True)
+
+    def add_target(self, np, entity=None, locate=None):
+        """
+        Registra un colisionador que solo recibe choques ("into" sin "from").
+        locate() opcional da el centro de su esfera en render.
+        """
+        node = np.node()
+        if node.getIntoCollideMask().isZero() or not node.getFromCollideMask().isZero():
+            raise ValueError(f"'{node.getName()}' no es un blanco: necesita máscara into y no from")
+        return self._add(np, self.broadphase.add_target(np, entity, locate), False)
+
+    def _add(self, np, collider, mover):
+        key = id(np)
+        if key in self.entries:
+            self.remove(np)
+        self.entries[key] = (np, collider, mover)
+        self.registered += 1
+        return collider
+
+    def remove(self, np):
+        """Da de baja un colisionador; no hace nada si no estaba registrado"""
+        entry = self.entries.pop(id(np), None)
+        if entry is None:
+            return False
+        _, collider, mover = entry
+        if mover:
+            self.broadphase.remove_mover(collider)
+        else:
+            self.broadphase.remove_target(collider)
+        self.unregistered += 1
+        return True
+
+    def counts(self):
+        """Colisionadores vivos en el registro y en el broadphase"""
+        movers = sum(1 for _, _, mover in self.entries.values() if mover)
+        return {
+            'movers': movers,
+            'targets': len(self.entries) - movers,
+            'broadphase_movers': self.broadphase.mover_count(),
+            'broadphase_targets': self.broadphase.target_count(),
+            'registered': self.registered,
+            'unregistered': self.unregistered,
+        }
+
+    def cleanup(self):
+        for np, _, _ in list(self.entries.values()):
+            self.remove(np)
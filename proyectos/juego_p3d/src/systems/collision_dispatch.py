@@ -0,0 +1,53 @@
+"""
+CollisionDispatcher - Reparto directo de los choques a sus handlers
+Responsabilidades:
+- Juntar en una cola los choques del frame (broadphase y disparos hitscan)
+- Descartar un par (móvil, blanco) repetido en el mismo frame
+- Resolver cada par (tipo de móvil, tipo de blanco) con una tabla de handlers
+  que reciben las entidades ya resueltas, sin eventos ni búsquedas por nodo
+- Atender toda la cola de una vez, después de terminar las pruebas
+"""
+
+
+class CollisionDispatcher:
+    def __init__(self):
+        # (tipo de móvil, tipo de blanco) -> handler(entidad_móvil, entidad_blanco)
+        self.table = {}
+        self.queue = []
+        self.pending = set()
+        # Choques atendidos en el último lote (para diagnóstico)
+        self.dispatched = 0
+
+    def bind(self, from_kind, into_kind, handler):
+        self.table[(from_kind, into_kind)] = handler
+
+    def push(self, from_kind, from_entity, into_kind, into_entity):
+        """Encola un choque; devuelve False si el par ya estaba en este frame o no tiene handler"""
+        if (from_kind, into_kind) not in self.table:
+            return False
+        key = (from_kind, id(from_entity), into_kind, id(into_entity))
+        if key in self.pending:
+            return False
+        self.pending.add(key)
+        self.queue.append((from_kind, from_entity, into_kind, into_entity))
+        return True
+
+    def push_hits(self, hits):
+        """Encola los pares (móvil, blanco) del broadphase"""
+        for mover, target in hits:
+            self.push(mover.kind, mover.entity, target.kind, target.entity)
+
+    def dispatch(self):
+        """Atiende todos los choques encolados y vacía la cola"""
+        batch = self.queue
+        self.queue = []
+        self.pending.clear()
+        for from_kind, from_entity, into_kind, into_entity in batch:
+            self.table[(from_kind, into_kind)](from_entity, into_entity)
+        self.dispatched = len(batch)
+        return self.dispatched
+
+    def cleanup(self):
+        self.table.clear()
+        self.queue = []
+        self.pending.clear()
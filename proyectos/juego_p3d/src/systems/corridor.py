@@ -0,0 +1,91 @@
+"""
+Corridor - Geometría estática del pasillo (calle + paredes de ladrillo)
+Responsabilidades:
+- Construir una sola vez la calle y las paredes como tarjetas con textura procedural
+- Aplanar todo en una malla única para reducir nodos y draw calls
+- Desplazar el pasillo con la cámara usando una sola transformación por frame
+"""
+
+from panda3d.core import CardMaker
+from src.systems.texture_factory import TextureFactory
+
+
+class Corridor:
+    # Separación entre líneas del camino; el pasillo se "engancha" a múltiplos
+    # de este valor para que el desplazamiento sea invisible
+    ROAD_LINE_SPACING = 8.0
+    HALF_WIDTH = 8.0
+    WALL_HEIGHT = 10.0
+    LENGTH = 200.0
+    # La niebla se calcula por vértice en algunos drivers: se parte cada
+    # superficie en tramos cortos para que no se interpole a lo largo de 200 u
+    SEGMENT_LENGTH = 8.0
+
+    BRICK_LENGTH = 1.0
+    COURSE_HEIGHT = 0.6
+
+    def __init__(self, base, parent=None, texture_factory=None):
+        self.base = base
+        self.textures = texture_factory or TextureFactory(base)
+        parent = parent if parent is not None else base.render
+
+        self.root = parent.attachNewNode('corridor')
+        self._build_road()
+        self._build_brick_wall('left')
+        self._build_brick_wall('right')
+
+        # Une las tarjetas en el menor número posible de Geoms (una por textura)
+        self.root.flattenStrong()
+
+    def _build_road(self):
+        """Crea el asfalto con bordes blancos y líneas amarillas centrales"""
+        road = self.root.attachNewNode('road')
+        road.setHpr(0, -90, 0)
+        for start, end in self._segments():
+            cm = CardMaker('road')
+            cm.setFrame(-self.HALF_WIDTH, self.HALF_WIDTH, start, end)
+            cm.setUvRange((0, self._v(start, self.ROAD_LINE_SPACING)),
+                          (1, self._v(end, self.ROAD_LINE_SPACING)))
+            road.attachNewNode(cm.generate())
+        road.setTexture(self.textures.road_texture(
+            half_width=self.HALF_WIDTH, dash_spacing=self.ROAD_LINE_SPACING))
+
+    def _build_brick_wall(self, side):
+        """Crea pared con textura de ladrillo"""
+        x_pos = -self.HALF_WIDTH if side == 'left' else self.HALF_WIDTH
+        hpr = 90 if side == 'left' else -90
+        brick_repeat = self.BRICK_LENGTH * 2
+        v_max = self.WALL_HEIGHT / (self.COURSE_HEIGHT * 2)
+
+        wall = self.root.attachNewNode(f'{side}_wall')
+        for start, end in self._segments():
+            cm = CardMaker(f'{side}_wall')
+            cm.setFrame(start, end, 0, self.WALL_HEIGHT)
+            cm.setUvRange((self._v(start, brick_repeat), 0),
+                          (self._v(end, brick_repeat), v_max))
+            wall.attachNewNode(cm.generate())
+        wall.setPos(x_pos, 0, 0)
+        wall.setHpr(hpr, 0, 0)
+        wall.setTexture(self.textures.brick_texture(
+            brick_length=self.BRICK_LENGTH, course_height=self.COURSE_HEIGHT))
+
+    def _segments(self):
+        """Tramos (inicio, fin) a lo largo del pasillo, centrados en el origen"""
+        half_length = self.LENGTH / 2
+        count = int(self.LENGTH / self.SEGMENT_LENGTH)
+        return [(-half_length + i * self.SEGMENT_LENGTH,
+                 -half_length + (i + 1) * self.SEGMENT_LENGTH) for i in range(count)]
+
+    def _v(self, position, repeat):
+        """Coordenada de textura continua entre tramos"""
+        return (position + self.LENGTH / 2) / repeat
+
+    def update(self, camera_y):
+        """Acompaña a la cámara con un único setY (costo O(1) por frame)"""
+        self.root.setY(camera_y - camera_y % self.ROAD_LINE_SPACING)
+
+    def cleanup(self):
+        """Elimina la geometría del pasillo"""
+        if self.root:
+            self.root.removeNode()
+            self.root = None
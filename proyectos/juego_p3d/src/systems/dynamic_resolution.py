@@ -0,0 +1,158 @@
+"""
+DynamicResolution - Escena 3D a resolución variable según el tiempo por frame
+Responsabilidades:
+- Dibujar la cámara 3D en un buffer offscreen del tamaño de la ventana,
+  usando solo una fracción (escala) de su área
+- Estirar esa fracción a toda la ventana con una tarjeta en render2d
+  (el HUD de aspect2d sigue a resolución nativa)
+- Ajustar la escala para sostener un tiempo por frame objetivo, dentro de límites
+- Cambiar la escala sin recrear el buffer: solo se mueve la display region
+"""
+
+import math
+
+from panda3d.core import CardMaker, ClockObject, SamplerState, Texture, TextureStage
+
+
+class DynamicResolution:
+    TARGET_MS = 1000.0 / 60
+    MIN_SCALE = 0.5
+    MAX_SCALE = 1.0
+    # Frames que se promedian antes de decidir
+    SAMPLE_FRAMES = 30
+    # Más lento que objetivo * (1 + TOLERANCE) baja la escala
+    TOLERANCE = 0.1
+    # Subida lenta: STEP por vez y solo después de UPGRADE_WINDOWS ventanas buenas
+    STEP = 0.05
+    UPGRADE_WINDOWS = 3
+
+    def __init__(self, base, target_ms=TARGET_MS, min_scale=MIN_SCALE, max_scale=MAX_SCALE):
+        self.base = base
+        self.clock = ClockObject.getGlobalClock()
+        self.target_ms = target_ms
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.scale = max_scale
+        self.enabled = False
+
+        self.buffer = None
+        self.region = None
+        self.card = None
+        self.texture = None
+        # Display regions de la ventana que dibujaban la cámara 3D
+        self.window_regions = []
+
+        self.samples = 0
+        self.sample_time = 0.0
+        self.good_windows = 0
+
+    # ========== ENCENDIDO ==========
+
+    def set_enabled(self, enabled):
+        if enabled and not self.enabled:
+            self.enabled = self._enable()
+        elif not enabled and self.enabled:
+            self._disable()
+            self.enabled = False
+
+    def _enable(self):
+        win = self.base.win
+        if not win or not win.getGsg():
+            return False
+        width, height = win.getXSize(), win.getYSize()
+
+        self.texture = Texture('dynamic_resolution')
+        self.buffer = win.makeTextureBuffer('dynamic_resolution', width, height, self.texture, False)
+        if self.buffer is None:
+            print("Resolución dinámica no disponible: no se pudo crear el buffer")
+            return False
+        self.texture.setMinfilter(SamplerState.FT_linear)
+        self.texture.setMagfilter(SamplerState.FT_linear)
+        self.texture.setWrapU(SamplerState.WM_clamp)
+        self.texture.setWrapV(SamplerState.WM_clamp)
+        # Se dibuja antes que la ventana, con el mismo color de fondo
+        self.buffer.setSort(-10)
+        self.buffer.setClearColorActive(True)
+        self.buffer.setClearColor(self.base.getBackgroundColor())
+
+        self.region = self.buffer.makeDisplayRegion()
+        self.region.setCamera(self.base.cam)
+        self.window_regions = [win.getDisplayRegion(i) for i in range(win.getNumDisplayRegions())
+                               if win.getDisplayRegion(i).getCamera() == self.base.cam]
+        for region in self.window_regions:
+            region.setActive(False)
+
+        cm = CardMaker('dynamic_resolution')
+        cm.setFrameFullscreenQuad()
+        self.card = self.base.render2d.attachNewNode(cm.generate())
+        self.card.setTexture(self.texture)
+        # Debajo de todo el HUD
+        self.card.setBin('background', -100)
+        self.card.setDepthTest(False)
+        self.card.setDepthWrite(False)
+
+        self._apply_scale()
+        return True
+
+    def _disable(self):
+        for region in self.window_regions:
+            region.setActive(True)
+        self.window_regions = []
+        if self.card:
+            self.card.removeNode()
+            self.card = None
+        if self.buffer:
+            self.base.graphicsEngine.removeWindow(self.buffer)
+            self.buffer = None
+        self.region = None
+        self.texture = None
+
+    # ========== ESCALA ==========
+
+    def set_scale(self, scale):
+        self.scale = max(self.min_scale, min(self.max_scale, scale))
+        if self.enabled:
+            self._apply_scale()
+
+    def _apply_scale(self):
+        """La escena ocupa la esquina inferior izquierda del buffer; la tarjeta lee solo eso"""
+        self.region.setDimensions(0, self.scale, 0, self.scale)
+        u = self.region.getPixelWidth() / self.texture.getXSize()
+        v = self.region.getPixelHeight() / self.texture.getYSize()
+        self.card.setTexScale(TextureStage.getDefault(), u, v)
+
+    def update(self):
+        """Acumula el tiempo por frame y ajusta la escala cada SAMPLE_FRAMES frames"""
+        if not self.enabled:
+            return
+        win = self.base.win
+        if (win.getXSize(), win.getYSize()) != (self.buffer.getXSize(), self.buffer.getYSize()):
+            # Cambió el tamaño de la ventana: el buffer se vuelve a crear a la medida
+            self._disable()
+            self.enabled = self._enable()
+            return
+
+        self.samples += 1
+        self.sample_time += self.clock.getDt()
+        if self.samples < self.SAMPLE_FRAMES:
+            return
+        frame_ms = self.sample_time / self.samples * 1000.0
+        self.samples = 0
+        self.sample_time = 0.0
+
+        if frame_ms > self.target_ms * (1 + self.TOLERANCE):
+            # El costo de fill-rate va con la cantidad de píxeles (escala al cuadrado)
+            self.good_windows = 0
+            self.set_scale(self.scale * math.sqrt(self.target_ms / frame_ms))
+        elif frame_ms <= self.target_ms * (1 + self.TOLERANCE / 2):
+            # Con vsync el frame nunca baja del objetivo: "en objetivo" ya cuenta como margen
+            self.good_windows += 1
+            if self.good_windows >= self.UPGRADE_WINDOWS and self.scale < self.max_scale:
+                self.good_windows = 0
+                self.set_scale(self.scale + self.STEP)
+        else:
+            self.good_windows = 0
+
+    def cleanup(self):
+        self.set_enabled(False)
+
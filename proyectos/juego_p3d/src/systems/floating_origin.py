@@ -0,0 +1,56 @@
+"""
+FloatingOrigin - Origen flotante para partidas sin fin
+Responsabilidades:
+- Vigilar la coordenada Y de la cámara (el pasillo avanza siempre hacia +Y)
+- Cuando se aleja demasiado, correr la cámara hacia atrás de una sola vez
+- Avisar el corrimiento a cada sistema para que mueva lo suyo en el mismo frame
+- Llevar el desplazamiento acumulado (distancia real recorrida)
+"""
+
+
+class FloatingOrigin:
+    # Hasta acá float32 tiene precisión de sobra (~0.0001 u)
+    THRESHOLD = 2000.0
+    # El corrimiento es múltiplo del largo de chunk (10) y del espaciado de
+    # las líneas del pasillo (8): así los índices de chunk y el pasillo no saltan
+    STEP = 40.0
+
+    def __init__(self, base, threshold=THRESHOLD, step=STEP):
+        self.base = base
+        self.threshold = threshold
+        self.step = step
+        self.offset = 0.0
+        self.shifts = 0
+        self.listeners = []
+
+    def add_listener(self, callback):
+        """callback(shift) se llama después de correr la cámara shift unidades hacia -Y"""
+        if callback not in self.listeners:
+            self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def world_y(self, y):
+        """Coordenada Y sin corrimientos (para distancias o estadísticas)"""
+        return y + self.offset
+
+    def update(self):
+        """Recentra si la cámara pasó el umbral. Devuelve el corrimiento (0 si no hubo)"""
+        camera_y = self.base.camera.getY()
+        if camera_y < self.threshold:
+            return 0.0
+
+        shift = camera_y - camera_y % self.step
+        if shift <= 0:
+            return 0.0
+        self.base.camera.setY(camera_y - shift)
+        self.offset += shift
+        self.shifts += 1
+        for callback in list(self.listeners):
+            callback(shift)
+        return shift
+
+    def cleanup(self):
+        self.listeners.clear()
@@ -0,0 +1,584 @@
+"""
+FxEngine - Motor único de partículas para roturas y power-ups
+Responsabilidades:
+- Mantener un pool fijo de partículas en un solo GeomVertexData (un draw call)
+- Actualizar posiciones, giro y desvanecido de todas las partículas en bloque cada frame
+- Exponer emisores por tipo de efecto: emit_burst(kind, pos, count)
+- Evitar crear nodos o intervalos por cada fragmento
+- Modo horneado: trayectorias precalculadas en una textura y animadas en el
+  vertex shader (cada ráfaga es un draw call, sin trabajo por fragmento en CPU)
+"""
+
+import math
+import random
+from array import array
+
+import heapq
+
+from panda3d.core import (
+    ClockObject, Geom, GeomEnums, GeomNode, GeomTriangles, GeomVertexArrayFormat,
+    GeomVertexData, GeomVertexFormat, GeomVertexWriter, InternalName, NodePath,
+    OmniBoundingVolume, Shader, Texture,
+)
+
+from src.systems.billboard import FOG_GLSL, BillboardFactory, get_billboard_factory
+from src.systems.quality import PRESETS
+from src.systems.transparency import get_transparency_policy
+
+
+# Cada partícula son dos triángulos sin índices (6 vértices) para poder
+# dibujar solo las vivas ajustando la cantidad de vértices
+VERTICES_PER_PARTICLE = 6
+# x, y, z, r, g, b, a, u, v, esquina x, esquina z
+FLOATS_PER_VERTEX = 11
+FLOATS_PER_PARTICLE = VERTICES_PER_PARTICLE * FLOATS_PER_VERTEX
+CORNER_ORDER = (0, 1, 2, 0, 2, 3)
+
+# Tipos de efecto. Velocidades en unidades/segundo, giro en grados/segundo.
+FX_KINDS = {
+    # Fragmentos de fantasma: se dispersan hacia adelante y se desvanecen
+    'ghost_shard': {
+        'region': 'fantasma',
+        'count_key': 'ghost_shards',
+        'fallback_color': (0.3, 0.7, 0.95, 0.85),
+        'color': (1, 1, 1, 0.7),
+        'size': (0.15, 0.35),
+        'aspect': 1.0,
+        'life': 1.2,
+        'velocity': ((-1.7, 1.7), (0.4, 1.7), (-0.8, 1.7)),
+        'gravity': 0.0,
+        'spin': (0, 0),
+        'fade': True,
+    },
+    # Trozos de barrera repartidos a lo largo de la barra y girando
+    'barrier_shard': {
+        'region': 'white',
+        'count_key': 'barrier_shards',
+        'color': (0.0, 0.3, 0.7, 1.0),
+        'size': (1.0, 1.8),
+        'aspect': 0.45,
+        'life': 0.8,
+        'spread_x': 6.0,
+        'velocity': ((-1.9, 1.9), (0.0, 2.5), (-1.25, 1.25)),
+        'gravity': 0.0,
+        'spin': (225, 450),
+        'fade': False,
+    },
+    # Chispas del power-up: anillo que se abre en el plano XZ
+    'powerup_spark': {
+        'region': 'white',
+        'count_key': 'powerup_particles',
+        'color': (1.0, 0.9, 0.2, 1.0),
+        'size': (0.15, 0.15),
+        'aspect': 1.0,
+        'life': 0.6,
+        'ring_speed': 3.3,
+        'velocity': ((0, 0), (1.7, 1.7), (0, 0)),
+        'gravity': 0.0,
+        'spin': (0, 0),
+        'fade': False,
+    },
+}
+
+
+BAKED_VERTEX = """
+#version 150
+
+uniform mat4 p3d_ModelViewMatrix;
+uniform mat4 p3d_ProjectionMatrix;
+uniform samplerBuffer trajectories;
+uniform float osg_FrameTime;
+uniform vec4 burst;       // origen (x, y, z) e instante de emisión
+uniform vec4 burst_info;  // fila base, vida, alpha inicial, se desvanece
+uniform vec4 burst_color;
+
+in vec4 p3d_Vertex;
+in vec2 p3d_MultiTexCoord0;
+in vec2 corner;
+in float shard;
+
+out vec2 texcoord;
+out vec4 color;
+out vec3 view_pos;
+
+void main() {
+    // Tres texels por fragmento: (offset, ángulo), (velocidad, giro), (medio tamaño, gravedad)
+    int row = (int(burst_info.x) + int(shard)) * 3;
+    vec4 start = texelFetch(trajectories, row);
+    vec4 motion = texelFetch(trajectories, row + 1);
+    vec4 shape = texelFetch(trajectories, row + 2);
+
+    float t = osg_FrameTime - burst.w;
+    float life = burst_info.y;
+    vec3 center = burst.xyz + start.xyz + motion.xyz * t;
+    center.z -= 0.5 * shape.z * t * t;
+
+    float angle = radians(start.w + motion.w * t);
+    vec2 offset = corner * shape.xy;
+    offset = vec2(offset.x * cos(angle) - offset.y * sin(angle),
+                  offset.x * sin(angle) + offset.y * cos(angle));
+    // Terminada la vida el fragmento colapsa a un punto
+    offset *= step(t, life);
+
+    vec4 view = p3d_ModelViewMatrix * vec4(center, 1.0);
+    view.xy += offset;
+    gl_Position = p3d_ProjectionMatrix * view;
+    texcoord = p3d_MultiTexCoord0;
+    // El alpha inicial viene en burst_info.z; burst_color solo aporta el tono
+    color = vec4(burst_color.rgb, burst_info.z * mix(1.0, clamp(1.0 - t / life, 0.0, 1.0), burst_info.w));
+    view_pos = view.xyz;
+}
+"""
+
+BAKED_FRAGMENT = """
+#version 150
+
+uniform sampler2D p3d_Texture0;
+uniform vec4 p3d_ColorScale;
+
+in vec2 texcoord;
+in vec4 color;
+in vec3 view_pos;
+
+out vec4 p3d_FragColor;
+""" + FOG_GLSL + """
+void main() {
+    p3d_FragColor = apply_fog(texture(p3d_Texture0, texcoord) * color * p3d_ColorScale, view_pos);
+}
+"""
+
+
+def kind_region(config, atlas):
+    """Región del atlas y color de un tipo de efecto (sin la región, un color plano)"""
+    if atlas.has(config['region']):
+        return config['region'], config['color']
+    return 'white', config.get('fallback_color', config['color'])
+
+
+def shard_trajectory(config, i, count, rng=random):
+    """
+    Trayectoria del fragmento i de una ráfaga de count fragmentos:
+    (desplazamiento en x, velocidad, giro, ángulo inicial, medio ancho, medio alto).
+    La usan tanto la simulación en CPU como las variantes horneadas.
+    """
+    (vx0, vx1), (vy0, vy1), (vz0, vz1) = config['velocity']
+    vx = rng.uniform(vx0, vx1)
+    vy = rng.uniform(vy0, vy1)
+    vz = rng.uniform(vz0, vz1)
+
+    offset_x = 0.0
+    spread = config.get('spread_x', 0.0)
+    if spread and count > 1:
+        offset_x = -spread + 2 * spread * i / (count - 1)
+        # Cada trozo se aleja hacia su lado
+        vx = offset_x * 0.3
+    ring_speed = config.get('ring_speed')
+    if ring_speed:
+        angle = (i / count) * 2 * math.pi
+        vx = math.cos(angle) * ring_speed
+        vz = math.sin(angle) * ring_speed
+
+    half = rng.uniform(*config['size'])
+    spin = rng.uniform(*config['spin'])
+    angle = rng.uniform(0, 360) if spin else 0.0
+    return offset_x, (vx, vy, vz), spin, angle, half, half * config['aspect']
+
+
+def fx_format():
+    """Un solo arreglo de floats: se puede copiar entero de una vez"""
+    array_format = GeomVertexArrayFormat()
+    array_format.addColumn(InternalName.getVertex(), 3, Geom.NT_float32, Geom.C_point)
+    array_format.addColumn(InternalName.getColor(), 4, Geom.NT_float32, Geom.C_color)
+    array_format.addColumn(InternalName.getTexcoord(), 2, Geom.NT_float32, Geom.C_texcoord)
+    array_format.addColumn(InternalName.make('corner'), 2, Geom.NT_float32, Geom.C_other)
+    return GeomVertexFormat.registerFormat(GeomVertexFormat(array_format))
+
+
+def baked_format():
+    """Vértices de las ráfagas horneadas: esquina unitaria, UV e índice de fragmento"""
+    array_format = GeomVertexArrayFormat()
+    array_format.addColumn(InternalName.getVertex(), 3, Geom.NT_float32, Geom.C_point)
+    array_format.addColumn(InternalName.getTexcoord(), 2, Geom.NT_float32, Geom.C_texcoord)
+    array_format.addColumn(InternalName.make('corner'), 2, Geom.NT_float32, Geom.C_other)
+    array_format.addColumn(InternalName.make('shard'), 1, Geom.NT_float32, Geom.C_other)
+    return GeomVertexFormat.registerFormat(GeomVertexFormat(array_format))
+
+
+class FxEngine:
+    MODE_CPU = 'cpu'
+    MODE_BAKED = 'baked'
+    CAPACITY = 512
+
+    def __init__(self, base, capacity=CAPACITY, mode=None):
+        self.base = base
+        self.capacity = capacity
+        self.billboards = get_billboard_factory(base)
+        self.atlas = self.billboards.atlas
+        if mode is None:
+            mode = self.MODE_BAKED if BakedBursts.supported(base, self.billboards) else self.MODE_CPU
+        self.mode = mode
+        self.baked = BakedBursts(base, self.atlas) if mode == self.MODE_BAKED else None
+        # Sin shader las esquinas se suman en la CPU sobre el plano XZ
+        # (la cámara siempre mira hacia +Y)
+        self.cpu_corners = self.billboards.mode != BillboardFactory.MODE_SHADER
+
+        # Estado por partícula: [x, y, z, vx, vy, vz, edad, vida, alpha, desvanece,
+        #                        gravedad, ángulo, giro, medio ancho, medio alto]
+        self.particles = []
+        self.buffer = array('f', bytes(4 * FLOATS_PER_PARTICLE * capacity))
+        self.dropped = 0
+
+        self.vdata = GeomVertexData('fx', fx_format(), Geom.UH_dynamic)
+        self.vdata.uncleanSetNumRows(capacity * VERTICES_PER_PARTICLE)
+        tris = GeomTriangles(Geom.UH_dynamic)
+        tris.setNonindexedVertices(0, 0)
+        geom = Geom(self.vdata)
+        geom.addPrimitive(tris)
+        self.geom_node = GeomNode('fx')
+        self.geom_node.addGeom(geom)
+        # Las partículas están repartidas por todo el pasillo
+        self.geom_node.setBounds(OmniBoundingVolume())
+        self.geom_node.setFinal(True)
+
+        self.node = self.base.render.attachNewNode(self.geom_node)
+        self.node.setTexture(self.atlas.texture)
+        if not self.cpu_corners:
+            self.node.setShader(self.billboards.shader)
+        self.node.setLightOff()
+        self.apply_transparency()
+        self.node.detachNode()
+
+    def apply_transparency(self):
+        # Un solo Geom para todo: mezcla real porque hay fragmentos que se desvanecen
+        get_transparency_policy(self.base).apply(self.node, 'white', fading=True)
+        if self.baked is not None:
+            self.baked.apply_transparency()
+
+    # ========== EMISORES ==========
+
+    def emit_burst(self, kind, pos, count):
+        """Lanza count partículas del tipo kind desde pos (coordenadas de render)"""
+        if self.baked is not None and self.baked.emit(kind, pos, count):
+            return
+
+        config = FX_KINDS[kind]
+        if not self.node.hasParent():
+            self.node.reparentTo(self.base.render)
+
+        region, color = kind_region(config, self.atlas)
+        for i in range(count):
+            if len(self.particles) >= self.capacity:
+                self.dropped += count - i
+                return
+
+            offset_x, vel, spin, angle, hw, hh = shard_trajectory(config, i, count)
+            self._add(region, color, (pos[0] + offset_x, pos[1], pos[2]), vel,
+                      config['life'], config['fade'], config['gravity'],
+                      angle, spin, hw, hh)
+
+    def _add(self, region, color, pos, vel, life, fade, gravity, angle, spin, hw, hh):
+        index = len(self.particles)
+        self.particles.append([pos[0], pos[1], pos[2], vel[0], vel[1], vel[2],
+                               0.0, life, color[3], fade, gravity, angle, spin, hw, hh])
+
+        u0, v0, u1, v1 = self.atlas.uv(region)
+        corners = ((-hw, -hh, u0, v0), (hw, -hh, u1, v0), (hw, hh, u1, v1), (-hw, hh, u0, v1))
+        start = index * FLOATS_PER_PARTICLE
+        for k, corner_index in enumerate(CORNER_ORDER):
+            cx, cz, u, v = corners[corner_index]
+            offset = start + k * FLOATS_PER_VERTEX
+            self.buffer[offset:offset + FLOATS_PER_VERTEX] = array(
+                'f', (pos[0], pos[1], pos[2], color[0], color[1], color[2], color[3], u, v, cx, cz))
+        if spin:
+            self._write_corners(index, angle, hw, hh)
+        self._write_center(index, pos[0], pos[1], pos[2])
+
+    # ========== ACTUALIZACIÓN ==========
+
+    def update(self, dt):
+        """Integra todas las partículas y sube el buffer completo de una vez"""
+        if self.baked is not None:
+            self.baked.update()
+        if not self.particles:
+            if self.node.hasParent() and not self.node.isHidden():
+                self.node.hide()
+            return
+
+        buffer = self.buffer
+        stride = FLOATS_PER_VERTEX
+        i = 0
+        while i < len(self.particles):
+            p = self.particles[i]
+            p[6] += dt
+            if p[6] >= p[7]:
+                self._remove(i)
+                continue
+
+            p[5] -= p[10] * dt
+            p[0] += p[3] * dt
+            p[1] += p[4] * dt
+            p[2] += p[5] * dt
+            if p[12]:
+                p[11] += p[12] * dt
+                self._write_corners(i, p[11], p[13], p[14])
+            self._write_center(i, p[0], p[1], p[2])
+            if p[9]:
+                start = i * FLOATS_PER_PARTICLE
+                alpha = p[8] * (1.0 - p[6] / p[7])
+                buffer[start + 6:start + FLOATS_PER_PARTICLE:stride] = array(
+                    'f', (alpha,) * VERTICES_PER_PARTICLE)
+            i += 1
+
+        count = len(self.particles)
+        used = count * FLOATS_PER_PARTICLE
+        if used:
+            view = memoryview(self.vdata.modifyArray(0)).cast('B').cast('f')
+            view[:used] = buffer[:used]
+        self.geom_node.modifyGeom(0).modifyPrimitive(0).setNonindexedVertices(
+            0, count * VERTICES_PER_PARTICLE)
+        if count:
+            self.node.show()
+        else:
+            self.node.hide()
+
+    def _write_center(self, index, x, y, z):
+        """Escribe la posición de los 6 vértices de una partícula"""
+        start = index * FLOATS_PER_PARTICLE
+        end = start + FLOATS_PER_PARTICLE
+        stride = FLOATS_PER_VERTEX
+        buffer = self.buffer
+        if self.cpu_corners:
+            buffer[start:end:stride] = array('f', [x + cx for cx in buffer[start + 9:end:stride]])
+            buffer[start + 2:end:stride] = array('f', [z + cz for cz in buffer[start + 10:end:stride]])
+        else:
+            buffer[start:end:stride] = array('f', (x,) * VERTICES_PER_PARTICLE)
+            buffer[start + 2:end:stride] = array('f', (z,) * VERTICES_PER_PARTICLE)
+        buffer[start + 1:end:stride] = array('f', (y,) * VERTICES_PER_PARTICLE)
+
+    def _write_corners(self, index, angle, hw, hh):
+        """Rota las esquinas en el plano de la pantalla"""
+        rad = math.radians(angle)
+        c, s = math.cos(rad), math.sin(rad)
+        corners = [(x * c - z * s, x * s + z * c)
+                   for x, z in ((-hw, -hh), (hw, -hh), (hw, hh), (-hw, hh))]
+        start = index * FLOATS_PER_PARTICLE
+        end = start + FLOATS_PER_PARTICLE
+        self.buffer[start + 9:end:FLOATS_PER_VERTEX] = array(
+            'f', [corners[k][0] for k in CORNER_ORDER])
+        self.buffer[start + 10:end:FLOATS_PER_VERTEX] = array(
+            'f', [corners[k][1] for k in CORNER_ORDER])
+
+    def _remove(self, index):
+        """Saca una partícula moviendo la última a su lugar (las vivas quedan contiguas)"""
+        last = len(self.particles) - 1
+        if index != last:
+            self.particles[index] = self.particles[last]
+            dst = index * FLOATS_PER_PARTICLE
+            src = last * FLOATS_PER_PARTICLE
+            self.buffer[dst:dst + FLOATS_PER_PARTICLE] = self.buffer[src:src + FLOATS_PER_PARTICLE]
+        self.particles.pop()
+
+    def rebase(self, shift):
+        """Corre todas las partículas shift unidades hacia -Y; update reescribe el buffer"""
+        for p in self.particles:
+            p[1] -= shift
+        if self.baked is not None:
+            self.baked.rebase(shift)
+
+    def active_count(self):
+        baked = self.baked.active_count() if self.baked is not None else 0
+        return len(self.particles) + baked
+
+    def clear(self):
+        """Elimina todas las partículas y saca el nodo de la escena"""
+        if self.baked is not None:
+            self.baked.clear()
+        self.particles.clear()
+        self.geom_node.modifyGeom(0).modifyPrimitive(0).setNonindexedVertices(0, 0)
+        self.node.detachNode()
+
+
+class BakedBursts:
+    """
+    Ráfagas con trayectorias horneadas. Para cada tipo y cantidad de fragmentos
+    se precalculan VARIANTS ráfagas distintas en una buffer texture; emitir es
+    crear un nodo con el Geom compartido y cuatro uniforms. El vertex shader
+    calcula posición, giro y desvanecido a partir del tiempo transcurrido.
+    """
+    # Texels RGBA32F por fragmento
+    ROW_TEXELS = 3
+    ROW_FLOATS = ROW_TEXELS * 4
+    # Variantes por (tipo, cantidad) y lugar total en la textura (en fragmentos)
+    VARIANTS = 16
+    CAPACITY = 4096
+    MAX_BURSTS = 128
+
+    def __init__(self, base, atlas, seed=7):
+        self.base = base
+        self.atlas = atlas
+        self.clock = ClockObject.getGlobalClock()
+        self.rng = random.Random(seed)
+        self.format = baked_format()
+
+        self.data = Texture('fx_trajectories')
+        self.data.setupBufferTexture(self.CAPACITY * self.ROW_TEXELS, Texture.T_float,
+                                     Texture.F_rgba32, GeomEnums.UH_static)
+        self.used_rows = 0
+        # (tipo, cantidad) -> (fila base, Geom con count quads)
+        self.layouts = {}
+        # Montículo de (instante de fin, orden, nodo, cantidad, origen) para retirar ráfagas
+        self.bursts = []
+        self.sequence = 0
+        self.shards = 0
+        self.dropped = 0
+
+        self.root = NodePath('fx_baked')
+        self.root.setTexture(atlas.texture)
+        self.root.setShader(Shader.make(Shader.SL_GLSL, BAKED_VERTEX, BAKED_FRAGMENT))
+        self.root.setShaderInput('trajectories', self.data)
+        self.root.setLightOff()
+        self.apply_transparency()
+
+        # Las cantidades de los presets se hornean de entrada
+        for kind, config in FX_KINDS.items():
+            for count in sorted({preset[config['count_key']] for preset in PRESETS.values()}):
+                self._layout(kind, count)
+
+    @staticmethod
+    def supported(base, billboards=None):
+        """True si hay shaders y buffer textures"""
+        billboards = billboards or get_billboard_factory(base)
+        if billboards.mode != BillboardFactory.MODE_SHADER:
+            return False
+        gsg = base.win.getGsg() if base.win else None
+        return bool(gsg and gsg.getSupportsBufferTexture())
+
+    def apply_transparency(self):
+        get_transparency_policy(self.base).apply(self.root, 'white', fading=True)
+
+    # ========== HORNEADO ==========
+
+    def _layout(self, kind, count):
+        """Fila base y Geom de (kind, count); los hornea la primera vez si hay lugar"""
+        key = (kind, count)
+        if key in self.layouts:
+            return self.layouts[key]
+        rows = self.VARIANTS * count
+        if self.used_rows + rows > self.CAPACITY:
+            return None
+
+        config = FX_KINDS[kind]
+        base_row = self.used_rows
+        values = array('f')
+        for _ in range(self.VARIANTS):
+            for i in range(count):
+                offset_x, vel, spin, angle, hw, hh = shard_trajectory(config, i, count, self.rng)
+                values.extend((offset_x, 0.0, 0.0, angle,
+                               vel[0], vel[1], vel[2], spin,
+                               hw, hh, config['gravity'], 0.0))
+        start = base_row * self.ROW_FLOATS
+        image = memoryview(self.data.modifyRamImage()).cast('B').cast('f')
+        image[start:start + len(values)] = values
+        self.used_rows += rows
+
+        region, _ = kind_region(config, self.atlas)
+        self.layouts[key] = (base_row, self._build_geom(count, region))
+        return self.layouts[key]
+
+    def _build_geom(self, count, region):
+        """count quads con esquinas unitarias; el shader los escala y ubica"""
+        vdata = GeomVertexData('fx_burst', self.format, Geom.UH_static)
+        vdata.uncleanSetNumRows(count * 4)
+        vertex = GeomVertexWriter(vdata, 'vertex')
+        texcoord = GeomVertexWriter(vdata, 'texcoord')
+        corner = GeomVertexWriter(vdata, 'corner')
+        shard = GeomVertexWriter(vdata, 'shard')
+        tris = GeomTriangles(Geom.UH_static)
+
+        u0, v0, u1, v1 = self.atlas.uv(region)
+        for i in range(count):
+            for cx, cz, u, v in ((-1, -1, u0, v0), (1, -1, u1, v0), (1, 1, u1, v1), (-1, 1, u0, v1)):
+                vertex.addData3(0, 0, 0)
+                texcoord.addData2(u, v)
+                corner.addData2(cx, cz)
+                shard.addData1(i)
+            first = i * 4
+            tris.addVertices(first, first + 1, first + 2)
+            tris.addVertices(first, first + 2, first + 3)
+
+        geom = Geom(vdata)
+        geom.addPrimitive(tris)
+        return geom
+
+    # ========== RÁFAGAS ==========
+
+    def emit(self, kind, pos, count):
+        """Crea la ráfaga; False si no se pudo hornear y debe simularse en CPU"""
+        layout = self._layout(kind, count)
+        if layout is None:
+            return False
+        if len(self.bursts) >= self.MAX_BURSTS:
+            self.dropped += count
+            return True
+
+        base_row, geom = layout
+        config = FX_KINDS[kind]
+        _, color = kind_region(config, self.atlas)
+        now = self.clock.getFrameTime()
+
+        geom_node = GeomNode(f'fx_{kind}')
+        geom_node.addGeom(geom)
+        # Los vértices están en el origen: el shader los mueve por el pasillo
+        geom_node.setBounds(OmniBoundingVolume())
+        geom_node.setFinal(True)
+        node = self.root.attachNewNode(geom_node)
+        origin = (pos[0], pos[1], pos[2], now)
+        node.setShaderInput('burst', origin)
+        node.setShaderInput('burst_info', (base_row + self.rng.randrange(self.VARIANTS) * count,
+                                           config['life'], color[3], 1.0 if config['fade'] else 0.0))
+        node.setShaderInput('burst_color', color)
+
+        if not self.root.hasParent():
+            self.root.reparentTo(self.base.render)
+        heapq.heappush(self.bursts, (now + config['life'], self.sequence, node, count, origin))
+        self.sequence += 1
+        self.shards += count
+        return True
+
+    def update(self):
+        """Retira las ráfagas terminadas; no hay trabajo por fragmento"""
+        now = self.clock.getFrameTime()
+        while self.bursts and self.bursts[0][0] <= now:
+            _, _, node, count, _ = heapq.heappop(self.bursts)
+            node.removeNode()
+            self.shards -= count
+
+    def rebase(self, shift):
+        """Corre el origen de cada ráfaga viva shift unidades hacia -Y"""
+        for i, (end, sequence, node, count, origin) in enumerate(self.bursts):
+            x, y, z, start = origin
+            origin = (x, y - shift, z, start)
+            node.setShaderInput('burst', origin)
+            # Mismo instante de fin y orden: el montículo sigue válido
+            self.bursts[i] = (end, sequence, node, count, origin)
+
+    def active_count(self):
+        return self.shards
+
+    def clear(self):
+        for _, _, node, _, _ in self.bursts:
+            node.removeNode()
+        self.bursts.clear()
+        self.shards = 0
+        self.root.detachNode()
+
+
+_fx_engine = None
+
+
+def get_fx_engine(base):
+    """Motor único del proceso; el nodo entra a la escena con el primer efecto"""
+    global _fx_engine
+    if _fx_engine is None:
+        _fx_engine = FxEngine(base)
+    return _fx_engine
@@ -0,0 +1,213 @@
+"""
+GhostRenderer - Dibujo instanciado de todos los fantasmas
+Responsabilidades:
+- Dibujar todos los fantasmas vivos con un solo quad y un solo draw call (setInstanceCount)
+- Guardar origen, vaivén, fase y tinte de cada instancia en una buffer texture,
+  una sola vez al agregarla: el vaivén lo calcula el vertex shader con osg_FrameTime
+- Compactar la buffer texture al sacar una instancia (sin recorrer las demás en Python)
+- Correr la Y de todas las filas en una pasada cuando se recentra el origen del mundo
+- Indicar si la placa soporta instancing; si no, los fantasmas usan su propio sprite
+"""
+
+import math
+import random
+from array import array
+
+from panda3d.core import (
+    GeomEnums, OmniBoundingVolume, Shader, Texture,
+)
+
+from src.systems.billboard import FOG_GLSL, BillboardFactory, get_billboard_factory
+from src.systems.transparency import get_transparency_policy
+
+
+GHOST_VERTEX = """
+#version 150
+
+uniform mat4 p3d_ModelViewMatrix;
+uniform mat4 p3d_ProjectionMatrix;
+uniform samplerBuffer instance_data;
+uniform float instance_count;
+uniform float osg_FrameTime;
+
+in vec4 p3d_Vertex;
+in vec2 p3d_MultiTexCoord0;
+in vec2 corner;
+
+out vec2 texcoord;
+out vec4 tint;
+out vec3 view_pos;
+
+void main() {
+    // Las filas van de la más vieja (cerca) a la más nueva (lejos): se dibujan al revés
+    int instance = int(instance_count) - 1 - gl_InstanceID;
+    // Tres texels por instancia: (x, y, z, fase), (dx, dz, período, comienzo) y (r, g, b, a)
+    vec4 row = texelFetch(instance_data, instance * 3);
+    vec4 sway = texelFetch(instance_data, instance * 3 + 1);
+    tint = texelFetch(instance_data, instance * 3 + 2);
+
+    // Vaivén de GhostMotion: onda triangular 0 -> 1 -> 0 entre origen y destino
+    float weight = 1.0 - abs(1.0 - 2.0 * fract((osg_FrameTime - sway.w) / sway.z));
+    vec3 center = row.xyz + vec3(sway.x, 0.0, sway.y) * weight;
+    center.z += 0.08 * sin(osg_FrameTime * 2.0 + row.w);
+
+    vec4 view = p3d_ModelViewMatrix * vec4(center, 1.0);
+    view.xy += corner;
+    gl_Position = p3d_ProjectionMatrix * view;
+    texcoord = p3d_MultiTexCoord0;
+    view_pos = view.xyz;
+}
+"""
+
+GHOST_FRAGMENT = """
+#version 150
+
+uniform sampler2D p3d_Texture0;
+uniform vec4 p3d_ColorScale;
+
+in vec2 texcoord;
+in vec4 tint;
+in vec3 view_pos;
+
+out vec4 p3d_FragColor;
+""" + FOG_GLSL + """
+void main() {
+    p3d_FragColor = apply_fog(texture(p3d_Texture0, texcoord) * tint * p3d_ColorScale, view_pos);
+}
+"""
+
+
+class GhostRenderer:
+    # Texels RGBA32F por instancia
+    ROW_TEXELS = 3
+    ROW_FLOATS = ROW_TEXELS * 4
+    CAPACITY = 128
+    FRAME = (-0.8, 0.8, -0.8, 0.8)
+
+    def __init__(self, base, parent=None, capacity=CAPACITY):
+        self.base = base
+        self.billboards = get_billboard_factory(base)
+        self.enabled = self.supported(base, self.billboards)
+
+        if self.billboards.atlas.has('fantasma'):
+            self.region = 'fantasma'
+            self.default_tint = (1, 1, 1, 1)
+        else:
+            self.region = 'white'
+            self.default_tint = (0.3, 0.7, 0.95, 0.75)
+
+        # ids de los fantasmas en el orden de sus filas
+        self.order = []
+        self.dirty = False
+        self.capacity = 0
+        self.node = None
+        self.data = None
+        if not self.enabled:
+            return
+
+        self.data = Texture('ghost_instances')
+        self._allocate(capacity)
+
+        geom_node = self.billboards.build_geom_node(
+            'ghosts', [((0, 0, 0), self.FRAME, self.region, (1, 1, 1, 1))])
+        self.node = (parent if parent is not None else base.render).attachNewNode(geom_node)
+        # Las instancias están repartidas por todo el pasillo
+        self.node.node().setBounds(OmniBoundingVolume())
+        self.node.node().setFinal(True)
+        self.node.setTexture(self.billboards.atlas.texture)
+        self.node.setShader(Shader.make(Shader.SL_GLSL, GHOST_VERTEX, GHOST_FRAGMENT))
+        self.node.setShaderInput('instance_data', self.data)
+        self.node.setShaderInput('instance_count', 0.0)
+        self.node.setLightOff()
+        self.apply_transparency()
+        self.node.hide()
+
+    def apply_transparency(self):
+        """Alpha test si el sprite es binario; mezcla si el tinte es translúcido"""
+        self.mode = get_transparency_policy(self.base).apply(
+            self.node, self.region, fading=self.default_tint[3] < 1)
+
+    @staticmethod
+    def supported(base, billboards=None):
+        """True si hay shaders, instancing y buffer textures"""
+        billboards = billboards or get_billboard_factory(base)
+        if billboards.mode != BillboardFactory.MODE_SHADER:
+            return False
+        gsg = base.win.getGsg() if base.win else None
+        return bool(gsg and gsg.getSupportsGeometryInstancing()
+                    and gsg.getSupportsBufferTexture())
+
+    def _allocate(self, capacity):
+        """(Re)crea la buffer texture con lugar para capacity instancias, conservando las filas"""
+        used = len(self.order) * self.ROW_FLOATS * 4
+        old = bytes(memoryview(self.data.getRamImage())[:used]) if self.capacity else b''
+        self.capacity = capacity
+        self.data.setupBufferTexture(capacity * self.ROW_TEXELS, Texture.T_float,
+                                     Texture.F_rgba32, GeomEnums.UH_dynamic)
+        if old:
+            memoryview(self.data.modifyRamImage()).cast('B')[:used] = old
+
+    # ========== INSTANCIAS ==========
+
+    def add(self, ghost, tint=None):
+        """
+        Registra un fantasma y escribe su fila una sola vez: origen y vaivén
+        salen de ghost.motion_params() y el shader los anima solo
+        """
+        if not self.enabled:
+            return False
+        if len(self.order) >= self.capacity:
+            self._allocate(self.capacity * 2)
+        origin, delta_x, delta_z, period, start = ghost.motion_params()
+        offset = len(self.order) * self.ROW_FLOATS
+        rows = memoryview(self.data.modifyRamImage()).cast('B').cast('f')
+        rows[offset:offset + self.ROW_FLOATS] = array('f', (
+            origin.x, origin.y, origin.z, random.uniform(0, 2 * math.pi),
+            delta_x, delta_z, period, start) + tuple(tint or self.default_tint))
+        self.order.append(id(ghost))
+        self.dirty = True
+        return True
+
+    def remove(self, ghost):
+        """Saca la fila del fantasma corriendo las siguientes un lugar (una copia en bloque)"""
+        key = id(ghost)
+        if key not in self.order:
+            return
+        index = self.order.index(key)
+        del self.order[index]
+        size = self.ROW_FLOATS * 4
+        rows = memoryview(self.data.modifyRamImage()).cast('B')
+        rows[index * size:len(self.order) * size] = bytes(rows[(index + 1) * size:(len(self.order) + 1) * size])
+        self.dirty = True
+
+    def rebase(self, shift):
+        """
+        Corre todas las instancias shift unidades hacia -Y (origen flotante):
+        las filas guardan Y relativa al origen actual para no perder precisión
+        """
+        if not self.order:
+            return
+        rows = memoryview(self.data.modifyRamImage()).cast('B').cast('f')
+        # La Y es el segundo float de cada fila: una sola asignación con paso
+        column = rows[1:len(self.order) * self.ROW_FLOATS:self.ROW_FLOATS]
+        column[:] = array('f', [y - shift for y in column])
+
+    def update(self):
+        """Ajusta la cantidad de instancias si cambió; el movimiento va en la GPU"""
+        if not self.enabled or not self.dirty:
+            return
+        self.dirty = False
+        count = len(self.order)
+        if count == 0:
+            self.node.hide()
+            return
+        self.node.setShaderInput('instance_count', float(count))
+        self.node.setInstanceCount(count)
+        self.node.show()
+
+    def cleanup(self):
+        self.order.clear()
+        if self.node:
+            self.node.removeNode()
+            self.node = None
+
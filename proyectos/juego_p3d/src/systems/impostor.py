@@ -0,0 +1,92 @@
+"""
+Impostor - Tarjetas pre-renderizadas para objetos lejanos
+Responsabilidades:
+- Renderizar un modelo una sola vez a una textura con una cámara ortográfica
+- Guardar la textura resultante por clave para reutilizarla en cada spawn
+- Crear la tarjeta que reemplaza al modelo completo a distancia
+"""
+
+from panda3d.core import (
+    Camera, CardMaker, NodePath, OrthographicLens, SamplerState, Texture,
+    TransformState,
+)
+
+
+class ImpostorBaker:
+    TEXTURE_SIZE = (256, 32)
+
+    def __init__(self, base):
+        self.base = base
+        self.textures = {}
+
+    def bake(self, key, model, frame, size=TEXTURE_SIZE):
+        """
+        Renderiza model (con su estado heredado: color y luces) visto de frente
+        desde -Y y recortado a frame (x0, x1, z0, z1). Devuelve la textura o
+        None si no hay ventana para renderizar.
+        """
+        if key in self.textures:
+            return self.textures[key]
+        if not self.base.win:
+            return None
+
+        x0, x1, z0, z1 = frame
+        texture = Texture(f"impostor_{key}")
+        buffer = self.base.win.makeTextureBuffer(f"impostor_{key}", size[0], size[1],
+                                                 texture, True)
+        if buffer is None:
+            print(f"No se pudo crear el buffer del impostor {key}")
+            self.textures[key] = None
+            return None
+        buffer.setClearColor((0, 0, 0, 0))
+
+        scene = NodePath(f"impostor_scene_{key}")
+        copy = model.copyTo(scene)
+        copy.setState(model.getNetState())
+        copy.setTransform(TransformState.makeIdentity())
+        # La niebla se aplica a la tarjeta en la escena, no a la textura
+        copy.setFogOff()
+
+        lens = OrthographicLens()
+        lens.setFilmSize(x1 - x0, z1 - z0)
+        lens.setFilmOffset((x0 + x1) / 2, (z0 + z1) / 2)
+        lens.setNearFar(1, 100)
+        camera = scene.attachNewNode(Camera(f"impostor_camera_{key}", lens))
+        camera.setY(-50)
+        buffer.makeDisplayRegion().setCamera(camera)
+
+        self.base.graphicsEngine.renderFrame()
+        self.base.graphicsEngine.removeWindow(buffer)
+        scene.removeNode()
+
+        texture.setMinfilter(SamplerState.FT_linear_mipmap_linear)
+        texture.setMagfilter(SamplerState.FT_linear)
+        texture.setWrapU(SamplerState.WM_clamp)
+        texture.setWrapV(SamplerState.WM_clamp)
+        self.textures[key] = texture
+        return texture
+
+    def make_card(self, key, model, frame, parent):
+        """Tarjeta con la textura del impostor, o None si no se pudo hornear"""
+        texture = self.bake(key, model, frame)
+        if texture is None:
+            return None
+        cm = CardMaker(f"{key}_impostor")
+        cm.setFrame(*frame)
+        card = parent.attachNewNode(cm.generate())
+        card.setTexture(texture)
+        # La luz y el color ya están en la textura
+        card.setLightOff()
+        card.setColor(1, 1, 1, 1)
+        return card
+
+
+_impostor_baker = None
+
+
+def get_impostor_baker(base):
+    """Horneador único del proceso; las texturas sobreviven entre partidas"""
+    global _impostor_baker
+    if _impostor_baker is None:
+        _impostor_baker = ImpostorBaker(base)
+    return _impostor_baker
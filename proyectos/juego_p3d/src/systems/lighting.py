@@ -0,0 +1,117 @@
+"""
+LightBaker - Iluminación horneada en colores de vértice
+Responsabilidades:
+- Leer las luces encendidas en render (ambiente y direccionales) al armar la escena
+- Escribir su aporte en el color de cada vértice de la geometría estática
+- Dejar esa geometría con setLightOff (sin luces en tiempo real)
+- Respetar la geometría con shader propio: solo se le apagan las luces
+"""
+
+from panda3d.core import (
+    AmbientLight, ColorAttrib, DirectionalLight, Geom, GeomVertexArrayFormat,
+    GeomVertexFormat, GeomVertexReader, GeomVertexRewriter, InternalName,
+    LightAttrib, ShaderAttrib, Vec3,
+)
+
+
+class LightBaker:
+    # Normal que se asume si la geometría no trae normales (tarjeta mirando a la cámara)
+    DEFAULT_NORMAL = Vec3(0, -1, 0)
+
+    def __init__(self, base):
+        self.base = base
+
+    def capture(self):
+        """
+        Aporte de las luces encendidas en render:
+        (color ambiente, [(dirección hacia la luz, color), ...])
+        """
+        render = self.base.render
+        ambient = Vec3(0, 0, 0)
+        directional = []
+        attrib = render.getAttrib(LightAttrib)
+        if attrib is None:
+            return ambient, directional
+
+        for i in range(attrib.getNumOnLights()):
+            light_np = attrib.getOnLight(i)
+            light = light_np.node()
+            color = light.getColor().getXyz()
+            if isinstance(light, AmbientLight):
+                ambient += color
+            elif isinstance(light, DirectionalLight):
+                toward = -render.getRelativeVector(light_np, light.getDirection())
+                toward.normalize()
+                directional.append((toward, color))
+        return ambient, directional
+
+    def bake(self, node):
+        """
+        Hornea las luces actuales en todos los GeomNodes bajo node y le apaga
+        las luces. Un nodo ya horneado no se vuelve a tocar (se multiplicaría dos veces).
+        """
+        if node.hasPythonTag('baked_lighting'):
+            return
+        lights = self.capture()
+        geom_nodes = list(node.findAllMatches('**/+GeomNode'))
+        if node.node().isGeomNode():
+            geom_nodes.insert(0, node)
+
+        for geom_np in geom_nodes:
+            state = geom_np.getNetState()
+            shader = state.getAttrib(ShaderAttrib)
+            # Los shaders propios (sprites, partículas) ya ignoran las luces
+            if shader is not None and shader.getShader() is not None:
+                continue
+
+            color_attrib = state.getAttrib(ColorAttrib)
+            flat = None
+            if color_attrib is not None and color_attrib.getColorType() == ColorAttrib.T_flat:
+                flat = color_attrib.getColor()
+
+            mat = geom_np.getMat(self.base.render)
+            geom_node = geom_np.node()
+            for i in range(geom_node.getNumGeoms()):
+                self._bake_geom(geom_node.modifyGeom(i), mat, lights, flat)
+            if flat is not None:
+                # El color plano ya quedó en los vértices
+                geom_np.setColorOff(1)
+
+        node.setLightOff(1)
+        node.setPythonTag('baked_lighting', True)
+
+    def _bake_geom(self, geom, mat, lights, flat):
+        vdata = geom.modifyVertexData()
+        has_color = vdata.hasColumn(InternalName.getColor())
+        if not has_color:
+            vdata.setFormat(_with_color(vdata.getFormat()))
+
+        ambient, directional = lights
+        normals = GeomVertexReader(vdata, 'normal') if vdata.hasColumn(InternalName.getNormal()) else None
+        colors = GeomVertexRewriter(vdata, 'color')
+        while not colors.isAtEnd():
+            current = colors.getData4()
+            if flat is not None:
+                base = flat
+            elif has_color:
+                base = current
+            else:
+                base = (1, 1, 1, 1)
+
+            normal = mat.xformVec(normals.getData3() if normals else self.DEFAULT_NORMAL)
+            normal.normalize()
+            light = Vec3(ambient)
+            for toward, color in directional:
+                light += color * max(normal.dot(toward), 0.0)
+
+            colors.setData4(min(1.0, base[0] * light[0]), min(1.0, base[1] * light[1]),
+                            min(1.0, base[2] * light[2]), base[3])
+
+
+def _with_color(vertex_format):
+    """Mismo formato con una columna de color RGBA8 agregada en un arreglo aparte"""
+    color_array = GeomVertexArrayFormat()
+    color_array.addColumn(InternalName.getColor(), 4, Geom.NT_uint8, Geom.C_color)
+    new_format = GeomVertexFormat(vertex_format)
+    new_format.addArray(color_array)
+    return GeomVertexFormat.registerFormat(new_format)
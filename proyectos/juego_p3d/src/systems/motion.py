@@ -0,0 +1,148 @@
+"""
+GhostMotion - Movimiento de vaivén de todos los fantasmas en una sola pasada
+Responsabilidades:
+- Guardar origen, amplitud, período y fase de cada fantasma en arreglos por slot
+- Entregar esos datos a GhostRenderer, que evalúa el vaivén en el vertex shader
+- Calcular la posición de un slot solo cuando se la pide (colisiones, fragmentos)
+- Sin instancing (move_nodes), calcular todas las posiciones juntas una vez por
+  frame y escribirlas en los nodos en un solo recorrido
+- Liberar un fantasma limpiando su slot (nada que finalizar ni pausar)
+- Correr todos los orígenes cuando se recentra el origen del mundo
+"""
+
+import random
+from array import array
+
+from panda3d.core import ClockObject, Point3
+
+
+class GhostMotion:
+    # Límites del pasillo para el destino del vaivén
+    MIN_X = -6.0
+    MAX_X = 6.0
+    MIN_Z = 1.0
+    MAX_Z = 5.0
+
+    def __init__(self, base, capacity=64, move_nodes=True):
+        self.base = base
+        self.clock = ClockObject.getGlobalClock()
+        # Con GhostRenderer el vaivén lo dibuja la GPU y los nodos quedan en su origen
+        self.move_nodes = move_nodes
+        self.capacity = 0
+        # Por slot: origen (x, y, z), amplitud (dx, dz), período y comienzo
+        self.origin_x = array('f')
+        self.origin_y = array('f')
+        self.origin_z = array('f')
+        self.delta_x = array('f')
+        self.delta_z = array('f')
+        self.period = array('f')
+        self.start = array('d')
+        self.nodes = []
+        self.free = []
+        # Slots ocupados, en el orden en que se recorren
+        self.active = []
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        extra = capacity - self.capacity
+        for column in (self.origin_x, self.origin_y, self.origin_z,
+                       self.delta_x, self.delta_z, self.period):
+            column.extend([0.0] * extra)
+        self.start.extend([0.0] * extra)
+        self.nodes.extend([None] * extra)
+        # Se reparten primero los slots más bajos
+        self.free.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    # ========== SLOTS ==========
+
+    def add(self, node, origin):
+        """
+        Registra un nodo que va y viene entre origin y un destino al azar
+        (mismos rangos que el viejo LerpPosInterval). Devuelve el slot.
+        """
+        if not self.free:
+            self._grow(self.capacity * 2)
+        slot = self.free.pop()
+
+        x, y, z = origin[0], origin[1], origin[2]
+        target_x = x + random.choice([-1, 1]) * random.uniform(1.5, 3.0)
+        target_x = max(self.MIN_X, min(self.MAX_X, target_x))
+        target_z = z + random.uniform(-0.5, 0.5)
+        target_z = max(self.MIN_Z, min(self.MAX_Z, target_z))
+
+        self.origin_x[slot] = x
+        self.origin_y[slot] = y
+        self.origin_z[slot] = z
+        self.delta_x[slot] = target_x - x
+        self.delta_z[slot] = target_z - z
+        # Ida y vuelta: el período es el doble de la duración de cada tramo
+        self.period[slot] = 2 * random.uniform(2.0, 3.5)
+        self.start[slot] = self.clock.getFrameTime()
+        self.nodes[slot] = node
+        self.active.append(slot)
+        return slot
+
+    def remove(self, slot, node=None):
+        """
+        Libera el slot; el nodo queda donde estaba. Con node solo se libera
+        si el slot sigue siendo de ese nodo (pudo reciclarse para otro).
+        """
+        if slot is None or self.nodes[slot] is None:
+            return
+        if node is not None and self.nodes[slot] is not node:
+            return
+        self.nodes[slot] = None
+        self.active.remove(slot)
+        self.free.append(slot)
+
+    def active_count(self):
+        return len(self.active)
+
+    def params(self, slot):
+        """(dx, dz, período, comienzo) del vaivén de un slot, para el shader"""
+        return self.delta_x[slot], self.delta_z[slot], self.period[slot], self.start[slot]
+
+    def position(self, slot):
+        """Posición actual de un slot (en el espacio del padre del nodo)"""
+        phase = ((self.clock.getFrameTime() - self.start[slot]) / self.period[slot]) % 1.0
+        weight = 1.0 - abs(1.0 - 2.0 * phase)
+        return Point3(self.origin_x[slot] + self.delta_x[slot] * weight, self.origin_y[slot],
+                      self.origin_z[slot] + self.delta_z[slot] * weight)
+
+    # ========== ACTUALIZACIÓN ==========
+
+    def update(self):
+        """Sin instancing: calcula todas las posiciones y las escribe en los nodos"""
+        if not self.move_nodes or not self.active:
+            return
+
+        # Los nodos de chunks eliminados se descartan antes de calcular
+        dead = [slot for slot in self.active if self.nodes[slot].isEmpty()]
+        for slot in dead:
+            self.remove(slot)
+
+        now = self.clock.getFrameTime()
+        slots = self.active
+        start = self.start
+        period = self.period
+        # Onda triangular 0 -> 1 -> 0: avance lineal de ida y de vuelta
+        phases = [((now - start[s]) / period[s]) % 1.0 for s in slots]
+        weights = [1.0 - abs(1.0 - 2.0 * f) for f in phases]
+        xs = [self.origin_x[s] + self.delta_x[s] * w for s, w in zip(slots, weights)]
+        zs = [self.origin_z[s] + self.delta_z[s] * w for s, w in zip(slots, weights)]
+
+        nodes = self.nodes
+        origin_y = self.origin_y
+        for s, x, z in zip(slots, xs, zs):
+            nodes[s].setPos(x, origin_y[s], z)
+
+    def rebase(self, shift):
+        """Corre el origen de todos los slots shift unidades hacia -Y"""
+        origin_y = self.origin_y
+        for slot in self.active:
+            origin_y[slot] -= shift
+
+    def clear(self):
+        for slot in list(self.active):
+            self.remove(slot)
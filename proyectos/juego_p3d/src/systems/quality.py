@@ -0,0 +1,245 @@
+"""
+QualitySettings - Presets de calidad gráfica leídos por todos los subsistemas
+Responsabilidades:
+- Definir en un solo lugar los presets (low/medium/high/ultra)
+- Elegir un preset la primera vez con un benchmark corto de la placa de video
+- Guardar el preset elegido entre sesiones
+- Cambiar de preset en caliente y avisar a quienes escuchan
+"""
+
+import json
+import os
+import random
+import time
+
+from panda3d.core import (
+    AmbientLight, Camera, DirectionalLight, NodePath, PerspectiveLens, Texture,
+    TransparencyAttrib,
+)
+
+from src.systems.asset_cache import get_asset_cache
+from src.systems.billboard import get_billboard_factory
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_SETTINGS_PATH = os.path.join(PROJECT_DIR, "data", "graphics.json")
+
+PRESET_ORDER = ['low', 'medium', 'high', 'ultra']
+PRESET_LABELS = {'low': 'Baja', 'medium': 'Media', 'high': 'Alta', 'ultra': 'Ultra'}
+
+# 'lights': 1 = solo ambiente, 2 = + luz principal, 3 = + luz de relleno.
+# 'alpha_blending' en False usa alpha test para todo (ver transparency.py).
+# 'baked_lighting' hornea las luces en el pasillo y lo dibuja sin luces (ver lighting.py).
+# 'dynamic_resolution' baja la resolución de la escena 3D si no llega al objetivo (ver dynamic_resolution.py).
+PRESETS = {
+    'low': {
+        'ghost_shards': 3,
+        'barrier_shards': 2,
+        'powerup_particles': 4,
+        'clouds': 3,
+        'lights': 1,
+        'alpha_blending': False,
+        'baked_lighting': True,
+        'dynamic_resolution': True,
+    },
+    'medium': {
+        'ghost_shards': 5,
+        'barrier_shards': 3,
+        'powerup_particles': 6,
+        'clouds': 5,
+        'lights': 2,
+        'alpha_blending': True,
+        'baked_lighting': True,
+        'dynamic_resolution': True,
+    },
+    'high': {
+        'ghost_shards': 8,
+        'barrier_shards': 4,
+        'powerup_particles': 8,
+        'clouds': 8,
+        'lights': 3,
+        'alpha_blending': True,
+        'baked_lighting': False,
+        'dynamic_resolution': False,
+    },
+    'ultra': {
+        'ghost_shards': 12,
+        'barrier_shards': 6,
+        'powerup_particles': 12,
+        'clouds': 12,
+        'lights': 3,
+        'alpha_blending': True,
+        'baked_lighting': False,
+        'dynamic_resolution': False,
+    },
+}
+
+DEFAULT_PRESET = 'high'
+
+# Milisegundos por frame del benchmark -> mejor preset que los cumple
+BENCHMARK_THRESHOLDS = [
+    (4.0, 'ultra'),
+    (8.0, 'high'),
+    (16.0, 'medium'),
+]
+
+
+class QualitySettings:
+    BENCHMARK_SIZE = 512
+    BENCHMARK_SPRITES = 400
+    BENCHMARK_BOXES = 40
+    BENCHMARK_FRAMES = 20
+
+    def __init__(self, base, path=DEFAULT_SETTINGS_PATH):
+        self.base = base
+        self.path = path
+        self.listeners = []
+        self.benchmark_ms = None
+        self.preset = self._load()
+        if self.preset is None:
+            self.preset = self.auto_detect()
+            self.save()
+
+    # ========== CONSULTA ==========
+
+    def value(self, key):
+        return PRESETS[self.preset][key]
+
+    def label(self):
+        return PRESET_LABELS[self.preset]
+
+    # ========== CAMBIO EN CALIENTE ==========
+
+    def add_listener(self, callback):
+        """callback(settings) se llama cada vez que cambia el preset"""
+        if callback not in self.listeners:
+            self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def set_preset(self, name):
+        if name not in PRESETS:
+            print(f"Preset de calidad desconocido: {name}")
+            return
+        if name == self.preset:
+            return
+        self.preset = name
+        self.save()
+        for callback in list(self.listeners):
+            callback(self)
+
+    def cycle(self):
+        """Pasa al siguiente preset (vuelve a 'low' después de 'ultra')"""
+        index = PRESET_ORDER.index(self.preset)
+        self.set_preset(PRESET_ORDER[(index + 1) % len(PRESET_ORDER)])
+
+    # ========== PERSISTENCIA ==========
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self.benchmark_ms = data.get('benchmark_ms')
+        preset = data.get('preset')
+        return preset if preset in PRESETS else None
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump({'preset': self.preset, 'benchmark_ms': self.benchmark_ms}, f, indent=2)
+        except OSError as e:
+            print(f"No se pudo guardar la configuración gráfica: {e}")
+
+    # ========== AUTODETECCIÓN ==========
+
+    def auto_detect(self):
+        """Elige el preset según el tiempo por frame de una escena de prueba"""
+        ms = self.benchmark()
+        if ms is None:
+            return DEFAULT_PRESET
+        self.benchmark_ms = ms
+        for limit, preset in BENCHMARK_THRESHOLDS:
+            if ms <= limit:
+                break
+        else:
+            preset = 'low'
+        print(f"Benchmark gráfico: {ms:.2f} ms/frame -> calidad {PRESET_LABELS[preset]}")
+        return preset
+
+    def benchmark(self, frames=BENCHMARK_FRAMES):
+        """
+        Renderiza una escena corta (sprites transparentes y cajas iluminadas)
+        en un buffer offscreen que se lee a RAM en cada frame, así el tiempo
+        incluye el trabajo de la GPU y no depende del vsync de la ventana.
+        Devuelve ms promedio por frame, o None si no se pudo medir.
+        """
+        if not self.base.win:
+            return None
+        engine = self.base.graphicsEngine
+        buffer = self.base.win.makeTextureBuffer(
+            "quality_benchmark", self.BENCHMARK_SIZE, self.BENCHMARK_SIZE, Texture(), True)
+        if buffer is None:
+            return None
+
+        scene = self._build_benchmark_scene()
+        camera = scene.attachNewNode(Camera("quality_benchmark_camera", PerspectiveLens()))
+        camera.setPos(0, -5, 2)
+        buffer.makeDisplayRegion().setCamera(camera)
+
+        # Solo se renderiza el buffer mientras se mide
+        self.base.win.setActive(False)
+        try:
+            for _ in range(3):
+                engine.renderFrame()
+            start = time.perf_counter()
+            for _ in range(frames):
+                engine.renderFrame()
+            elapsed = time.perf_counter() - start
+        finally:
+            self.base.win.setActive(True)
+            engine.removeWindow(buffer)
+            scene.removeNode()
+        return elapsed / frames * 1000.0
+
+    def _build_benchmark_scene(self):
+        scene = NodePath("quality_benchmark")
+        ambient = scene.attachNewNode(AmbientLight("benchmark_ambient"))
+        ambient.node().setColor((0.6, 0.6, 0.6, 1))
+        sun = scene.attachNewNode(DirectionalLight("benchmark_sun"))
+        sun.setHpr(0, -60, 0)
+        scene.setLight(ambient)
+        scene.setLight(sun)
+
+        rng = random.Random(1)
+        billboards = get_billboard_factory(self.base)
+        region = 'fantasma' if billboards.atlas.has('fantasma') else 'white'
+        for i in range(self.BENCHMARK_SPRITES):
+            sprite = billboards.make_sprite(region, (-0.8, 0.8, -0.8, 0.8), scene, f"benchmark_sprite_{i}")
+            sprite.setPos(rng.uniform(-6, 6), rng.uniform(5, 60), rng.uniform(0, 5))
+            sprite.setTransparency(TransparencyAttrib.MAlpha)
+
+        assets = get_asset_cache(self.base)
+        for i in range(self.BENCHMARK_BOXES):
+            box = assets.model("models/box", scene)
+            if box is None:
+                break
+            box.setPos(rng.uniform(-6, 6), rng.uniform(5, 60), rng.uniform(0, 5))
+        return scene
+
+
+_quality_settings = None
+
+
+def get_quality_settings(base):
+    """Configuración única del proceso; la primera vez puede correr el benchmark"""
+    global _quality_settings
+    if _quality_settings is None:
+        _quality_settings = QualitySettings(base)
+    return _quality_settings
@@ -0,0 +1,121 @@
+"""
+Sky - Capa de fondo con el sol y las nubes
+Responsabilidades:
+- Dibujar el cielo como tarjetas pegadas a la cámara en el bin 'background'
+  (se dibujan primero, sin ordenar y sin tocar el depth buffer)
+- Hornear las nubes una sola vez en una textura repetible (TextureFactory)
+- Desplazar las nubes con un scroll de UV en el shader (sin trabajo por frame en Python)
+- Rehacer la franja de nubes cuando cambia la calidad
+"""
+
+import math
+
+from panda3d.core import CardMaker, Shader, TransparencyAttrib
+
+from src.systems.billboard import BillboardFactory, get_billboard_factory
+from src.systems.texture_factory import TextureFactory
+
+
+SKY_VERTEX = """
+#version 150
+
+uniform mat4 p3d_ModelViewProjectionMatrix;
+uniform float osg_FrameTime;
+uniform vec4 scroll;  // velocidad en u y v por segundo
+
+in vec4 p3d_Vertex;
+in vec2 p3d_MultiTexCoord0;
+
+out vec2 texcoord;
+
+void main() {
+    gl_Position = p3d_ModelViewProjectionMatrix * p3d_Vertex;
+    texcoord = p3d_MultiTexCoord0 + scroll.xy * osg_FrameTime;
+}
+"""
+
+SKY_FRAGMENT = """
+#version 150
+
+uniform sampler2D p3d_Texture0;
+uniform vec4 p3d_ColorScale;
+
+in vec2 texcoord;
+
+out vec4 p3d_FragColor;
+
+void main() {
+    p3d_FragColor = texture(p3d_Texture0, texcoord) * p3d_ColorScale;
+}
+"""
+
+
+class Sky:
+    # Distancia de las tarjetas a la cámara (dentro del plano lejano)
+    DISTANCE = 80.0
+    # Margen sobre el campo de visión para que no se vean los bordes
+    MARGIN = 1.1
+    # Fracción del alto visible (desde el centro hacia arriba) que ocupa la franja
+    CLOUD_BAND = (0.15, 1.0)
+    # Vueltas de la franja de nubes por segundo
+    CLOUD_DRIFT = 0.004
+    SUN_POSITION = (0.3, 0.7)
+    SUN_SIZE = 4.4
+
+    def __init__(self, base, cloud_count, texture_factory=None):
+        self.base = base
+        self.textures = texture_factory or TextureFactory(base)
+        self.billboards = get_billboard_factory(base)
+
+        self.root = base.camera.attachNewNode('sky')
+        self.root.setBin('background', 0)
+        self.root.setDepthWrite(False)
+        self.root.setDepthTest(False)
+        self.root.setLightOff()
+        self.root.setFogOff()
+        self.root.setTransparency(TransparencyAttrib.MAlpha)
+
+        fov_x, fov_z = base.camLens.getFov()
+        self.half_width = self.DISTANCE * math.tan(math.radians(fov_x) / 2) * self.MARGIN
+        self.half_height = self.DISTANCE * math.tan(math.radians(fov_z) / 2) * self.MARGIN
+
+        self.sun = self._create_sun()
+        self.clouds = self._create_clouds()
+        self.set_cloud_count(cloud_count)
+
+    def _create_sun(self):
+        """El sol del atlas, fijo en la esquina superior derecha"""
+        x = self.half_width * self.SUN_POSITION[0]
+        z = self.half_height * self.SUN_POSITION[1]
+        half = self.SUN_SIZE / 2
+        sun = self.billboards.atlas.make_card('sun', (-half, half, -half, half), self.root, 'sky_sun')
+        sun.setPos(x, self.DISTANCE, z)
+        return sun
+
+    def _create_clouds(self):
+        """Tarjeta de la franja de nubes; la textura se asigna en set_cloud_count"""
+        z0, z1 = self.CLOUD_BAND
+        cm = CardMaker('sky_clouds')
+        cm.setFrame(-self.half_width, self.half_width, self.half_height * z0, self.half_height * z1)
+        clouds = self.root.attachNewNode(cm.generate())
+        clouds.setY(self.DISTANCE)
+        # Las nubes se dibujan delante del sol
+        clouds.setBin('background', 1)
+
+        if self.billboards.mode == BillboardFactory.MODE_SHADER:
+            clouds.setShader(Shader.make(Shader.SL_GLSL, SKY_VERTEX, SKY_FRAGMENT))
+            clouds.setShaderInput('scroll', (self.CLOUD_DRIFT, 0, 0, 0))
+        return clouds
+
+    def set_cloud_count(self, count):
+        """Cambia la textura de nubes (cada cantidad se hornea una sola vez)"""
+        self.clouds.setTexture(self.textures.cloud_texture(count=count), 1)
+        if count:
+            self.clouds.show()
+        else:
+            self.clouds.hide()
+
+    def cleanup(self):
+        if self.root:
+            self.root.removeNode()
+            self.root = None
@@ -4,22 +4,24 @@ Responsabilidades:
 - Spawn de cristales
 - Spawn de barriers (obstáculos rompibles)
 - Spawn de obstáculos decorativos (columnas, vigas, arcos)
-- Limpieza de objetos fuera de vista
+- Limpieza de objetos fuera de vista (por chunk si se usa ChunkManager)
 - Patrones de spawn
 """
 
 import random
 import time
 from panda3d.core import CardMaker
-from entities.crystal import Crystal
-from entities.barrier import BreakableBarrier
+from src.entities.crystal import Crystal
+from src.entities.barrier import BreakableBarrier
+from src.systems.billboard import get_billboard_factory
 
 
 class SpawnManager:
-    def __init__(self, base, cTrav, handler):
+    def __init__(self, base, chunks=None):
         self.base = base
-        self.cTrav = cTrav
-        self.handler = handler
+        # ChunkManager opcional: si está, todo se cuelga de chunks por tramo de Y
+        self.chunks = chunks
+        self.billboards = get_billboard_factory(base)
         
         # Listas de objetos activos
         self.crystals = []
@@ -65,12 +67,28 @@ class SpawnManager:
                 pos = (x, spawn_y + random.uniform(0, 5), z)
                 self._create_crystal(pos)
                 
+    def _parent_for(self, y, static=False):
+        """Nodo del que cuelga algo spawneado en y (chunk o render)"""
+        if self.chunks is None:
+            return self.base.render
+        chunk = self.chunks.chunk_for(y)
+        return chunk.static if static else chunk.node
+
+    def _register(self, entity, y):
+        if self.chunks is not None:
+            self.chunks.chunk_for(y).add(entity)
+
     def _create_crystal(self, pos):
         """Crea un cristal en la posición indicada"""
-        c = Crystal(self.base, pos, self.cTrav, self.handler)
-        c.node.setPythonTag('crystal_ref', c)
-        c.collider.setPythonTag('crystal_ref', c)
+        c = Crystal(self.base, pos, parent=self._parent_for(pos[1]))
+        self._register(c, pos[1])
         self.crystals.append(c)
+
+    def _create_barrier(self, pos):
+        """Crea un barrier en la posición indicada"""
+        barrier = BreakableBarrier(self.base, pos, parent=self._parent_for(pos[1]))
+        self._register(barrier, pos[1])
+        self.barriers.append(barrier)
         
     def cleanup_old_crystals(self):
         """Elimina cristales que están muy atrás de la cámara"""
@@ -103,12 +121,14 @@ class SpawnManager:
             x = random.choice([-2, 0, 2])
             z = random.uniform(2, 3.5)
             pos = (x, spawn_y, z)
+            self._create_barrier(pos)
+
+    def update_barrier_lod(self):
+        """Solo giran las barreras cercanas; las lejanas son un impostor quieto"""
+        camera_y = self.base.camera.getY()
+        for barrier in self.barriers:
+            barrier.set_near(barrier.pos.getY() - camera_y < BreakableBarrier.NEAR_DISTANCE)
 
-            barrier = BreakableBarrier(self.base, pos, self.cTrav, self.handler)
-            barrier.node.setPythonTag('barrier_ref', barrier)
-            barrier.collider.setPythonTag('barrier_ref', barrier)
-            self.barriers.append(barrier)
-            
     def cleanup_old_barriers(self, on_barrier_missed_callback):
         """Elimina barriers que pasaron sin romperse"""
         camera_y = self.base.camera.getY()
@@ -130,10 +150,7 @@ class SpawnManager:
         self._create_crystal((-3, start_y, 2))
         self._create_crystal((3, start_y + 5, 2.5))
         
-        barrier = BreakableBarrier(self.base, (0, start_y + 2.5, 2.5), self.cTrav, self.handler)
-        barrier.node.setPythonTag('barrier_ref', barrier)
-        barrier.collider.setPythonTag('barrier_ref', barrier)
-        self.barriers.append(barrier)
+        self._create_barrier((0, start_y + 2.5, 2.5))
     
     # ========== OBSTÁCULOS DECORATIVOS ==========
     
@@ -171,53 +188,52 @@ class SpawnManager:
                     
     def _create_column(self, x, y, height):
         """Crea una columna vertical"""
-        cm = CardMaker('column')
-        cm.setFrame(-0.3, 0.3, 0, height)
-        column = self.base.render.attachNewNode(cm.generate())
+        column = self.billboards.make_sprite('white', (-0.3, 0.3, 0, height),
+                                             self._parent_for(y, static=True), 'column')
         column.setPos(x, y, 0)
         column.setColor(0.45, 0.48, 0.52, 1)
-        column.setBillboardPointEye()
-        self.obstacles.append(column)
+        self._track_obstacle(column)
 
     def _create_beam(self, y, z):
         """Crea una viga horizontal"""
         cm = CardMaker('beam')
         cm.setFrame(-8, 8, -0.3, 0.3)
-        beam = self.base.render.attachNewNode(cm.generate())
+        beam = self._parent_for(y, static=True).attachNewNode(cm.generate())
         beam.setPos(0, y, z)
         beam.setP(-90)
         beam.setColor(0.4, 0.43, 0.47, 1)
-        self.obstacles.append(beam)
+        self._track_obstacle(beam)
 
     def _create_arch(self, y):
         """Crea un arco decorativo"""
         for x in [-5, 5]:
-            cm = CardMaker('arch_pillar')
-            cm.setFrame(-0.4, 0.4, 0, 4)
-            pillar = self.base.render.attachNewNode(cm.generate())
+            pillar = self.billboards.make_sprite('white', (-0.4, 0.4, 0, 4),
+                                                 self._parent_for(y, static=True), 'arch_pillar')
             pillar.setPos(x, y, 0)
             pillar.setColor(0.42, 0.45, 0.5, 1)
-            pillar.setBillboardPointEye()
-            self.obstacles.append(pillar)
+            self._track_obstacle(pillar)
 
         cm = CardMaker('arch_top')
         cm.setFrame(-5, 5, -0.3, 0.3)
-        top = self.base.render.attachNewNode(cm.generate())
+        top = self._parent_for(y, static=True).attachNewNode(cm.generate())
         top.setPos(0, y, 4)
         top.setP(-90)
         top.setColor(0.42, 0.45, 0.5, 1)
-        self.obstacles.append(top)
+        self._track_obstacle(top)
 
     def _create_pillar(self, x, y, z):
         """Crea un pilar decorativo pequeño"""
-        cm = CardMaker('pillar')
-        cm.setFrame(-0.2, 0.2, -0.2, 0.2)
-        pillar = self.base.render.attachNewNode(cm.generate())
+        pillar = self.billboards.make_sprite('white', (-0.2, 0.2, -0.2, 0.2),
+                                             self._parent_for(y, static=True), 'pillar')
         pillar.setPos(x, y, z)
         pillar.setColor(0.38, 0.41, 0.46, 1)
-        pillar.setBillboardPointEye()
-        self.obstacles.append(pillar)
+        self._track_obstacle(pillar)
         
+    def _track_obstacle(self, node):
+        """Sin chunks hay que seguir cada obstáculo; con chunks se van con su tramo"""
+        if self.chunks is None:
+            self.obstacles.append(node)
+
     def cleanup_old_obstacles(self):
         """Elimina obstáculos que están muy atrás"""
         camera_y = self.base.camera.getY()
@@ -231,6 +247,34 @@ class SpawnManager:
         for obstacle in obstacles_to_remove:
             self.obstacles.remove(obstacle)
     
+    # ========== CHUNKS ==========
+
+    def cleanup_old_chunks(self, on_barrier_missed_callback):
+        """
+        Reemplaza a cleanup_old_* cuando se usa ChunkManager: penaliza los
+        barriers que pasaron sin romperse y elimina cada chunk viejo de una vez
+        """
+        camera_y = self.base.camera.getY()
+        passed, retired = self.chunks.update(camera_y, camera_y + self.crystal_spawn_y_distance)
+
+        for chunk in passed:
+            for entity in chunk.entities:
+                if isinstance(entity, BreakableBarrier) and not entity.broken:
+                    on_barrier_missed_callback()
+
+        if not retired:
+            return
+
+        removed = set()
+        for chunk in retired:
+            for entity in chunk.entities:
+                if hasattr(entity, 'cleanup'):
+                    entity.cleanup()
+                removed.add(id(entity))
+
+        self.crystals = [c for c in self.crystals if id(c) not in removed]
+        self.barriers = [b for b in self.barriers if id(b) not in removed]
+
     # ========== LIMPIEZA GENERAL ==========
     
     def cleanup(self):
@@ -0,0 +1,131 @@
+"""
+SpinShader - Giro y pulso de color calculados en la GPU
+Responsabilidades:
+- Girar la malla sobre su eje Z (heading) según el tiempo global osg_FrameTime
+- Pulsar el color entre blanco y un color dado con período y fase propios
+- Iluminar (ambiente + luces direccionales) y aplicar niebla como el pipeline fijo
+- Sin intervalos ni cambios de transformación por frame: los colisionadores no se mueven
+"""
+
+from panda3d.core import Shader
+
+from src.systems.billboard import FOG_GLSL, BillboardFactory, get_billboard_factory
+
+
+SPIN_VERTEX = """
+#version 150
+
+uniform mat4 p3d_ModelViewMatrix;
+uniform mat4 p3d_ProjectionMatrix;
+uniform mat3 p3d_NormalMatrix;
+uniform vec4 p3d_ColorScale;
+uniform float osg_FrameTime;
+uniform vec4 spin;         // grados por segundo, fase en grados
+uniform vec4 pulse;        // período en segundos (0 = sin pulso), fase en segundos
+uniform vec4 pulse_color;
+
+in vec4 p3d_Vertex;
+in vec3 p3d_Normal;
+in vec4 p3d_Color;
+in vec2 p3d_MultiTexCoord0;
+
+out vec4 color;
+out vec2 texcoord;
+out vec3 view_pos;
+out vec3 view_normal;
+
+void main() {
+    float angle = radians(spin.y + spin.x * osg_FrameTime);
+    mat2 heading = mat2(cos(angle), sin(angle), -sin(angle), cos(angle));
+
+    vec4 vertex = p3d_Vertex;
+    vertex.xy = heading * vertex.xy;
+    // Las tarjetas sin normales se iluminan como si miraran hacia +Z
+    vec3 normal = dot(p3d_Normal, p3d_Normal) > 0.0 ? p3d_Normal : vec3(0.0, 0.0, 1.0);
+    normal.xy = heading * normal.xy;
+
+    // Onda triangular blanco -> pulse_color -> blanco
+    float weight = 0.0;
+    if (pulse.x > 0.0) {
+        float f = fract((osg_FrameTime + pulse.y) / pulse.x);
+        weight = 1.0 - abs(1.0 - 2.0 * f);
+    }
+    color = p3d_Color * p3d_ColorScale * mix(vec4(1.0), pulse_color, weight);
+
+    vec4 view = p3d_ModelViewMatrix * vertex;
+    gl_Position = p3d_ProjectionMatrix * view;
+    texcoord = p3d_MultiTexCoord0;
+    view_pos = view.xyz;
+    view_normal = normalize(p3d_NormalMatrix * normal);
+}
+"""
+
+SPIN_FRAGMENT = """
+#version 150
+
+uniform sampler2D p3d_Texture0;
+
+uniform struct p3d_LightModelParameters {
+    vec4 ambient;
+} p3d_LightModel;
+
+uniform struct p3d_LightSourceParameters {
+    vec4 color;
+    vec4 position;
+} p3d_LightSource[3];
+
+in vec4 color;
+in vec2 texcoord;
+in vec3 view_pos;
+in vec3 view_normal;
+
+out vec4 p3d_FragColor;
+""" + FOG_GLSL + """
+void main() {
+    vec3 normal = normalize(view_normal);
+    vec3 light = p3d_LightModel.ambient.rgb;
+    for (int i = 0; i < p3d_LightSource.length(); ++i) {
+        // Solo direccionales (w = 0); las entradas vacías vienen en cero y,
+        // sin luces, Panda deja una entrada con w = 1
+        vec4 position = p3d_LightSource[i].position;
+        if (position.w == 0.0 && dot(position.xyz, position.xyz) > 0.0) {
+            light += p3d_LightSource[i].color.rgb * max(dot(normal, normalize(position.xyz)), 0.0);
+        }
+    }
+    vec4 base = texture(p3d_Texture0, texcoord) * color;
+    p3d_FragColor = apply_fog(vec4(base.rgb * light, base.a), view_pos);
+}
+"""
+
+
+class SpinShader:
+    def __init__(self, base):
+        self.base = base
+        billboards = get_billboard_factory(base)
+        self.enabled = billboards.mode == BillboardFactory.MODE_SHADER
+        self.shader = Shader.make(Shader.SL_GLSL, SPIN_VERTEX, SPIN_FRAGMENT) if self.enabled else None
+
+    def apply(self, node, spin_rate=0.0, phase=0.0, pulse_period=0.0, pulse_phase=0.0,
+              pulse_color=(1, 1, 1, 1)):
+        """
+        Anima node en la GPU. spin_rate en grados por segundo, phase en grados.
+        Devuelve False si no hay shaders (el que llama usa intervalos).
+        """
+        if not self.enabled:
+            return False
+        node.setShader(self.shader)
+        node.setShaderInput('spin', (spin_rate, phase, 0, 0))
+        node.setShaderInput('pulse', (pulse_period, pulse_phase, 0, 0))
+        node.setShaderInput('pulse_color', pulse_color)
+        return True
+
+
+_spin_shader = None
+
+
+def get_spin_shader(base):
+    """Shader único del proceso"""
+    global _spin_shader
+    if _spin_shader is None:
+        _spin_shader = SpinShader(base)
+    return _spin_shader
@@ -0,0 +1,230 @@
+"""
+SpriteAtlas - Atlas de texturas para todos los sprites del juego
+Responsabilidades:
+- Empaquetar las imágenes de sprites y los sprites de color sólido en una sola textura
+- Guardar la tabla de coordenadas UV de cada región
+- Marcar qué regiones tienen alpha binario (sirven con alpha test, sin mezcla)
+- Reconstruir el atlas solo cuando cambian las imágenes de origen
+- Crear tarjetas que apuntan a una región del atlas
+"""
+
+import hashlib
+import json
+import os
+
+from panda3d.core import CardMaker, Filename, PNMImage, SamplerState
+
+from src.systems.texture_pipeline import get_texture_pipeline
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CACHE_DIR = os.path.join(PROJECT_DIR, "cache", "atlas")
+
+# Imágenes que se empaquetan (nombre de región -> ruta relativa al proyecto).
+# Los fondos de menú no son sprites y siguen cargándose por separado.
+SPRITE_IMAGES = {
+    'fantasma': "images/fantasma.png",
+    'projectile': "images/projectile.png",
+}
+
+# Sprites de color sólido (nombre de región -> RGBA)
+SOLID_SPRITES = {
+    'white': (1, 1, 1, 1),
+    'sun': (1, 0.95, 0.3, 1),
+    'cloud': (1, 1, 1, 0.8),
+}
+
+
+class SpriteAtlas:
+    # Subir este número fuerza la reconstrucción del atlas
+    VERSION = 2
+    MAX_SPRITE_SIZE = 256
+    SOLID_SIZE = 8
+    PADDING = 4
+    # Una imagen es "binaria" si casi todos sus píxeles son opacos o vacíos
+    PARTIAL_ALPHA_LIMIT = 0.03
+    ALPHA_SAMPLES = 256
+
+    def __init__(self, base, cache_dir=DEFAULT_CACHE_DIR,
+                 images=SPRITE_IMAGES, solids=SOLID_SPRITES):
+        self.base = base
+        self.cache_dir = cache_dir
+        self.images = images
+        self.solids = solids
+        self.image_path = os.path.join(cache_dir, "sprites.png")
+        self.table_path = os.path.join(cache_dir, "sprites.json")
+
+        self.regions, self.binary = self._load_or_build()
+        # Sin compresión: DXT ensucia los bordes de sprites chicos
+        self.texture = get_texture_pipeline(base).load(self.image_path, compress=False)
+        self.texture.setMinfilter(SamplerState.FT_linear_mipmap_linear)
+        self.texture.setMagfilter(SamplerState.FT_linear)
+        self.texture.setWrapU(SamplerState.WM_clamp)
+        self.texture.setWrapV(SamplerState.WM_clamp)
+
+    # ========== CONSULTA ==========
+
+    def has(self, name):
+        return name in self.regions
+
+    def is_binary(self, name):
+        """True si la región se puede dibujar con alpha test sin perder bordes"""
+        return name in self.binary
+
+    def uv(self, name):
+        """Rango UV (u0, v0, u1, v1) de una región"""
+        return self.regions[name]
+
+    def make_card(self, name, frame, parent=None, card_name=None):
+        """Crea una tarjeta con la textura del atlas recortada a una región"""
+        u0, v0, u1, v1 = self.regions[name]
+        cm = CardMaker(card_name or f"{name}_card")
+        cm.setFrame(*frame)
+        cm.setUvRange((u0, v0), (u1, v1))
+        card = (parent if parent is not None else self.base.render).attachNewNode(cm.generate())
+        card.setTexture(self.texture)
+        return card
+
+    # ========== CONSTRUCCIÓN ==========
+
+    def _source_signature(self):
+        """Huella de las imágenes de origen; si cambia, hay que reconstruir"""
+        sources = {'version': self.VERSION, 'solids': self.solids, 'images': {}}
+        for name, relative_path in sorted(self.images.items()):
+            path = os.path.join(PROJECT_DIR, relative_path)
+            if os.path.exists(path):
+                stat = os.stat(path)
+                sources['images'][name] = [relative_path, stat.st_size, stat.st_mtime_ns]
+        key = json.dumps(sources, sort_keys=True)
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    def _load_or_build(self):
+        """Usa la tabla guardada si la firma coincide; si no, reconstruye el atlas"""
+        signature = self._source_signature()
+        if os.path.exists(self.table_path) and os.path.exists(self.image_path):
+            try:
+                with open(self.table_path, 'r', encoding='utf-8') as f:
+                    table = json.load(f)
+                if table.get('signature') == signature:
+                    regions = {name: tuple(uv) for name, uv in table['regions'].items()}
+                    return regions, set(table['binary'])
+            except (OSError, ValueError, KeyError):
+                pass
+
+        atlas, regions, binary = self._build()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        atlas.write(Filename.fromOsSpecific(self.image_path))
+        with open(self.table_path, 'w', encoding='utf-8') as f:
+            json.dump({'signature': signature, 'regions': regions, 'binary': sorted(binary)}, f, indent=2)
+        print(f"Atlas de sprites reconstruido ({len(regions)} regiones)")
+        return {name: tuple(uv) for name, uv in regions.items()}, binary
+
+    def _partial_alpha_ratio(self, image):
+        """Fracción de píxeles semitransparentes, midiendo sobre una grilla de muestras"""
+        step = max(1, max(image.getXSize(), image.getYSize()) // self.ALPHA_SAMPLES)
+        total = partial = 0
+        for y in range(0, image.getYSize(), step):
+            for x in range(0, image.getXSize(), step):
+                alpha = image.getAlpha(x, y)
+                total += 1
+                if 0.05 < alpha < 0.95:
+                    partial += 1
+        return partial / total if total else 0.0
+
+    def _load_sprites(self):
+        """
+        Lee y reduce las imágenes de origen; agrega los sprites sólidos.
+        Devuelve (sprites, regiones con alpha binario). El alpha se mide en la
+        imagen original: al reducirla, el filtro suaviza los bordes.
+        """
+        sprites = {}
+        binary = set()
+        for name, relative_path in self.images.items():
+            path = os.path.join(PROJECT_DIR, relative_path)
+            if not os.path.exists(path):
+                continue
+            source = PNMImage()
+            if not source.read(Filename.fromOsSpecific(path)):
+                print(f"No se pudo leer {relative_path} para el atlas")
+                continue
+            if not source.hasAlpha():
+                source.addAlpha()
+                source.alphaFill(1.0)
+            if self._partial_alpha_ratio(source) < self.PARTIAL_ALPHA_LIMIT:
+                binary.add(name)
+
+            scale = min(1.0, self.MAX_SPRITE_SIZE / max(source.getXSize(), source.getYSize()))
+            width = max(1, int(source.getXSize() * scale))
+            height = max(1, int(source.getYSize() * scale))
+            sprite = PNMImage(width, height, 4)
+            sprite.gaussianFilterFrom(1.0, source)
+            sprites[name] = sprite
+
+        for name, color in self.solids.items():
+            sprite = PNMImage(self.SOLID_SIZE, self.SOLID_SIZE, 4)
+            sprite.fill(*color[:3])
+            sprite.alphaFill(color[3])
+            sprites[name] = sprite
+            if color[3] >= 1.0:
+                binary.add(name)
+        return sprites, binary
+
+    def _pack(self, sizes, width, height):
+        """Empaquetado por estantes; devuelve posiciones o None si no entra"""
+        placements = {}
+        x = y = shelf_height = 0
+        for name, (w, h) in sorted(sizes.items(), key=lambda item: -item[1][1]):
+            w += self.PADDING * 2
+            h += self.PADDING * 2
+            if x + w > width:
+                x, y = 0, y + shelf_height
+                shelf_height = 0
+            if w > width or y + h > height:
+                return None
+            placements[name] = (x + self.PADDING, y + self.PADDING)
+            x += w
+            shelf_height = max(shelf_height, h)
+        return placements
+
+    def _build(self):
+        sprites, binary = self._load_sprites()
+        sizes = {name: (img.getXSize(), img.getYSize()) for name, img in sprites.items()}
+
+        # Busca el atlas potencia de dos más chico en el que entra todo
+        width = height = 64
+        placements = self._pack(sizes, width, height)
+        while placements is None:
+            if width <= height:
+                width *= 2
+            else:
+                height *= 2
+            placements = self._pack(sizes, width, height)
+
+        atlas = PNMImage(width, height, 4)
+        atlas.fill(1, 1, 1)
+        atlas.alphaFill(0)
+
+        regions = {}
+        for name, (x, y) in placements.items():
+            w, h = sizes[name]
+            atlas.copySubImage(sprites[name], x, y)
+            # Medio texel hacia adentro para que el filtrado no tome a los vecinos.
+            # PNMImage cuenta filas desde arriba y las UV desde abajo.
+            regions[name] = (
+                (x + 0.5) / width,
+                1.0 - (y + h - 0.5) / height,
+                (x + w - 0.5) / width,
+                1.0 - (y + 0.5) / height,
+            )
+        return atlas, regions, binary
+
+
+_sprite_atlas = None
+
+
+def get_sprite_atlas(base):
+    """Atlas único del proceso; se construye o carga la primera vez que se pide"""
+    global _sprite_atlas
+    if _sprite_atlas is None:
+        _sprite_atlas = SpriteAtlas(base)
+    return _sprite_atlas
@@ -0,0 +1,196 @@
+"""
+TextureFactory - Texturas procedurales del escenario
+Responsabilidades:
+- Dibujar con PNMImage los ladrillos, el mortero, las líneas del camino y los bordes
+- Dibujar la franja de nubes del cielo (con alpha, repetible en horizontal)
+- Guardar cada textura en disco según sus parámetros (colores, medidas, resolución)
+- Reutilizar la versión en disco en los siguientes arranques
+"""
+
+import hashlib
+import json
+import os
+import random
+
+from panda3d.core import Filename, PNMImage, SamplerState
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CACHE_DIR = os.path.join(PROJECT_DIR, "cache", "textures")
+
+
+class TextureFactory:
+    # Subir este número invalida las texturas guardadas si cambia el dibujo
+    VERSION = 1
+
+    def __init__(self, base, cache_dir=DEFAULT_CACHE_DIR):
+        self.base = base
+        self.cache_dir = cache_dir
+        self.textures = {}
+
+    # ========== TEXTURAS ==========
+
+    def brick_texture(self, brick_color=(0.65, 0.35, 0.25), mortar_color=(0.4, 0.3, 0.25),
+                      brick_length=1.0, course_height=0.6, mortar_width=0.08,
+                      variation=0.06, resolution=(128, 64)):
+        """
+        Textura de pared de ladrillo. Un tile cubre dos ladrillos de largo
+        y dos hiladas de alto (la segunda desplazada medio ladrillo).
+        """
+        params = {
+            'brick_color': brick_color, 'mortar_color': mortar_color,
+            'brick_length': brick_length, 'course_height': course_height,
+            'mortar_width': mortar_width, 'variation': variation,
+            'resolution': resolution,
+        }
+        return self._get_or_build('brick', params, self._draw_bricks)
+
+    def road_texture(self, asphalt_color=(0.3, 0.3, 0.5), dash_color=(1, 0.9, 0.2),
+                     edge_color=(0.9, 0.9, 0.9), half_width=8.0, edge_x=6.0,
+                     edge_width=0.4, dash_width=0.3, dash_length=4.0,
+                     dash_spacing=8.0, resolution=(256, 128)):
+        """
+        Textura del camino. Un tile cubre todo el ancho de la calle y un
+        período de las líneas centrales.
+        """
+        params = {
+            'asphalt_color': asphalt_color, 'dash_color': dash_color,
+            'edge_color': edge_color, 'half_width': half_width, 'edge_x': edge_x,
+            'edge_width': edge_width, 'dash_width': dash_width,
+            'dash_length': dash_length, 'dash_spacing': dash_spacing,
+            'resolution': resolution,
+        }
+        return self._get_or_build('road', params, self._draw_road)
+
+    def cloud_texture(self, count=8, color=(1, 1, 1, 0.8), min_width=0.06, max_width=0.12,
+                      min_z=0.35, max_z=0.85, resolution=(512, 128)):
+        """
+        Franja de nubes sobre fondo transparente. Los anchos y alturas son
+        fracciones de la textura; las nubes que cruzan el borde siguen del
+        otro lado para que la franja se repita sin costura.
+        """
+        params = {
+            'count': count, 'color': color, 'min_width': min_width, 'max_width': max_width,
+            'min_z': min_z, 'max_z': max_z, 'resolution': resolution,
+        }
+        return self._get_or_build('clouds', params, self._draw_clouds)
+
+    # ========== CACHÉ ==========
+
+    def _cache_path(self, kind, params):
+        """Ruta en disco de una textura según su tipo y parámetros"""
+        key = json.dumps({'version': self.VERSION, 'params': params}, sort_keys=True)
+        digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{kind}_{digest}.png")
+
+    def _get_or_build(self, kind, params, draw_fn):
+        """Devuelve la textura desde memoria o disco; si no existe, la genera"""
+        path = self._cache_path(kind, params)
+        if path in self.textures:
+            return self.textures[path]
+
+        if not os.path.exists(path):
+            image = draw_fn(params)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            image.write(Filename.fromOsSpecific(path))
+
+        tex = self.base.loader.loadTexture(Filename.fromOsSpecific(path))
+        tex.setWrapU(SamplerState.WM_repeat)
+        tex.setWrapV(SamplerState.WM_repeat)
+        tex.setMinfilter(SamplerState.FT_linear_mipmap_linear)
+        tex.setMagfilter(SamplerState.FT_linear)
+        tex.setAnisotropicDegree(4)
+        self.textures[path] = tex
+        return tex
+
+    # ========== DIBUJO ==========
+
+    @staticmethod
+    def _fill_rect(image, x0, y0, x1, y1, color):
+        """Pinta un rectángulo (coordenadas en píxeles, extremos exclusivos)"""
+        x0, x1 = max(0, int(x0)), min(image.getXSize(), int(round(x1)))
+        y0, y1 = max(0, int(y0)), min(image.getYSize(), int(round(y1)))
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                if len(color) == 4:
+                    image.setXelA(x, y, *color)
+                else:
+                    image.setXel(x, y, *color)
+
+    def _draw_bricks(self, params):
+        width, height = params['resolution']
+        tile_w = params['brick_length'] * 2
+        tile_h = params['course_height'] * 2
+        px_x = width / tile_w
+        px_y = height / tile_h
+        mortar_x = max(1, params['mortar_width'] * px_x)
+        mortar_y = max(1, params['mortar_width'] * px_y)
+
+        image = PNMImage(width, height, 3)
+        image.fill(*params['mortar_color'])
+
+        # Variación de tono por ladrillo, reproducible para una misma clave
+        rng = random.Random(json.dumps(params, sort_keys=True))
+        course_px = params['course_height'] * px_y
+        brick_px = params['brick_length'] * px_x
+
+        for course in range(2):
+            offset = 0 if course == 0 else brick_px / 2
+            y0 = course * course_px + mortar_y / 2
+            y1 = (course + 1) * course_px - mortar_y / 2
+            shades = [1.0 + rng.uniform(-params['variation'], params['variation']) for _ in range(2)]
+            # Tres ladrillos cubren el tile aun con el desplazamiento de media pieza;
+            # el que cruza el borde usa el mismo tono en ambos lados
+            for i in range(-1, 2):
+                x0 = offset + i * brick_px + mortar_x / 2
+                x1 = offset + (i + 1) * brick_px - mortar_x / 2
+                color = tuple(min(1.0, c * shades[i % 2]) for c in params['brick_color'])
+                self._fill_rect(image, x0, y0, x1, y1, color)
+        return image
+
+    def _draw_road(self, params):
+        width, height = params['resolution']
+        px_x = width / (params['half_width'] * 2)
+        px_y = height / params['dash_spacing']
+
+        image = PNMImage(width, height, 3)
+        image.fill(*params['asphalt_color'])
+
+        def to_px(x):
+            return (x + params['half_width']) * px_x
+
+        # Bordes blancos continuos
+        half_edge = params['edge_width'] / 2
+        for edge in (-params['edge_x'], params['edge_x']):
+            self._fill_rect(image, to_px(edge - half_edge), 0, to_px(edge + half_edge), height,
+                            params['edge_color'])
+
+        # Línea central discontinua, centrada en el tile
+        half_dash = params['dash_width'] / 2
+        gap = (params['dash_spacing'] - params['dash_length']) / 2
+        self._fill_rect(image, to_px(-half_dash), gap * px_y, to_px(half_dash),
+                        (gap + params['dash_length']) * px_y, params['dash_color'])
+        return image
+
+    def _draw_clouds(self, params):
+        width, height = params['resolution']
+        image = PNMImage(width, height, 4)
+        image.fill(*params['color'][:3])
+        image.alphaFill(0)
+
+        rng = random.Random(json.dumps(params, sort_keys=True))
+        for i in range(params['count']):
+            # Repartidas a lo ancho para que no se amontonen
+            center = (i + rng.uniform(0.2, 0.8)) / params['count'] * width
+            half_w = rng.uniform(params['min_width'], params['max_width']) * width / 2
+            half_h = half_w * rng.uniform(0.3, 0.45)
+            # PNMImage cuenta las filas desde arriba
+            cz = (1 - rng.uniform(params['min_z'], params['max_z'])) * height
+            bumps = ((0, 0, 1.0, 1.0), (-0.35, -0.8, 0.45, 0.8), (0.25, -0.7, 0.4, 0.9))
+            for dx, dz, sw, sh in bumps:
+                x = center + dx * half_w * 2
+                z = cz + dz * half_h
+                for shift in (-width, 0, width):
+                    self._fill_rect(image, x - half_w * sw + shift, z - half_h * sh,
+                                    x + half_w * sw + shift, z + half_h * sh, params['color'])
+        return image
@@ -0,0 +1,181 @@
+"""
+TexturePipeline - Conversión de imágenes a texturas .txo listas para la GPU
+Responsabilidades:
+- Redimensionar cada imagen a potencia de dos dentro de un tamaño máximo
+- Generar los mipmaps en RAM y comprimir (DXT1/DXT5) antes de guardar
+- Guardar el resultado en cache/txo con el hash del contenido de origen en el nombre
+- Cargar el .txo en tiempo de ejecución (sin decodificar PNG ni escalar al vuelo)
+- Informar cuánta memoria de textura ocupa cada recurso
+
+Paso de build (convierte todo de antemano e imprime el reporte):
+    python -m src.systems.texture_pipeline
+"""
+
+import glob
+import hashlib
+import json
+import math
+import os
+import re
+
+from panda3d.core import Filename, PNMImage, SamplerState, Texture
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CACHE_DIR = os.path.join(PROJECT_DIR, "cache", "txo")
+SOURCE_DIR = os.path.join(PROJECT_DIR, "images")
+
+
+def power_of_two(size, max_size):
+    """
+    Potencia de dos más cercana a size en escala logarítmica (736 -> 1024,
+    700 -> 512), sin pasar de max_size
+    """
+    nearest = 1 << max(0, round(math.log2(max(1, size))))
+    limit = 1 << (max(1, max_size).bit_length() - 1)
+    return min(nearest, limit)
+
+
+class TexturePipeline:
+    # Subir este número invalida todos los .txo
+    VERSION = 2
+    # Lado máximo: con 1 GB de video compartido no hace falta más para esta cámara
+    MAX_SIZE = 1024
+
+    def __init__(self, base=None, cache_dir=DEFAULT_CACHE_DIR, max_size=MAX_SIZE):
+        self.base = base
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        # Ruta de origen -> datos de memoria para el reporte
+        self.entries = {}
+
+    # ========== BUILD ==========
+
+    def cache_path(self, path, compress=True, max_size=None):
+        """Ruta del .txo de una imagen según su contenido y las opciones de conversión"""
+        max_size = max_size or self.max_size
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+        options = {'version': self.VERSION, 'compress': compress, 'max_size': max_size}
+        digest.update(json.dumps(options, sort_keys=True).encode())
+        return os.path.join(self.cache_dir, f"{self._asset_name(path)}_{digest.hexdigest()[:16]}.txo")
+
+    def build(self, path, compress=True, max_size=None):
+        """Convierte la imagen a .txo si todavía no está en caché; devuelve la ruta"""
+        txo_path = self.cache_path(path, compress, max_size)
+        if os.path.exists(txo_path):
+            return txo_path
+
+        texture = self._convert(path, compress, max_size or self.max_size)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Las versiones viejas del mismo recurso ya no sirven; solo <nombre>_<16 hex>.txo,
+        # así no se borra otro recurso cuyo nombre empiece igual
+        stale = re.compile(re.escape(self._asset_name(path)) + r"_[0-9a-f]{16}\.txo")
+        for name in os.listdir(self.cache_dir):
+            if stale.fullmatch(name) and name != os.path.basename(txo_path):
+                os.remove(os.path.join(self.cache_dir, name))
+        if not texture.write(Filename.fromOsSpecific(txo_path)):
+            print(f"Error guardando textura {txo_path}")
+        return txo_path
+
+    def _asset_name(self, path):
+        """Nombre de archivo estable a partir de la ruta (relativa al proyecto si se puede)"""
+        path = os.path.abspath(path)
+        if path.startswith(PROJECT_DIR):
+            path = os.path.relpath(path, PROJECT_DIR)
+        return os.path.splitext(path)[0].replace(os.sep, '_').replace('/', '_')
+
+    def _convert(self, path, compress, max_size):
+        image = PNMImage(Filename.fromOsSpecific(path))
+        width = power_of_two(image.getXSize(), max_size)
+        height = power_of_two(image.getYSize(), max_size)
+        if (width, height) != (image.getXSize(), image.getYSize()):
+            resized = PNMImage(width, height, image.getNumChannels(), image.getMaxval())
+            resized.gaussianFilterFrom(1.0, image)
+            image = resized
+
+        texture = Texture(os.path.basename(path))
+        texture.load(image)
+        texture.setMinfilter(SamplerState.FT_linear_mipmap_linear)
+        texture.setMagfilter(SamplerState.FT_linear)
+        texture.setWrapU(SamplerState.WM_clamp)
+        texture.setWrapV(SamplerState.WM_clamp)
+        texture.generateRamMipmapImages()
+
+        if compress:
+            mode = Texture.CM_dxt5 if image.hasAlpha() else Texture.CM_dxt1
+            if not texture.compressRamImage(mode):
+                print(f"Sin compresión para {path}: se guarda sin comprimir")
+        return texture
+
+    # ========== CARGA ==========
+
+    def load(self, path, compress=True, max_size=None):
+        """Textura lista para usar: del .txo en caché, generándolo si hace falta"""
+        txo_path = self.build(path, compress, max_size)
+        if self.base is not None:
+            texture = self.base.loader.loadTexture(Filename.fromOsSpecific(txo_path))
+        else:
+            texture = Texture()
+            texture.read(Filename.fromOsSpecific(txo_path))
+        self._record(path, texture)
+        return texture
+
+    # ========== REPORTE ==========
+
+    def _record(self, path, texture):
+        levels = texture.getNumRamMipmapImages()
+        self.entries[path] = {
+            'size': (texture.getXSize(), texture.getYSize()),
+            'mipmaps': levels,
+            'compression': texture.getRamImageCompression(),
+            'bytes': sum(texture.getRamMipmapImageSize(n) for n in range(levels)),
+        }
+
+    def total_bytes(self):
+        return sum(entry['bytes'] for entry in self.entries.values())
+
+    def memory_report(self):
+        """Líneas de texto con la memoria de textura de cada recurso cargado"""
+        lines = []
+        for path, entry in sorted(self.entries.items()):
+            width, height = entry['size']
+            compressed = "comprimida" if entry['compression'] != Texture.CM_off else "sin comprimir"
+            lines.append(f"{self._asset_name(path)}: {width}x{height}, {entry['mipmaps']} mipmaps, "
+                         f"{compressed}, {entry['bytes'] / 1024:.0f} KB")
+        lines.append(f"Total: {self.total_bytes() / 1024:.0f} KB")
+        return lines
+
+
+_texture_pipeline = None
+
+
+def get_texture_pipeline(base):
+    """Pipeline único del proceso"""
+    global _texture_pipeline
+    if _texture_pipeline is None:
+        _texture_pipeline = TexturePipeline(base)
+    return _texture_pipeline
+
+
+def main():
+    """Convierte las imágenes que se cargan sueltas (no las que van al atlas)"""
+    from src.systems.sprite_atlas import DEFAULT_CACHE_DIR as ATLAS_DIR, SPRITE_IMAGES
+
+    atlas_sources = {os.path.join(PROJECT_DIR, path) for path in SPRITE_IMAGES.values()}
+    pipeline = TexturePipeline()
+    for path in sorted(glob.glob(os.path.join(SOURCE_DIR, "*.png"))):
+        if path not in atlas_sources:
+            pipeline.load(path)
+    # El atlas se arma al iniciar el juego; si ya existe también se convierte
+    atlas_path = os.path.join(ATLAS_DIR, "sprites.png")
+    if os.path.exists(atlas_path):
+        pipeline.load(atlas_path, compress=False)
+
+    for line in pipeline.memory_report():
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
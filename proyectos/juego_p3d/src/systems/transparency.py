@@ -0,0 +1,86 @@
+"""
+Transparency - Política de transparencia para los sprites
+Responsabilidades:
+- Usar alpha test o alpha-to-coverage para sprites con alpha binario (bin opaco, sin ordenar)
+- Reservar la mezcla real (bin transparente, ordenado cada frame) para lo que la necesita
+- Respetar el preset de calidad (en 'low' todo va con alpha test)
+- Contar cuántos Geoms caen en cada bin para comparar configuraciones
+"""
+
+from panda3d.core import CullBinAttrib, TransparencyAttrib
+
+from src.systems.quality import get_quality_settings
+from src.systems.sprite_atlas import get_sprite_atlas
+
+
+# Modos que mandan el nodo al bin 'transparent' (ordenado de atrás hacia adelante)
+BLENDED_MODES = (TransparencyAttrib.MAlpha, TransparencyAttrib.MPremultipliedAlpha,
+                 TransparencyAttrib.MDual)
+
+
+class TransparencyPolicy:
+    def __init__(self, base):
+        self.base = base
+        self.atlas = get_sprite_atlas(base)
+        self.quality = get_quality_settings(base)
+        # Alpha-to-coverage solo suaviza bordes si la ventana tiene multisample
+        props = base.win.getFbProperties() if base.win else None
+        self.coverage = bool(props and props.getMultisamples() > 0)
+
+    def mode(self, region, fading=False):
+        """
+        Modo para un sprite de la región dada. fading indica que el sprite
+        cambia de opacidad (fragmentos que se desvanecen, nubes) y necesita mezcla.
+        """
+        if not self.quality.value('alpha_blending'):
+            return TransparencyAttrib.MBinary
+        if fading or not self.atlas.is_binary(region):
+            return TransparencyAttrib.MAlpha
+        if self.coverage:
+            return TransparencyAttrib.MMultisample
+        return TransparencyAttrib.MBinary
+
+    def apply(self, node, region, fading=False):
+        mode = self.mode(region, fading)
+        node.setTransparency(mode)
+        return mode
+
+    # ========== DIAGNÓSTICO ==========
+
+    def bin_report(self, root=None):
+        """
+        Cuenta los Geoms visibles por bin. 'sorted' son los que el bin
+        transparente ordena por distancia en cada frame.
+        """
+        root = root if root is not None else self.base.render
+        report = {'opaque': 0, 'transparent': 0, 'fixed': 0, 'sorted': 0, 'instances': 0}
+        for np in root.findAllMatches('**/+GeomNode'):
+            if np.isHidden():
+                continue
+            geoms = np.node().getNumGeoms()
+            state = np.getNetState()
+            bin_attrib = state.getAttrib(CullBinAttrib)
+            transparency = state.getAttrib(TransparencyAttrib)
+            if bin_attrib and bin_attrib.getBinName():
+                bin_name = bin_attrib.getBinName()
+            elif transparency and transparency.getMode() in BLENDED_MODES:
+                bin_name = 'transparent'
+            else:
+                bin_name = 'opaque'
+
+            report[bin_name] = report.get(bin_name, 0) + geoms
+            if bin_name == 'transparent':
+                report['sorted'] += geoms
+            report['instances'] += geoms * max(1, np.getInstanceCount())
+        return report
+
+
+_transparency_policy = None
+
+
+def get_transparency_policy(base):
+    """Política única del proceso"""
+    global _transparency_policy
+    if _transparency_policy is None:
+        _transparency_policy = TransparencyPolicy(base)
+    return _transparency_policy
@@ -0,0 +1,113 @@
+"""
+SceneWarmup - Pasada de calentamiento antes del primer frame jugable
+Responsabilidades:
+- Instanciar una vez cada entidad y efecto fuera de pantalla (fantasma, barrera,
+  power-up, proyectil y las tres ráfagas de partículas)
+- Subir texturas, geometría y shaders con prepareScene y un par de frames en un
+  buffer offscreen chico (la ventana no muestra nada)
+- Generar de antemano los glifos del HUD y de la pantalla de game over
+- Informar cuánto tardó
+"""
+
+import string
+import time
+
+from panda3d.core import Camera, TextNode, Texture
+
+from src.entities.barrier import BreakableBarrier
+from src.entities.crystal import Crystal
+from src.entities.powerup import PowerUpObstacle
+from src.systems.fx import get_fx_engine
+
+
+# Caracteres que usan el HUD, la pausa y la pantalla de game over
+GLYPHS = (string.ascii_letters + string.digits + string.punctuation + " "
+          + "áéíóúÁÉÍÓÚñÑüÜ¡¿")
+
+
+class SceneWarmup:
+    # Lado del buffer offscreen: solo importa que se dibuje, no cómo se ve
+    BUFFER_SIZE = 64
+    # Distancia delante de la cámara a la que se arma la escena de prueba
+    DISTANCE = 12.0
+
+    def __init__(self, base):
+        self.base = base
+
+    def run(self, game):
+        """
+        Calienta la escena del juego. Devuelve los ms que tardó, o None si no
+        hay ventana (sin GSG no hay nada que subir).
+        """
+        if not self.base.win or not self.base.win.getGsg():
+            return None
+        start = time.perf_counter()
+
+        root = self.base.render.attachNewNode('warmup')
+        root.setPos(self.base.camera, 0, self.DISTANCE, 0)
+        root.setHpr(self.base.camera, 0, 0, 0)
+        # Nada de esto se registra en los colisionadores: no dispara eventos del juego
+        crystal = Crystal(self.base, (-3, 0, 0), parent=root, renderer=game.ghosts)
+        barrier = BreakableBarrier(self.base, (0, 0, -1), parent=root)
+        powerup = PowerUpObstacle(self.base, (3, 0, 0), parent=root)
+        projectile = game.projectile_pool.get()
+        if projectile is not None:
+            projectile.node.setPos(root, 0, 0, 1.5)
+            projectile.node.show()
+        self._preload_glyphs(root)
+
+        game.ghosts.update()
+        self._render()
+
+        # Segunda pasada: rotos, para compilar los shaders de partículas
+        fx = get_fx_engine(self.base)
+        crystal.break_apart()
+        barrier.break_apart()
+        powerup.destroy()
+        fx.update(0.0)
+        self._render()
+
+        fx.clear()
+        crystal.cleanup()
+        barrier.cleanup()
+        powerup.cleanup()
+        if projectile is not None:
+            projectile.deactivate()
+        root.removeNode()
+        game.ghosts.update()
+
+        elapsed = (time.perf_counter() - start) * 1000.0
+        print(f"Calentamiento de escena: {elapsed:.1f} ms")
+        return elapsed
+
+    def _preload_glyphs(self, root):
+        """Genera todos los glifos de la fuente por defecto y deja sus páginas en escena"""
+        text = TextNode('warmup_glyphs')
+        text.setText(GLYPHS)
+        glyphs = root.attachNewNode(text.generate())
+        glyphs.setPos(-4, 0, 2)
+        glyphs.setScale(0.1)
+
+    def _render(self):
+        """Prepara la escena y el HUD y dibuja desde la pose de la cámara"""
+        engine = self.base.graphicsEngine
+        gsg = self.base.win.getGsg()
+        self.base.render.prepareScene(gsg)
+        self.base.render2d.prepareScene(gsg)
+
+        buffer = self.base.win.makeTextureBuffer(
+            'warmup', self.BUFFER_SIZE, self.BUFFER_SIZE, Texture(), False)
+        if buffer is None:
+            return
+        camera = self.base.camera.attachNewNode(Camera('warmup_camera', self.base.camLens.makeCopy()))
+        buffer.makeDisplayRegion().setCamera(camera)
+
+        # Igual que el benchmark: solo se dibuja el buffer
+        self.base.win.setActive(False)
+        try:
+            engine.renderFrame()
+            engine.renderFrame()
+        finally:
+            self.base.win.setActive(True)
+            engine.removeWindow(buffer)
+            camera.removeNode()
@@ -0,0 +1,125 @@
+"""
+Script de prueba de larga duración del registro de colisionadores
+Simula una hora de partida (sin dibujar, con reloj simulado) y verifica
+que la cantidad de colisionadores vivos no crece con el tiempo
+Ejecuta: python test_collider_registry.py
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from direct.showbase.ShowBase import ShowBase
+from panda3d.core import ClockObject, loadPrcFileData, unloadPrcFile
+
+from src.systems import quality
+
+# Simulación a 10 FPS: una hora son 36000 frames
+FPS = 10
+MINUTES = 60
+
+
+class SimulatedTime:
+    """Reemplaza time.time: el juego mide cooldowns y spawns con el reloj de pared"""
+
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self):
+        return self.now
+
+
+def shoot_nearest(game, base):
+    """Dispara al primer blanco sano por delante de la cámara"""
+    cam = base.camera.getPos(base.render)
+    targets = ([c for c in game.crystals if not c.broken] + [b for b in game.barriers if not b.broken]
+               + [p for p in game.powerups if not p.destroyed])
+    for target in targets:
+        pos = target.node.getPos(base.render)
+        if pos.y > cam.y + 3:
+            direction = pos - cam
+            direction.normalize()
+            game.shoot(cam, direction)
+            return
+
+
+def test_collider_registry_soak():
+    print("=== Test de Larga Duración del Registro de Colisionadores ===\n")
+
+    # Se carga acá y no al importar: otra prueba del mismo proceso puede pedir otra ventana
+    page = loadPrcFileData('', 'window-type offscreen\nwin-size 64 64\naudio-library-name null')
+    base = ShowBase()
+    base.disableMouse()
+    # Configuración gráfica en un archivo temporal: la prueba no toca data/
+    quality._quality_settings = quality.QualitySettings(
+        base, path=os.path.join(tempfile.mkdtemp(), "graphics.json"))
+    base.show_game_over = lambda score: None
+    base.return_to_menu = lambda: None
+
+    clock = ClockObject.getGlobalClock()
+    clock_mode = clock.getMode()
+    clock.setMode(ClockObject.MForced)
+    clock.setFrameRate(FPS)
+    real_time = time.time
+    time.time = SimulatedTime()
+
+    from game import Game
+
+    try:
+        print("1. Creando la partida...")
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = Game(base)
+        game.ammo = 10 ** 6
+        game.score = 10 ** 6
+        # Sin dibujar frames: solo corren las tareas del juego
+        base.taskMgr.remove('igLoop')
+        counts = game.colliders.counts()
+        movers = 1 + len(game.projectile_pool.pool)
+        print(f"   Móviles: {counts['movers']}, blancos: {counts['targets']}")
+        assert counts['movers'] == movers, f"Deberían registrarse {movers} móviles, hay {counts['movers']}"
+
+        print(f"\n2. Simulando {MINUTES} minutos a {FPS} FPS...")
+        samples = []
+        for minute in range(1, MINUTES + 1):
+            with contextlib.redirect_stdout(io.StringIO()):
+                for frame in range(60 * FPS):
+                    time.time.now += 1.0 / FPS
+                    if frame % 5 == 0:
+                        shoot_nearest(game, base)
+                    base.taskMgr.step()
+            assert not game.game_over, f"La partida terminó en el minuto {minute}"
+
+            counts = game.colliders.counts()
+            samples.append(counts['targets'])
+            assert counts['movers'] == movers, f"Minuto {minute}: {counts['movers']} móviles"
+            assert counts['broadphase_movers'] == counts['movers'], f"Minuto {minute}: móviles desparejos {counts}"
+            assert counts['broadphase_targets'] == counts['targets'], f"Minuto {minute}: blancos desparejos {counts}"
+            assert counts['registered'] - counts['unregistered'] == counts['movers'] + counts['targets']
+            if minute % 10 == 0:
+                print(f"   Minuto {minute}: {counts['targets']} blancos vivos, "
+                      f"{counts['registered']} altas, {counts['unregistered']} bajas, "
+                      f"origen corrido {game.origin.shifts} veces")
+
+        print("\n3. Verificando que la cantidad no crece...")
+        first, last = max(samples[:10]), max(samples[-10:])
+        print(f"   Máximo de blancos: primeros 10 min = {first}, últimos 10 min = {last}")
+        assert last <= first * 1.5, f"Los blancos vivos crecieron de {first} a {last}"
+        assert game.colliders.counts()['unregistered'] > first, "No se dio de baja ningún colisionador"
+
+        print("\n4. Limpiando la partida...")
+        with contextlib.redirect_stdout(io.StringIO()):
+            game.cleanup()
+        assert game.colliders is None
+    finally:
+        time.time = real_time
+        clock.setMode(clock_mode)
+        base.destroy()
+        unloadPrcFile(page)
+
+    print("\nTodos los tests pasaron correctamente")
+
+
+if __name__ == "__main__":
+    test_collider_registry_soak()
@@ -0,0 +1,120 @@
+"""
+Script de prueba de las colisiones barridas de proyectiles
+Dispara a blancos fijos simulando 10, 20 y 60 FPS y reparte los choques en lote
+Ejecuta: python test_collisions.py
+"""
+
+import os
+import tempfile
+
+from direct.showbase.ShowBase import ShowBase
+from panda3d.core import BitMask32, CollisionNode, CollisionSphere, Point3, Vec3, loadPrcFileData, unloadPrcFile
+
+from src.entities.projectile import Projectile
+from src.systems import quality
+from src.systems.broadphase import CorridorBroadphase, sweep_sphere
+from src.systems.collision_dispatch import CollisionDispatcher
+
+
+def make_ghost(base, x, y, z=2):
+    """Colisionador como el de Crystal (esfera de radio 1, into bit 0)"""
+    node = base.render.attachNewNode(f"ghost_{x}_{y}")
+    node.setPos(x, y, z)
+    cnode = CollisionNode('crystal')
+    cnode.addSolid(CollisionSphere(0, 0, 0, 1.0))
+    cnode.setFromCollideMask(BitMask32.allOff())
+    cnode.setIntoCollideMask(BitMask32.bit(0))
+    return node.attachNewNode(cnode)
+
+
+def fire(base, fps, ghost_positions):
+    """Dispara hacia +Y desde el origen; devuelve las Y de los fantasmas golpeados"""
+    broadphase = CorridorBroadphase(base)
+    ghosts = [make_ghost(base, x, y) for x, y in ghost_positions]
+    for ghost in ghosts:
+        # La entidad del blanco es su propio colisionador
+        broadphase.add_target(ghost, ghost)
+
+    projectile = Projectile(base)
+    broadphase.add_mover(projectile.collider, lambda: projectile.prev_pos, projectile)
+
+    hits = []
+
+    def on_hit(proj, ghost):
+        hits.append(round(ghost.getParent().getY(), 3))
+        proj.deactivate()
+
+    dispatcher = CollisionDispatcher()
+    dispatcher.bind('projectile', 'crystal', on_hit)
+    projectile.launch(Point3(0, 0, 2), Vec3(0, 1, 0))
+    dt = 1.0 / fps
+    # Un segundo de vuelo: 80 unidades
+    for _ in range(fps):
+        projectile.update(dt)
+        dispatcher.push_hits(broadphase.update())
+        dispatcher.dispatch()
+        if not projectile.active:
+            break
+
+    broadphase.cleanup()
+    projectile.node.removeNode()
+    for ghost in ghosts:
+        ghost.getParent().removeNode()
+    return hits
+
+
+def test_swept_collisions():
+    print("=== Test de Colisiones Barridas ===\n")
+
+    # Se carga acá y no al importar: otra prueba del mismo proceso puede pedir otra ventana
+    page = loadPrcFileData('', 'window-type none\naudio-library-name null')
+    base = ShowBase()
+    try:
+        # Configuración gráfica en un archivo temporal: la prueba no toca data/
+        quality._quality_settings = quality.QualitySettings(
+            base, path=os.path.join(tempfile.mkdtemp(), "graphics.json"))
+
+        print("1. Probando el barrido de un segmento contra una esfera...")
+        assert sweep_sphere(Point3(0, 0, 0), Point3(0, 10, 0), Point3(0, 5, 0), 1.0) == 0.4
+        assert sweep_sphere(Point3(0, 0, 0), Point3(0, 10, 0), Point3(3, 5, 0), 1.0) is None
+        assert sweep_sphere(Point3(0, 4.5, 0), Point3(0, 10, 0), Point3(0, 5, 0), 1.0) == 0.0
+        print("   Entrada, salida y arranque adentro correctos")
+
+        for number, fps in enumerate((10, 20, 60), 2):
+            step = 80.0 / fps
+            print(f"\n{number}. Probando a {fps} FPS ({step:.1f} unidades por frame)")
+
+            hits = fire(base, fps, [(0, 20)])
+            print(f"   Fantasma de frente: {hits}")
+            assert hits == [20.0], f"A {fps} FPS debería golpear el fantasma en Y=20, golpeó {hits}"
+
+            hits = fire(base, fps, [(0, 22), (0, 20)])
+            print(f"   Dos fantasmas en fila: {hits}")
+            assert hits == [20.0], f"A {fps} FPS debería golpear solo el primero, golpeó {hits}"
+
+            hits = fire(base, fps, [(3, 20)])
+            print(f"   Fantasma corrido al costado: {hits}")
+            assert hits == [], f"A {fps} FPS no debería golpear nada, golpeó {hits}"
+
+        print("\n5. Probando que un par repetido en el mismo frame se atiende una vez...")
+        calls = []
+        dispatcher = CollisionDispatcher()
+        dispatcher.bind('projectile', 'crystal', lambda proj, ghost: calls.append((proj, ghost)))
+        assert dispatcher.push('projectile', 'p1', 'crystal', 'g1')
+        assert not dispatcher.push('projectile', 'p1', 'crystal', 'g1')
+        assert dispatcher.push('projectile', 'p2', 'crystal', 'g1')
+        assert not dispatcher.push('projectile', 'p1', 'barrier', 'g1'), "Un par sin handler no se encola"
+        assert dispatcher.dispatch() == 2
+        assert calls == [('p1', 'g1'), ('p2', 'g1')], f"Choques atendidos: {calls}"
+        # Frame siguiente: el mismo par vuelve a valer
+        assert dispatcher.push('projectile', 'p1', 'crystal', 'g1')
+        print("   Un choque por par y por frame")
+    finally:
+        base.destroy()
+        unloadPrcFile(page)
+
+    print("\nTodos los tests pasaron correctamente")
+
+
+if __name__ == "__main__":
+    test_swept_collisions()